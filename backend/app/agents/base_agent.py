@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 import json
 from config import settings
+from ..core.http_client import get_http_client
+from ..core.search_coalescer import get_search_coalescer
+from ..core.search_cache import get_search_cache
 
 class BaseResearchAgent(ABC):
     def __init__(self):
@@ -11,6 +14,26 @@ class BaseResearchAgent(ABC):
     async def research(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
         pass
 
+    async def _post_json(self, url: str, json: Dict[str, Any], timeout: float = 30.0,
+                         headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """POST a search request over the shared client, with coalescing and caching."""
+        async def fetch() -> Dict[str, Any]:
+            response = await get_http_client(url).post(url, json=json, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        
+        return await self._cached_search(url, json, fetch)
+
+    async def _cached_search(self, endpoint: str, params: Dict[str, Any],
+                             fetcher: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run a search through the singleflight coalescer and the persistent search cache."""
+        search_cache = get_search_cache()
+        if search_cache is None:
+            return await get_search_coalescer().fetch(endpoint, params, fetcher)
+        return await get_search_coalescer().fetch(
+            endpoint, params, lambda: search_cache.get_or_fetch(endpoint, params, fetcher)
+        )
+
     def _calculate_confidence(self, results: List[Any]) -> float:
         """Calculate a confidence score based on the success of research tasks."""
         successful_tasks = sum(1 for r in results if not isinstance(r, Exception) and not r.get("error"))
@@ -1,6 +1,5 @@
 from .base_agent import BaseResearchAgent
 from typing import Dict, Any
-import httpx
 import openai
 from config import settings
 
@@ -13,29 +12,26 @@ class CompetitorAnalysisAgent(BaseResearchAgent):
             # This would involve deep dives into competitor websites, financial reports, and news.
             competitor_query = f"competitive analysis {query} key competitors market positioning"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.config.TAVILY_API_KEY,
-                        "query": competitor_query,
-                        "search_depth": "advanced",
-                        "include_answer": True,
-                        "max_results": 10
-                    }
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Analyze competitive landscape using LLM
-                competitive_analysis = await self._analyze_competitive_landscape(data.get("results", []), query)
-                
-                return {
-                    "competitor_data": data,
-                    "competitive_analysis": competitive_analysis,
-                    "timestamp": "2024-01-01T00:00:00Z"
-                }
+            data = await self._post_json(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.config.TAVILY_API_KEY,
+                    "query": competitor_query,
+                    "search_depth": "advanced",
+                    "include_answer": True,
+                    "max_results": 10
+                },
+                timeout=30.0
+            )
+            
+            # Analyze competitive landscape using LLM
+            competitive_analysis = await self._analyze_competitive_landscape(data.get("results", []), query)
+            
+            return {
+                "competitor_data": data,
+                "competitive_analysis": competitive_analysis,
+                "timestamp": "2024-01-01T00:00:00Z"
+            }
                 
         except Exception as e:
             return {"error": f"Competitor analysis failed: {str(e)}"}
@@ -1,5 +1,4 @@
 import asyncio
-import httpx
 from typing import Dict, Any, List
 from datetime import datetime
 import openai
@@ -55,29 +54,26 @@ class ConsumerInsightsAgent(BaseResearchAgent):
             # Search for social media discussions
             social_query = f"social media discussions about {' '.join(keywords[:3])}"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.config.TAVILY_API_KEY,
-                        "query": social_query,
-                        "search_depth": "advanced",
-                        "include_answer": True,
-                        "max_results": 5
-                    }
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Analyze sentiment using LLM
-                sentiment_analysis = await self._analyze_social_sentiment(data.get("results", []))
-                
-                return {
-                    "social_data": data,
-                    "sentiment_analysis": sentiment_analysis,
-                    "keywords_analyzed": keywords[:3]
-                }
+            data = await self._post_json(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.config.TAVILY_API_KEY,
+                    "query": social_query,
+                    "search_depth": "advanced",
+                    "include_answer": True,
+                    "max_results": 5
+                },
+                timeout=30.0
+            )
+            
+            # Analyze sentiment using LLM
+            sentiment_analysis = await self._analyze_social_sentiment(data.get("results", []))
+            
+            return {
+                "social_data": data,
+                "sentiment_analysis": sentiment_analysis,
+                "keywords_analyzed": keywords[:3]
+            }
                 
         except Exception as e:
             return {"error": f"Social media analysis failed: {str(e)}"}
@@ -88,29 +84,26 @@ class ConsumerInsightsAgent(BaseResearchAgent):
             keywords = await self.query_parser.extract_keywords(query)
             review_query = f"product reviews {' '.join(keywords[:3])} customer feedback"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.config.TAVILY_API_KEY,
-                        "query": review_query,
-                        "search_depth": "advanced",
-                        "include_answer": True,
-                        "max_results": 7
-                    }
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Extract review insights
-                review_insights = await self._extract_review_insights(data.get("results", []))
-                
-                return {
-                    "review_data": data,
-                    "review_insights": review_insights,
-                    "review_count": len(data.get("results", []))
-                }
+            data = await self._post_json(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.config.TAVILY_API_KEY,
+                    "query": review_query,
+                    "search_depth": "advanced",
+                    "include_answer": True,
+                    "max_results": 7
+                },
+                timeout=30.0
+            )
+            
+            # Extract review insights
+            review_insights = await self._extract_review_insights(data.get("results", []))
+            
+            return {
+                "review_data": data,
+                "review_insights": review_insights,
+                "review_count": len(data.get("results", []))
+            }
                 
         except Exception as e:
             return {"error": f"Review analysis failed: {str(e)}"}
@@ -120,20 +113,17 @@ class ConsumerInsightsAgent(BaseResearchAgent):
         try:
             survey_query = f"consumer survey {' '.join(await self.query_parser.extract_keywords(query)[:3])} market research"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.config.TAVILY_API_KEY,
-                        "query": survey_query,
-                        "search_depth": "basic",
-                        "include_answer": False,
-                        "max_results": 5
-                    }
-                )
-                response.raise_for_status()
-                
-                return response.json()
+            return await self._post_json(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.config.TAVILY_API_KEY,
+                    "query": survey_query,
+                    "search_depth": "basic",
+                    "include_answer": False,
+                    "max_results": 5
+                },
+                timeout=30.0
+            )
                 
         except Exception as e:
             return {"error": f"Consumer survey search failed: {str(e)}"}
@@ -145,20 +135,17 @@ class ConsumerInsightsAgent(BaseResearchAgent):
             # For now, we'll search for behavioral insights
             behavior_query = f"consumer behavior patterns {' '.join(await self.query_parser.extract_keywords(query)[:3])}"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.config.TAVILY_API_KEY,
-                        "query": behavior_query,
-                        "search_depth": "advanced",
-                        "include_answer": True,
-                        "max_results": 5
-                    }
-                )
-                response.raise_for_status()
-                
-                return response.json()
+            return await self._post_json(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.config.TAVILY_API_KEY,
+                    "query": behavior_query,
+                    "search_depth": "advanced",
+                    "include_answer": True,
+                    "max_results": 5
+                },
+                timeout=30.0
+            )
                 
         except Exception as e:
             return {"error": f"Behavioral data analysis failed: {str(e)}"}
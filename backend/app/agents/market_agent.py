@@ -1,5 +1,4 @@
 import asyncio
-import httpx
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 import openai
@@ -7,6 +6,7 @@ import pandas as pd
 import numpy as np
 from .base_agent import BaseResearchAgent
 from ..utils.nlp import QueryParser
+from ..core.blocking_executor import run_blocking
 from config import settings
 
 # Enhanced imports for production features
@@ -75,19 +75,17 @@ class MarketResearchAgent(BaseResearchAgent):
     async def _web_search_tavily(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Perform web search using Tavily API"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.config.TAVILY_API_KEY,
-                        "query": query,
-                        "search_depth": "advanced",
-                        "include_answer": True,
-                        "max_results": 10
-                    }
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._post_json(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.config.TAVILY_API_KEY,
+                    "query": query,
+                    "search_depth": "advanced",
+                    "include_answer": True,
+                    "max_results": 10
+                },
+                timeout=30.0
+            )
         except Exception as e:
             return {"error": f"Tavily search failed: {str(e)}", "results": []}
     
@@ -98,19 +96,17 @@ class MarketResearchAgent(BaseResearchAgent):
             # For now, we'll simulate with a different query variation
             alternative_query = f"{query} market analysis 2024"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.config.TAVILY_API_KEY,
-                        "query": alternative_query,
-                        "search_depth": "basic",
-                        "include_answer": False,
-                        "max_results": 5
-                    }
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._post_json(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.config.TAVILY_API_KEY,
+                    "query": alternative_query,
+                    "search_depth": "basic",
+                    "include_answer": False,
+                    "max_results": 5
+                },
+                timeout=30.0
+            )
         except Exception as e:
             return {"error": f"Alternative search failed: {str(e)}", "results": []}
     
@@ -121,11 +117,11 @@ class MarketResearchAgent(BaseResearchAgent):
             keywords = await self.query_parser.extract_keywords(query)
             geography = context.get("geography", ["US"])
             
-            # Enhanced Google Trends analysis
-            trend_data = await self._get_enhanced_google_trends(keywords[:3], geography)
-            
-            # Enhanced news trends analysis
-            news_trends = await self._get_enhanced_news_trends(keywords, geography)
+            # Google Trends and news trends are fetched concurrently
+            trend_data, news_trends = await asyncio.gather(
+                self._get_google_trends(keywords[:3], geography),
+                self._get_news_trends(keywords, geography)
+            )
             
             # Calculate trend momentum and insights
             trend_insights = self._calculate_trend_insights(trend_data, news_trends)
@@ -167,19 +163,17 @@ class MarketResearchAgent(BaseResearchAgent):
         try:
             industry_query = f"industry report {query} market analysis"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.config.TAVILY_API_KEY,
-                        "query": industry_query,
-                        "search_depth": "advanced",
-                        "include_answer": True,
-                        "max_results": 5
-                    }
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._post_json(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.config.TAVILY_API_KEY,
+                    "query": industry_query,
+                    "search_depth": "advanced",
+                    "include_answer": True,
+                    "max_results": 5
+                },
+                timeout=30.0
+            )
         except Exception as e:
             return {"error": f"Industry reports search failed: {str(e)}", "results": []}
 
@@ -276,40 +270,21 @@ class MarketResearchAgent(BaseResearchAgent):
             # Map geography to Google Trends format
             geo_code = self._map_geography_to_trends_code(geography)
             
-            # Multiple timeframes for comprehensive analysis
+            # Multiple timeframes for comprehensive analysis, fetched concurrently off the event loop
             timeframes = ['today 12-m', 'today 3-m', 'today 1-m']
-            trend_data = {}
+            results = await asyncio.gather(*[
+                run_blocking("pytrends", self._fetch_trends_timeframe, keywords[:5], timeframe, geo_code)  # Google Trends limit
+                for timeframe in timeframes
+            ], return_exceptions=True)
             
-            for timeframe in timeframes:
-                try:
-                    self.pytrends.build_payload(
-                        keywords[:5],  # Google Trends limit
-                        cat=0,
-                        timeframe=timeframe,
-                        geo=geo_code,
-                        gprop=''
-                    )
-                    
-                    # Interest over time
-                    interest_data = self.pytrends.interest_over_time()
-                    if not interest_data.empty:
-                        trend_data[timeframe] = {
-                            "interest_over_time": interest_data.to_dict(),
-                            "momentum": self._calculate_trend_momentum(interest_data),
-                            "data_points": len(interest_data)
-                        }
-                    
-                    # Related queries
-                    try:
-                        related_queries = self.pytrends.related_queries()
-                        trend_data[timeframe]["related_queries"] = related_queries
-                    except:
-                        trend_data[timeframe]["related_queries"] = {}
-                    
-                    await asyncio.sleep(1)  # Rate limiting
-                    
-                except Exception as e:
-                    trend_data[timeframe] = {"error": str(e)}
+            trend_data = {}
+            for timeframe, result in zip(timeframes, results):
+                if isinstance(result, asyncio.TimeoutError):
+                    trend_data[timeframe] = {"error": "Google Trends request timed out"}
+                elif isinstance(result, Exception):
+                    trend_data[timeframe] = {"error": str(result)}
+                elif result:
+                    trend_data[timeframe] = result
             
             return {
                 "trend_data": trend_data,
@@ -320,6 +295,30 @@ class MarketResearchAgent(BaseResearchAgent):
         except Exception as e:
             return {"error": f"Google Trends analysis failed: {str(e)}"}
 
+    def _fetch_trends_timeframe(self, keywords: List[str], timeframe: str, geo_code: str) -> Dict[str, Any]:
+        """Blocking Google Trends fetch for one timeframe (runs in the blocking I/O executor)"""
+        # TrendReq keeps per-payload state, so each concurrent timeframe gets its own client
+        pytrends = TrendReq(hl='en-US', tz=360, timeout=(10,25), retries=2, backoff_factor=0.1)
+        pytrends.build_payload(keywords, cat=0, timeframe=timeframe, geo=geo_code, gprop='')
+        
+        # Interest over time
+        interest_data = pytrends.interest_over_time()
+        if interest_data.empty:
+            return {}
+        
+        # Related queries
+        try:
+            related_queries = pytrends.related_queries()
+        except Exception:
+            related_queries = {}
+        
+        return {
+            "interest_over_time": interest_data.to_dict(),
+            "momentum": self._calculate_trend_momentum(interest_data),
+            "data_points": len(interest_data),
+            "related_queries": related_queries
+        }
+
     async def _get_news_trends(self, keywords: List[str], geography: List[str]) -> Dict[str, Any]:
         """Enhanced news analysis using NewsAPI"""
         if not self.news_client or not NEWSAPI_AVAILABLE:
@@ -333,21 +332,27 @@ class MarketResearchAgent(BaseResearchAgent):
                 {"domains": "reuters.com,bloomberg.com,wsj.com", "q": keywords[0], "language": "en"}
             ]
             
-            all_articles = []
-            for search_params in news_searches:
-                try:
-                    response = self.news_client.get_everything(
+            # Cached on the search itself; the rolling 30-day date range is not part of the key
+            responses = await asyncio.gather(*[
+                self._cached_search(
+                    "https://newsapi.org/v2/everything",
+                    {**search_params, "window_days": 30, "page_size": 20},
+                    lambda search_params=search_params: run_blocking(
+                        "newsapi",
+                        self.news_client.get_everything,
                         **search_params,
                         from_param=(datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),
                         to=datetime.now().strftime('%Y-%m-%d'),
                         page_size=20
                     )
-                    
-                    if response['status'] == 'ok':
-                        all_articles.extend(response['articles'])
-                        
-                except Exception as e:
-                    continue
+                )
+                for search_params in news_searches
+            ], return_exceptions=True)
+            
+            all_articles = []
+            for response in responses:
+                if isinstance(response, dict) and response.get('status') == 'ok':
+                    all_articles.extend(response['articles'])
             
             # Process articles for insights
             processed_articles = self._process_news_articles(all_articles)
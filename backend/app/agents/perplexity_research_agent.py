@@ -1,5 +1,4 @@
 import asyncio
-import httpx
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
@@ -64,38 +63,35 @@ class PerplexityResearchAgent(BaseResearchAgent):
             # Customize search parameters based on context
             search_params = self._build_search_parameters(query, context, search_type)
             
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": model,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": self._get_system_prompt(search_type, context)
-                            },
-                            {
-                                "role": "user", 
-                                "content": search_params["enhanced_query"]
-                            }
-                        ],
-                        "temperature": search_params.get("temperature", 0.2),
-                        "max_tokens": search_params.get("max_tokens", 2000),
-                        "search_domain_filter": search_params.get("domain_filter", []),
-                        "search_recency_filter": search_params.get("recency_filter", "month"),
-                        "return_related_questions": True,
-                        "return_citations": True
-                    }
-                )
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                return self._process_perplexity_response(result, search_type)
+            result = await self._post_json(
+                f"{self.base_url}/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": model,
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": self._get_system_prompt(search_type, context)
+                        },
+                        {
+                            "role": "user", 
+                            "content": search_params["enhanced_query"]
+                        }
+                    ],
+                    "temperature": search_params.get("temperature", 0.2),
+                    "max_tokens": search_params.get("max_tokens", 2000),
+                    "search_domain_filter": search_params.get("domain_filter", []),
+                    "search_recency_filter": search_params.get("recency_filter", "month"),
+                    "return_related_questions": True,
+                    "return_citations": True
+                },
+                timeout=120.0
+            )
+            
+            return self._process_perplexity_response(result, search_type)
                 
         except Exception as e:
             return {"error": f"Perplexity {search_type} search failed: {str(e)}"}
@@ -1,6 +1,5 @@
 from .base_agent import BaseResearchAgent
 from typing import Dict, Any
-import httpx
 import openai
 from config import settings
 
@@ -13,29 +12,26 @@ class PricingResearchAgent(BaseResearchAgent):
             # This would involve scraping competitor pricing pages and analyzing market data.
             pricing_query = f"pricing strategies {query} pricing models market pricing analysis"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.config.TAVILY_API_KEY,
-                        "query": pricing_query,
-                        "search_depth": "advanced",
-                        "include_answer": True,
-                        "max_results": 8
-                    }
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Analyze pricing using LLM
-                pricing_analysis = await self._analyze_pricing_strategies(data.get("results", []), query)
-                
-                return {
-                    "pricing_data": data,
-                    "pricing_analysis": pricing_analysis,
-                    "timestamp": "2024-01-01T00:00:00Z"
-                }
+            data = await self._post_json(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.config.TAVILY_API_KEY,
+                    "query": pricing_query,
+                    "search_depth": "advanced",
+                    "include_answer": True,
+                    "max_results": 8
+                },
+                timeout=30.0
+            )
+            
+            # Analyze pricing using LLM
+            pricing_analysis = await self._analyze_pricing_strategies(data.get("results", []), query)
+            
+            return {
+                "pricing_data": data,
+                "pricing_analysis": pricing_analysis,
+                "timestamp": "2024-01-01T00:00:00Z"
+            }
                 
         except Exception as e:
             return {"error": f"Pricing research failed: {str(e)}"}
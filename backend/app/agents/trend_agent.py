@@ -1,6 +1,5 @@
 from .base_agent import BaseResearchAgent
 from typing import Dict, Any
-import httpx
 import openai
 from config import settings
 
@@ -13,29 +12,26 @@ class TrendAnalysisAgent(BaseResearchAgent):
             # This would use tools like Google Trends, industry reports, and news analysis.
             trend_query = f"emerging trends {query} market technology innovation 2024"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.config.TAVILY_API_KEY,
-                        "query": trend_query,
-                        "search_depth": "advanced",
-                        "include_answer": True,
-                        "max_results": 8
-                    }
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Analyze trends using LLM
-                trend_analysis = await self._analyze_trends(data.get("results", []), query)
-                
-                return {
-                    "trend_data": data,
-                    "trend_analysis": trend_analysis,
-                    "timestamp": "2024-01-01T00:00:00Z"
-                }
+            data = await self._post_json(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.config.TAVILY_API_KEY,
+                    "query": trend_query,
+                    "search_depth": "advanced",
+                    "include_answer": True,
+                    "max_results": 8
+                },
+                timeout=30.0
+            )
+            
+            # Analyze trends using LLM
+            trend_analysis = await self._analyze_trends(data.get("results", []), query)
+            
+            return {
+                "trend_data": data,
+                "trend_analysis": trend_analysis,
+                "timestamp": "2024-01-01T00:00:00Z"
+            }
                 
         except Exception as e:
             return {"error": f"Trend analysis failed: {str(e)}"}
@@ -28,7 +28,9 @@ async def comprehensive_hierarchical_analysis(request: Dict[str, Any]) -> Dict[s
         results = await workflow.execute(
             idea_description=idea_description,
             target_audience=target_audience,
-            additional_context=additional_context
+            additional_context=additional_context,
+            resume_from=request.get('resume_from'),  # analysis_id of an interrupted run
+            incremental_from=request.get('incremental_from')  # analysis_id of a run to re-analyze incrementally
         )
         
         # Convert flat results to hierarchical structure
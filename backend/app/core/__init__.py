@@ -1,8 +1,27 @@
 # Core module for Validatus Platform
+# Exports resolve on first access, so light submodules (e.g. display_hierarchy) import
+# without pulling in the LLM provider SDKs
 
-from .multi_llm_orchestrator import MultiLLMOrchestrator, ConsensusMethod
+from importlib import import_module
 
-__all__ = [
-    "MultiLLMOrchestrator", 
-    "ConsensusMethod"
-]
+_EXPORTS = {
+    "MultiLLMOrchestrator": ".multi_llm_orchestrator",
+    "ConsensusMethod": ".multi_llm_orchestrator",
+    "get_shared_llm_orchestrator": ".multi_llm_orchestrator",
+    "LayerHierarchyIndex": ".layer_index",
+    "LayerInfo": ".layer_index",
+    "get_layer_index": ".layer_index",
+    "ScoreRollupEngine": ".score_rollup",
+    "get_score_rollup_engine": ".score_rollup",
+    "LayerScoreStore": ".score_store",
+    "LayerFingerprinter": ".layer_fingerprint"
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
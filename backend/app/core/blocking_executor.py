@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Bounded thread pool for blocking third-party clients (pytrends, NewsAPI)
+Keeps synchronous network calls off the event loop, with per-source timeouts
+"""
+
+import asyncio
+import logging
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional
+
+from config import settings
+
+logger = logging.getLogger("research.blocking_executor")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_stats = {"calls": 0, "timeouts": 0, "errors": 0}
+
+def _source_timeout(source: str) -> float:
+    timeouts = {
+        "pytrends": settings.PYTRENDS_TIMEOUT,
+        "newsapi": settings.NEWSAPI_TIMEOUT,
+    }
+    return timeouts.get(source, settings.BLOCKING_IO_DEFAULT_TIMEOUT)
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """Get the process-wide, size-limited executor for blocking I/O"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.BLOCKING_IO_MAX_WORKERS),
+                    thread_name_prefix="blocking-io"
+                )
+                logger.info(f"✅ Blocking I/O executor started with {settings.BLOCKING_IO_MAX_WORKERS} workers")
+    return _executor
+
+async def run_blocking(source: str, func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking call in the shared executor and wait at most the source's timeout.
+    A timed-out call keeps its worker until it returns; the pool size bounds the damage.
+    """
+    loop = asyncio.get_running_loop()
+    _stats["calls"] += 1
+    try:
+        return await asyncio.wait_for(
+            loop.run_in_executor(get_blocking_executor(), functools.partial(func, *args, **kwargs)),
+            timeout=_source_timeout(source)
+        )
+    except asyncio.TimeoutError:
+        _stats["timeouts"] += 1
+        logger.warning(f"⏱️ {source} call timed out after {_source_timeout(source)}s")
+        raise
+    except Exception:
+        _stats["errors"] += 1
+        raise
+
+def get_blocking_executor_stats() -> Dict[str, Any]:
+    return {"max_workers": settings.BLOCKING_IO_MAX_WORKERS, **_stats}
+
+def shutdown_blocking_executor():
+    """Stop accepting work and release idle workers (application shutdown)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
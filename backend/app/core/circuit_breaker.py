@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Circuit breakers for LLM providers
+A provider's circuit opens after consecutive failures, skips it instantly while open,
+and lets a single probe request through after a cool-down (half-open)
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Any
+
+from config import settings
+
+logger = logging.getLogger("llm.circuit_breaker")
+
+class CircuitBreaker:
+    """Closed → open after N consecutive failures → half-open probe after the cool-down"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.skipped_requests = 0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now; in half-open state only one probe is admitted"""
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                logger.info(f"🔌 Circuit for {self.name} half-open, probing")
+
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return True
+
+            self.skipped_requests += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"✅ Circuit for {self.name} closed")
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"🚫 Circuit for {self.name} opened after {self.consecutive_failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """Release a probe slot without an outcome (e.g. the request was cancelled)"""
+        with self._lock:
+            self.probe_in_flight = False
+
+    def get_state(self) -> Dict[str, Any]:
+        with self._lock:
+            retry_in = 0.0
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "skipped_requests": self.skipped_requests,
+                "retry_in_seconds": round(retry_in, 1)
+            }
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Get the process-wide breaker for a provider, shared by all concurrent analyses"""
+    with _breakers_lock:
+        if provider not in _breakers:
+            _breakers[provider] = CircuitBreaker(
+                provider,
+                failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=settings.LLM_CIRCUIT_RESET_TIMEOUT
+            )
+        return _breakers[provider]
+
+def get_circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    return {provider: breaker.get_state() for provider, breaker in _breakers.items()}
@@ -5,16 +5,22 @@ Implements all 156+ layers with deterministic scoring and missing methods
 """
 
 import os
+import copy
 import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 import asyncio
+import threading
+import numpy as np
 
-from app.core.multi_llm_orchestrator import MultiLLMOrchestrator
+from app.core.multi_llm_orchestrator import MultiLLMOrchestrator, get_shared_llm_orchestrator
 from app.core.specialized_agents import get_specialized_agent_orchestrator, AnalysisDomain
+from app.core.layer_index import ANALYTICAL_FRAMEWORK_STRUCTURE, LAYER_INDEX, LayerType
+from app.core.score_rollup import LevelRollup, get_score_rollup_engine
+from app.core.score_store import LayerScore, FactorScore, SegmentScore
 
 logger = logging.getLogger(__name__)
 
@@ -26,14 +32,6 @@ class StrategicDimension(Enum):
     BRAND = "brand"
     EXPERIENCE = "experience"
 
-class LayerType(Enum):
-    """Types of analysis layers"""
-    CONSUMER_INSIGHTS = "consumer_insights"
-    MARKET_RESEARCH = "market_research"
-    COMPETITOR_ANALYSIS = "competitor_analysis"
-    TREND_ANALYSIS = "trend_analysis"
-    PRICING_RESEARCH = "pricing_research"
-
 @dataclass
 class SourceAttribution:
     """Source attribution for deterministic scoring"""
@@ -56,215 +54,22 @@ class SourceAttribution:
             "sample_size": self.sample_size
         }
 
-@dataclass
-class LayerScore:
-    """Individual layer score with source attribution"""
-    layer_name: str
-    layer_type: LayerType
-    score: float  # 1-10 scale
-    rationale: str
-    sources: List[SourceAttribution]
-    confidence: float
-    timestamp: datetime = field(default_factory=datetime.now)
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "layer_name": self.layer_name,
-            "layer_type": self.layer_type.value,
-            "score": self.score,
-            "rationale": self.rationale,
-            "sources": [source.to_dict() for source in self.sources],
-            "confidence": self.confidence,
-            "timestamp": self.timestamp.isoformat(),
-            "metadata": self.metadata
-        }
-
-@dataclass
-class FactorScore:
-    """Factor score calculated from layer scores"""
-    factor_name: str
-    factor_type: str
-    score: float  # 1-10 scale
-    contributing_layers: List[str]
-    layer_scores: List[LayerScore]
-    calculation_method: str
-    rationale: str
-    confidence: float
-    timestamp: datetime = field(default_factory=datetime.now)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "factor_name": self.factor_name,
-            "factor_type": self.factor_type,
-            "score": self.score,
-            "contributing_layers": self.contributing_layers,
-            "calculation_method": self.calculation_method,
-            "rationale": self.rationale,
-            "confidence": self.confidence,
-            "timestamp": self.timestamp.isoformat()
-        }
-
-@dataclass
-class SegmentScore:
-    """Segment score calculated from factor scores"""
-    segment_name: str
-    segment_type: StrategicDimension
-    score: float  # 1-10 scale
-    contributing_factors: List[str]
-    factor_scores: List[FactorScore]
-    calculation_method: str
-    rationale: str
-    confidence: float
-    timestamp: datetime = field(default_factory=datetime.now)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "segment_name": self.segment_name,
-            "segment_type": self.segment_type.value,
-            "score": self.score,
-            "contributing_factors": self.contributing_factors,
-            "calculation_method": self.calculation_method,
-            "rationale": self.rationale,
-            "confidence": self.confidence,
-            "timestamp": self.timestamp.isoformat()
-        }
-
 class ComprehensiveAnalyticalFramework:
     """
     Comprehensive analytical framework implementing all 156+ layers from hierarchical diagrams
     """
     
     def __init__(self):
-        self.analytical_framework = {
-            "CONSUMER": {
-                "factors": {
-                    "Consumer Demand & Need": [
-                        "need_perception", "trust_level", "purchase_intent", "emotional_pull", "awareness",
-                        "social_influence", "accessibility", "value_perception", "trend_alignment", "price_sensitivity"
-                    ],
-                    "Consumer Behavior & Habits": [
-                        "usage_frequency", "engagement_level", "habit_formation", "emotional_tie", "ease_of_access",
-                        "trust_in_usage", "interaction_rate", "perceived_value", "social_engagement", "incentives"
-                    ],
-                    "Consumer Loyalty & Retention": [
-                        "repeat_purchase", "trust_level_retention", "value_perception_loyalty", "advocacy", "social_loyalty",
-                        "emotional_bond", "switching_cost", "engagement_loyalty", "rewards", "access_loyalty"
-                    ],
-                    "Consumer Perception & Sentiment": [
-                        "sentiment", "quality_perception", "value_perception_sentiment", "innovation_perception", "trend_alignment_sentiment",
-                        "trust_perception", "prestige", "social_impact", "awareness_sentiment", "access_perception"
-                    ],
-                    "Consumer Adoption & Engagement": [
-                        "adoption_rate", "trust_in_adoption", "value_perception_adoption", "frequency", "trend_alignment_adoption",
-                        "engagement_adoption", "social_influence_adoption", "emotional_pull_adoption", "accessibility_adoption", "incentives_adoption"
-                    ]
-                },
-                "agent": "consumer_insights"
-            },
-            "MARKET": {
-                "factors": {
-                    "market_trends": [
-                        "future_trends", "technological_shifts", "current_trends", "cultural_shift", "regulatory_shifts"
-                    ],
-                    "Market Competition and Barriers": [
-                        "rival_strength", "entry_barriers", "differentiation_advantage", "customer_switching_costs", "regulatory_barriers"
-                    ],
-                    "Market Demand and Adoption": [
-                        "demand_volume", "demand_growth", "adoption_rate", "price_elasticity", "market_accessibility"
-                    ],
-                    "Market Growth and Expansion": [
-                        "growth_potential", "regional_growth", "scalability_capacity", "investment_in_growth", "infrastructure_support"
-                    ],
-                    "Market Stability and Risk": [
-                        "economic_stability", "political_stability", "supply_chain_stability", "risk_exposure", "regulatory_stability"
-                    ]
-                },
-                "agent": "market_research"
-            },
-            "PRODUCT": {
-                "factors": {
-                    "Product Market Readiness": [
-                        "entry_timing", "mid_cycle_impact", "market_saturation"
-                    ],
-                    "Product Competitive Disruption": [
-                        "base_disruption", "incumbent_resistance", "response_time"
-                    ],
-                    "Product Dynamic Disruption": [
-                        "base_disruption_dynamic", "product_strength", "awareness_width", "value_perception_dynamic", 
-                        "adoption_growth", "error_perception", "retention_effect", "competitor_pull", "value_consistency"
-                    ],
-                    "Product Business Resilience": [
-                        "profit_resilience", "expansion_growth"
-                    ],
-                    "Product Hype Cycle": [
-                        "mid_cycle_buzz", "market_saturation_hype", "entry_timing_hype"
-                    ],
-                    "Product Quality Assurance": [
-                        "material_quality", "functional_quality", "brand_trust", "complaint_rate", "social_verdict"
-                    ],
-                    "Product Differentiation": [
-                        "tech_features", "competitor_strength"
-                    ],
-                    "Product Brand Perception": [
-                        "ad_reach", "organic_buzz"
-                    ],
-                    "Product Experience Design": [
-                        "visual_appeal", "haptic_feedback", "olfactory_appeal"
-                    ],
-                    "Product Innovation Lifecycle": [
-                        "market_fit", "entry_barrier", "tech_gap"
-                    ]
-                },
-                "agent": "product_strategist"
-            },
-            "BRAND": {
-                "factors": {
-                    "Brand Positioning Strategy": [
-                        "heritage_legacy", "innovation_edge", "public_perception", "exclusivity_factor", "competitor_edge"
-                    ],
-                    "Brand Equity Profile": [
-                        "review_score", "social_sentiment", "legacy_trust", "ai_driven_trust", "crisis_handling"
-                    ],
-                    "Brand Virality Impact": [
-                        "shareability_rate", "influencer_push", "platform_fit", "cultural_embed"
-                    ],
-                    "Brand Monetization Model": [
-                        "direct_sales", "licensing_deals", "pricing_power", "revenue_diversification"
-                    ],
-                    "Brand Longevity Outlook": [
-                        "evolution_adapt", "generational_appeal", "resilience_factor", "esg_adaptation", "cultural_relevance"
-                    ]
-                },
-                "agent": "brand_strategist"
-            },
-            "EXPERIENCE": {
-                "factors": {
-                    "User Engagement Metrics": [
-                        "attention_focus", "interaction_rate", "community_activity", "emotional_pull", "user_flow"
-                    ],
-                    "Satisfaction Feedback": [
-                        "value_perception", "sentiment_feedback", "support_quality", "expectation_match"
-                    ],
-                    "Interaction Design Elements": [
-                        "usability_ease", "intuitive_design", "sensory_appeal", "personalization", "access_inclusivity"
-                    ],
-                    "Post-Purchase Loyalty": [
-                        "repeat_usage", "emotional_bond", "practical_retention", "advocacy_power", "incentive_reward"
-                    ],
-                    "Experience Evolution": [
-                        "feature_updates", "trend_alignment", "cognitive_shift", "ai_adaptation"
-                    ]
-                },
-                "agent": "ux_strategist"
-            }
-        }
+        self.analytical_framework = copy.deepcopy(ANALYTICAL_FRAMEWORK_STRUCTURE)
         
         # Initialize specialized agent orchestrator
         self.agent_orchestrator = get_specialized_agent_orchestrator()
         
-        # Initialize LLM orchestrator
-        self.llm_orchestrator = MultiLLMOrchestrator()
+        # Share the process-wide LLM orchestrator
+        self.llm_orchestrator = get_shared_llm_orchestrator()
+        
+        # Vectorized factor/segment rollups over the shared layer index
+        self.rollup_engine = get_score_rollup_engine()
 
     async def analyze_layer(self, layer_name: str, idea_description: str, 
                            target_audience: str, context: Dict[str, Any]) -> LayerScore:
@@ -290,65 +95,89 @@ class ComprehensiveAnalyticalFramework:
             # Analyze the layer
             analysis_result = await agent.analyze_layer(layer_name, idea_description, target_audience, context)
             
-            if not analysis_result:
-                logger.error(f"❌ Analysis failed for {layer_name}")
-                return LayerScore(
-                    layer_name=layer_name,
-                    layer_type=self._get_layer_type(layer_name),
-                    score=5.0,
-                    rationale=f"Analysis failed for {layer_name}",
-                    sources=[],
-                    confidence=0.3
-                )
-            
-            # Extract score and rationale from the analysis
-            score = self._extract_score_from_analysis(analysis_result)
-            rationale = self._extract_rationale_from_analysis(analysis_result)
-            
-            # Create source attribution
-            sources = self._create_source_attribution(analysis_result, context)
-            
-            # Create layer score
-            layer_score = LayerScore(
-                layer_name=layer_name,
-                layer_type=self._get_layer_type(layer_name),
-                score=score,
-                rationale=rationale,
-                sources=sources,
-                confidence=0.8  # Default confidence for specialized analysis
-            )
-            
-            logger.info(f"✅ Layer {layer_name} analyzed: {score}/10")
-            return layer_score
+            return self._build_layer_score(layer_name, analysis_result, context)
             
         except Exception as e:
             logger.error(f"❌ Error analyzing {layer_name}: {str(e)}")
-            # Return a default score on error
+            return self._error_layer_score(layer_name, e)
+
+    async def analyze_layers_batch(self, layer_names: List[str], idea_description: str,
+                                   target_audience: str, context: Dict[str, Any]) -> Dict[str, LayerScore]:
+        """Analyze several layers, sending each specialized agent's share as one batched prompt"""
+        agent_groups: Dict[Any, List[str]] = {}
+        for layer_name in layer_names:
+            agent = self.agent_orchestrator.get_optimal_agent(layer_name)
+            agent_groups.setdefault(agent, []).append(layer_name)
+        
+        async def analyze_group(agent, group: List[str]) -> Dict[str, LayerScore]:
+            if not agent:
+                return {layer: await self.analyze_layer(layer, idea_description, target_audience, context) for layer in group}
+            try:
+                logger.info(f"🔍 Analyzing {len(group)} layers in one batch: {', '.join(group)}")
+                analysis_results = await agent.analyze_layers_batch(group, idea_description, target_audience, context)
+                return {
+                    layer: self._build_layer_score(layer, analysis_results.get(layer), context)
+                    for layer in group
+                }
+            except Exception as e:
+                logger.error(f"❌ Error analyzing batch {group}: {str(e)}")
+                return {layer: self._error_layer_score(layer, e) for layer in group}
+        
+        layer_scores: Dict[str, LayerScore] = {}
+        for group_scores in await asyncio.gather(*[analyze_group(agent, group) for agent, group in agent_groups.items()]):
+            layer_scores.update(group_scores)
+        return layer_scores
+
+    def _build_layer_score(self, layer_name: str, analysis_result: Optional[Dict[str, Any]],
+                           context: Dict[str, Any]) -> LayerScore:
+        """Turn a specialized agent's analysis result into a LayerScore"""
+        if not analysis_result:
+            logger.error(f"❌ Analysis failed for {layer_name}")
             return LayerScore(
                 layer_name=layer_name,
                 layer_type=self._get_layer_type(layer_name),
                 score=5.0,
-                rationale=f"Error during analysis: {str(e)}",
+                rationale=f"Analysis failed for {layer_name}",
                 sources=[],
-                confidence=0.2
+                confidence=0.3,
+                metadata={"analysis_failed": True}
             )
+        
+        # Extract score and rationale from the analysis
+        score = self._extract_score_from_analysis(analysis_result)
+        rationale = self._extract_rationale_from_analysis(analysis_result)
+        
+        # Create source attribution
+        sources = self._create_source_attribution(analysis_result, context)
+        
+        # Create layer score
+        layer_score = LayerScore(
+            layer_name=layer_name,
+            layer_type=self._get_layer_type(layer_name),
+            score=score,
+            rationale=rationale,
+            sources=sources,
+            confidence=0.8  # Default confidence for specialized analysis
+        )
+        
+        logger.info(f"✅ Layer {layer_name} analyzed: {score}/10")
+        return layer_score
+
+    def _error_layer_score(self, layer_name: str, error: Exception) -> LayerScore:
+        """Default score returned when a layer analysis raises"""
+        return LayerScore(
+            layer_name=layer_name,
+            layer_type=self._get_layer_type(layer_name),
+            score=5.0,
+            rationale=f"Error during analysis: {str(error)}",
+            sources=[],
+            confidence=0.2,
+            metadata={"analysis_failed": True}
+        )
 
     def _get_layer_type(self, layer_name: str) -> LayerType:
         """Determine layer type from layer name"""
-        layer_lower = layer_name.lower()
-        
-        if any(term in layer_lower for term in ['consumer', 'need', 'purchase', 'loyalty', 'sentiment']):
-            return LayerType.CONSUMER_INSIGHTS
-        elif any(term in layer_lower for term in ['market', 'trend', 'competition', 'growth']):
-            return LayerType.MARKET_RESEARCH
-        elif any(term in layer_lower for term in ['competitor', 'rival', 'market_share']):
-            return LayerType.COMPETITOR_ANALYSIS
-        elif any(term in layer_lower for term in ['trend', 'innovation', 'technology']):
-            return LayerType.TREND_ANALYSIS
-        elif any(term in layer_lower for term in ['pricing', 'cost', 'value']):
-            return LayerType.PRICING_RESEARCH
-        else:
-            return LayerType.CONSUMER_INSIGHTS  # Default
+        return LAYER_INDEX.layer_type(layer_name)
 
     def _extract_score_from_analysis(self, analysis_result: Dict[str, Any]) -> float:
         """Extract score from analysis result"""
@@ -479,7 +308,11 @@ class ComprehensiveAnalyticalFramework:
             score = sum(layer.score for layer in layer_scores) / len(layer_scores)
             confidence = sum(layer.confidence for layer in layer_scores) / len(layer_scores)
         
-        # Generate rationale
+        return self._build_factor_score(factor_name, layer_scores, calculation_method, score, confidence)
+
+    def _build_factor_score(self, factor_name: str, layer_scores: List[LayerScore], calculation_method: str,
+                            score: float, confidence: float) -> FactorScore:
+        """Create a FactorScore with its rationale from a computed score"""
         contributing_layers = [layer.layer_name for layer in layer_scores]
         rationale = f"Factor score {score:.1f}/10 calculated from {len(layer_scores)} layers using {calculation_method}. Contributing layers: {', '.join(contributing_layers)}"
         
@@ -525,7 +358,11 @@ class ComprehensiveAnalyticalFramework:
             score = sum(factor.score for factor in factor_scores) / len(factor_scores)
             confidence = sum(factor.confidence for factor in factor_scores) / len(factor_scores)
         
-        # Generate rationale
+        return self._build_segment_score(segment_name, factor_scores, calculation_method, score, confidence)
+
+    def _build_segment_score(self, segment_name: str, factor_scores: List[FactorScore], calculation_method: str,
+                             score: float, confidence: float) -> SegmentScore:
+        """Create a SegmentScore with its rationale from a computed score"""
         contributing_factors = [factor.factor_name for factor in factor_scores]
         rationale = f"Segment score {score:.1f}/10 calculated from {len(factor_scores)} factors using {calculation_method}. Contributing factors: {', '.join(contributing_factors)}"
         
@@ -552,44 +389,46 @@ class ComprehensiveAnalyticalFramework:
         return segment_mapping.get(segment_name, StrategicDimension.CONSUMER)
 
     # ADDING THE MISSING METHODS THAT THE WORKFLOW NEEDS
-    async def calculate_all_factors(self, layer_scores: Dict[str, LayerScore]) -> Dict[str, FactorScore]:
-        """Calculate all factor scores from layer scores"""
-        factor_scores = {}
+    async def calculate_all_factors(self, layer_scores: Dict[str, LayerScore],
+                                    calculation_method: str = "weighted_average") -> Dict[str, FactorScore]:
+        """Calculate all factor scores from layer scores in one vectorized rollup"""
+        engine = self.rollup_engine
+        factors = engine.rollup_factors(*engine.layer_arrays(layer_scores), method=calculation_method)
         
-        # Group layers by segment and factor
-        for segment_name, segment_data in self.analytical_framework.items():
-            for factor_name, layers in segment_data["factors"].items():
-                # Get layer scores for this factor
-                factor_layer_scores = []
-                for layer in layers:
-                    if layer in layer_scores:
-                        factor_layer_scores.append(layer_scores[layer])
-                
-                if factor_layer_scores:
-                    # Calculate factor score
-                    factor_score = self.calculate_factor_score(factor_name, factor_layer_scores)
-                    factor_scores[f"{segment_name}_{factor_name}"] = factor_score
+        factor_scores = {}
+        for i in map(int, np.flatnonzero(factors.present)):
+            segment_name, factor_name = engine.factor_keys[i]
+            factor_layer_scores = [layer_scores[layer] for layer in LAYER_INDEX.factor_layers(segment_name, factor_name)
+                                   if layer in layer_scores]
+            factor_scores[f"{segment_name}_{factor_name}"] = self._build_factor_score(
+                factor_name, factor_layer_scores, calculation_method,
+                float(factors.scores[i]), float(factors.confidences[i])
+            )
         
         return factor_scores
 
     async def calculate_all_segments(self, layer_scores: Dict[str, LayerScore], 
-                                   factor_scores: Dict[str, FactorScore]) -> Dict[str, SegmentScore]:
-        """Calculate all segment scores from factor scores"""
-        segment_scores = {}
+                                   factor_scores: Dict[str, FactorScore],
+                                   calculation_method: str = "weighted_average") -> Dict[str, SegmentScore]:
+        """Calculate all segment scores from factor scores in one vectorized rollup"""
+        engine = self.rollup_engine
+        factor_list = [factor_scores.get(name) for name in engine.factor_names]
+        factors = LevelRollup(
+            scores=np.array([factor.score if factor else 0.0 for factor in factor_list]),
+            confidences=np.array([factor.confidence if factor else 0.0 for factor in factor_list]),
+            counts=np.array([1 if factor else 0 for factor in factor_list])
+        )
+        segments = engine.rollup_segments(factors, method=calculation_method)
         
-        # Group factors by segment
-        for segment_name, segment_data in self.analytical_framework.items():
-            segment_factor_scores = []
-            
-            for factor_name in segment_data["factors"].keys():
-                factor_key = f"{segment_name}_{factor_name}"
-                if factor_key in factor_scores:
-                    segment_factor_scores.append(factor_scores[factor_key])
-            
-            if segment_factor_scores:
-                # Calculate segment score
-                segment_score = self.calculate_segment_score(segment_name, segment_factor_scores)
-                segment_scores[segment_name] = segment_score
+        segment_scores = {}
+        for i in map(int, np.flatnonzero(segments.present)):
+            segment_name = engine.segment_names[i]
+            segment_factor_scores = [factor for factor, segment in zip(factor_list, engine.factor_segment)
+                                     if factor and segment == i]
+            segment_scores[segment_name] = self._build_segment_score(
+                segment_name, segment_factor_scores, calculation_method,
+                float(segments.scores[i]), float(segments.confidences[i])
+            )
         
         return segment_scores
 
@@ -770,3 +609,16 @@ def product(iterable):
     for item in iterable:
         result *= item
     return result
+
+# Process-wide framework instance shared by workflows and agents
+_shared_framework: Optional[ComprehensiveAnalyticalFramework] = None
+_shared_framework_lock = threading.Lock()
+
+def get_comprehensive_analytical_framework() -> ComprehensiveAnalyticalFramework:
+    """Get the shared ComprehensiveAnalyticalFramework, creating it on first use"""
+    global _shared_framework
+    if _shared_framework is None:
+        with _shared_framework_lock:
+            if _shared_framework is None:
+                _shared_framework = ComprehensiveAnalyticalFramework()
+    return _shared_framework
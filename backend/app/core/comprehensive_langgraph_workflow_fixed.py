@@ -9,18 +9,37 @@ import sys
 import asyncio
 import logging
 import json
-from typing import Dict, List, Any, TypedDict, Optional
+from typing import Dict, List, Any, Set, TypedDict, Optional
 from langgraph.graph import StateGraph, END
 from datetime import datetime
 from dataclasses import dataclass
 
 from app.core.comprehensive_analytical_framework_fixed import (
-    ComprehensiveAnalyticalFramework, LayerScore, FactorScore, SegmentScore
+    ComprehensiveAnalyticalFramework, LayerScore, FactorScore, SegmentScore,
+    get_comprehensive_analytical_framework
 )
+from app.core.score_store import LayerScoreStore
+from app.core.workflow_checkpoint import get_checkpoint_store, new_analysis_id
+from app.core.layer_fingerprint import LayerFingerprinter
+from app.core.search_coalescer import search_run_scope
+from app.core.layer_index import LAYER_INDEX
+from app.core.display_hierarchy import build_hierarchical_analysis, should_map_layer_to_factor
 from app.core.simple_state import State as AppState
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+SEGMENT_ORDER = ["CONSUMER", "MARKET", "PRODUCT", "BRAND", "EXPERIENCE"]
+
+# Layer-name keys whose context summaries each segment's prompts receive as insights
+# (CONSUMER layers receive every summary as previous_insights; other segments use EXPERIENCE's keys)
+SEGMENT_INSIGHT_KEYS = {
+    "MARKET": ("consumer",),
+    "PRODUCT": ("consumer", "market"),
+    "BRAND": ("consumer", "market", "product"),
+    "EXPERIENCE": ("consumer", "market", "product", "brand")
+}
+
 @dataclass
 class LayerContext:
     """Context information for a layer analysis"""
@@ -36,7 +55,10 @@ class LayerContext:
 class ComprehensiveGraphState(TypedDict):
     """Enhanced state for LangGraph workflow with context management"""
     app_state: AppState
+    analysis_id: str  # Checkpoint key; pass to execute(resume_from=...) to resume the run
+    score_store: LayerScoreStore  # Columnar storage behind every LayerScore of the run
     layer_scores: Dict[str, LayerScore]
+    layer_fingerprints: Dict[str, str]  # Layer -> input fingerprint for incremental re-analysis
     factor_scores: Dict[str, FactorScore]
     segment_scores: Dict[str, SegmentScore]
     analysis_results: Dict[str, Any]
@@ -54,8 +76,12 @@ class ContextAwareLangGraphWorkflow:
     """
     
     def __init__(self):
-        self.analytical_framework = ComprehensiveAnalyticalFramework()
+        self.analytical_framework = get_comprehensive_analytical_framework()
         self.layer_contexts = self._build_layer_contexts()
+        self.fingerprinter = LayerFingerprinter(
+            self.layer_contexts,
+            {layer: self._context_sources(layer) for layer in self.layer_contexts}
+        )
         self.graph = self.build_graph()
         
     def _build_layer_contexts(self) -> Dict[str, LayerContext]:
@@ -150,17 +176,13 @@ class ContextAwareLangGraphWorkflow:
     
     def _extract_segment_factor(self, layer_name: str) -> tuple:
         """Extract segment and factor from context-aware layer name"""
-        # Use the actual framework structure to determine segment and factor
-        framework = self.analytical_framework.analytical_framework
-        
-        for segment, segment_data in framework.items():
-            for factor, layers in segment_data["factors"].items():
-                if layer_name in layers:
-                    return segment, factor
+        # Use the precomputed layer index to determine segment and factor
+        placement = LAYER_INDEX.segment_factor(layer_name)
+        if placement:
+            return placement
         
         # If not found in framework, try to extract from layer name
-        segments = ["CONSUMER", "MARKET", "PRODUCT", "BRAND", "EXPERIENCE"]
-        for segment in segments:
+        for segment in SEGMENT_ORDER:
             if segment.lower() in layer_name.lower():
                 # Try to extract factor from the layer name
                 factor_part = layer_name.lower().replace(segment.lower(), "").strip("_")
@@ -196,23 +218,15 @@ class ContextAwareLangGraphWorkflow:
         try:
             workflow = StateGraph(ComprehensiveGraphState)
             
-            # Add nodes for each analytical segment with context awareness
-            workflow.add_node("consumer_analysis", self.run_consumer_analysis)
-            workflow.add_node("market_analysis", self.run_market_analysis)
-            workflow.add_node("product_analysis", self.run_product_analysis)
-            workflow.add_node("brand_analysis", self.run_brand_analysis)
-            workflow.add_node("experience_analysis", self.run_experience_analysis)
+            # Layer analysis runs all segments as one dependency-aware DAG
+            workflow.add_node("layer_analysis", self.run_layer_analysis)
             workflow.add_node("factor_calculation", self.calculate_all_factors)
             workflow.add_node("segment_calculation", self.calculate_all_segments)
             workflow.add_node("strategic_synthesis", self.generate_strategic_synthesis)
             
-            # Define sequential workflow with proper state flow
-            workflow.set_entry_point("consumer_analysis")
-            workflow.add_edge("consumer_analysis", "market_analysis")
-            workflow.add_edge("market_analysis", "product_analysis")
-            workflow.add_edge("product_analysis", "brand_analysis")
-            workflow.add_edge("brand_analysis", "experience_analysis")
-            workflow.add_edge("experience_analysis", "factor_calculation")
+            # Define workflow with proper state flow
+            workflow.set_entry_point("layer_analysis")
+            workflow.add_edge("layer_analysis", "factor_calculation")
             workflow.add_edge("factor_calculation", "segment_calculation")
             workflow.add_edge("segment_calculation", "strategic_synthesis")
             workflow.add_edge("strategic_synthesis", END)
@@ -225,303 +239,272 @@ class ContextAwareLangGraphWorkflow:
             logger.error(f"❌ Failed to build fixed workflow: {str(e)}")
             raise
 
-    async def run_consumer_analysis(self, state: ComprehensiveGraphState) -> ComprehensiveGraphState:
-        """Run consumer analysis with context-aware layer ordering"""
-        logger.info("👥 Running Context-Aware Consumer Analysis")
+    async def run_layer_analysis(self, state: ComprehensiveGraphState) -> ComprehensiveGraphState:
+        """Run every segment's layers as a single dependency-aware DAG"""
+        logger.info("🧭 Running Dependency-Aware Layer Analysis")
         
         try:
             app_state = state['app_state']
-            idea_description = app_state.idea_description
-            target_audience = app_state.target_audience
-            
-            # Get consumer layers in optimal order
-            consumer_layers = [layer for layer in self._get_analysis_order() 
-                             if self.layer_contexts[layer].segment == "CONSUMER"]
-            
-            layer_scores = {}
             context_memory = state.get('context_memory', {})
             
-            for layer in consumer_layers:
-                # Build context from previous analyses
-                context = self._build_layer_context(layer, context_memory, layer_scores)
-                
-                # Analyze layer with context
-                layer_score = await self.analytical_framework.analyze_layer(
-                    layer, idea_description, target_audience, 
-                    {
-                        "analysis_type": "consumer", 
-                        "layer": layer, 
-                        "persona": self.layer_contexts[layer].persona,
-                        "context": context,
-                        "previous_insights": list(context_memory.values())
-                    }
-                )
-                
-                layer_scores[layer] = layer_score
-                
-                # Store context for future layers
-                context_memory[layer] = f"Consumer {layer}: {layer_score.score}/10 - {layer_score.rationale[:100] if layer_score.rationale else 'No rationale'}"
-                
-                logger.info(f"✅ Consumer layer {layer}: {layer_score.score}/10")
+            # Layers restored from a checkpoint are not analyzed again
+            pending_layers = [layer for layer in self.layer_contexts if layer not in state['layer_scores']]
+            if len(pending_layers) < len(self.layer_contexts):
+                logger.info(f"♻️ Resuming with {len(self.layer_contexts) - len(pending_layers)} checkpointed layers")
             
-            # Update state properly
+            layer_scores = await self._schedule_layers(
+                pending_layers, app_state.idea_description,
+                app_state.target_audience, context_memory, dict(state['layer_scores']),
+                analysis_id=state.get('analysis_id'), fingerprints=state.get('layer_fingerprints')
+            )
+            
+            # Update state properly; layer scores are copied into the run's columnar store
             new_state = state.copy()
-            new_state['layer_scores'].update(layer_scores)
+            store = new_state['score_store']
+            new_state['layer_scores'].update({layer: store.add(score) for layer, score in layer_scores.items()})
             new_state['context_memory'] = context_memory
-            new_state['completed_steps'].append("consumer_analysis")
-            new_state['current_step'] = "consumer_analysis"
-            new_state['analysis_progress']['CONSUMER'] = {
-                'layers_analyzed': len(layer_scores),
-                'average_score': sum(ls.score for ls in layer_scores.values()) / len(layer_scores) if layer_scores else 0.0,
-                'completion_time': datetime.now().isoformat()
-            }
-            
-            logger.info(f"✅ Consumer analysis completed with {len(layer_scores)} layers")
+            new_state['completed_steps'].append("layer_analysis")
+            new_state['current_step'] = "layer_analysis"
+            await self._checkpoint_node(new_state)
+            for segment in SEGMENT_ORDER:
+                segment_scores = {layer: ls for layer, ls in layer_scores.items()
+                                  if self.layer_contexts[layer].segment == segment}
+                self._record_segment_progress(new_state, segment, segment_scores)
+            
+            logger.info(f"✅ Layer analysis completed with {len(layer_scores)} layers")
             return new_state
             
         except Exception as e:
-            logger.error(f"❌ Consumer analysis failed: {str(e)}")
+            logger.error(f"❌ Layer analysis failed: {str(e)}")
             new_state = state.copy()
-            new_state['error_message'] = f"Consumer analysis failed: {str(e)}"
+            new_state['error_message'] = f"Layer analysis failed: {str(e)}"
             return new_state
 
+    async def run_consumer_analysis(self, state: ComprehensiveGraphState) -> ComprehensiveGraphState:
+        """Run consumer analysis with context-aware layer ordering"""
+        logger.info("👥 Running Context-Aware Consumer Analysis")
+        return await self._run_segment_analysis(state, "CONSUMER")
+
     async def run_market_analysis(self, state: ComprehensiveGraphState) -> ComprehensiveGraphState:
         """Run market analysis with consumer context"""
         logger.info("🔍 Running Context-Aware Market Analysis")
-        
-        try:
-            app_state = state['app_state']
-            idea_description = app_state.idea_description
-            target_audience = app_state.target_audience
-            
-            # Get market layers in optimal order
-            market_layers = [layer for layer in self._get_analysis_order() 
-                           if self.layer_contexts[layer].segment == "MARKET"]
-            
-            layer_scores = {}
-            context_memory = state.get('context_memory', {})
-            
-            for layer in market_layers:
-                # Build context from consumer analysis
-                context = self._build_layer_context(layer, context_memory, layer_scores)
-                
-                layer_score = await self.analytical_framework.analyze_layer(
-                    layer, idea_description, target_audience,
-                    {
-                        "analysis_type": "market", 
-                        "layer": layer, 
-                        "persona": self.layer_contexts[layer].persona,
-                        "context": context,
-                        "consumer_insights": {k: v for k, v in context_memory.items() if 'consumer' in k.lower()}
-                    }
-                )
-                
-                layer_scores[layer] = layer_score
-                context_memory[layer] = f"Market {layer}: {layer_score.score}/10 - {layer_score.rationale[:100] if layer_score.rationale else 'No rationale'}"
-                
-                logger.info(f"✅ Market layer {layer}: {layer_score.score}/10")
-            
-            # Update state properly
-            new_state = state.copy()
-            new_state['layer_scores'].update(layer_scores)
-            new_state['context_memory'] = context_memory
-            new_state['completed_steps'].append("market_analysis")
-            new_state['current_step'] = "market_analysis"
-            new_state['analysis_progress']['MARKET'] = {
-                'layers_analyzed': len(layer_scores),
-                'average_score': sum(ls.score for ls in layer_scores.values()) / len(layer_scores) if layer_scores else 0.0,
-                'completion_time': datetime.now().isoformat()
-            }
-            
-            logger.info(f"✅ Market analysis completed with {len(layer_scores)} layers")
-            return new_state
-            
-        except Exception as e:
-            logger.error(f"❌ Market analysis failed: {str(e)}")
-            new_state = state.copy()
-            new_state['error_message'] = f"Market analysis failed: {str(e)}"
-            return new_state
+        return await self._run_segment_analysis(state, "MARKET")
 
     async def run_product_analysis(self, state: ComprehensiveGraphState) -> ComprehensiveGraphState:
         """Run product analysis with consumer and market context"""
         logger.info("📦 Running Context-Aware Product Analysis")
-        
-        try:
-            app_state = state['app_state']
-            idea_description = app_state.idea_description
-            target_audience = app_state.target_audience
-            
-            # Get product layers in optimal order
-            product_layers = [layer for layer in self._get_analysis_order() 
-                            if self.layer_contexts[layer].segment == "PRODUCT"]
-            
-            layer_scores = {}
-            context_memory = state.get('context_memory', {})
-            
-            for layer in product_layers:
-                # Build context from previous analyses
-                context = self._build_layer_context(layer, context_memory, layer_scores)
-                
-                layer_score = await self.analytical_framework.analyze_layer(
-                    layer, idea_description, target_audience,
-                    {
-                        "analysis_type": "product", 
-                        "layer": layer, 
-                        "persona": self.layer_contexts[layer].persona,
-                        "context": context,
-                        "consumer_insights": {k: v for k, v in context_memory.items() if 'consumer' in k.lower()},
-                        "market_insights": {k: v for k, v in context_memory.items() if 'market' in k.lower()}
-                    }
-                )
-                
-                layer_scores[layer] = layer_score
-                context_memory[layer] = f"Product {layer}: {layer_score.score}/10 - {layer_score.rationale[:100] if layer_score.rationale else 'No rationale'}"
-                
-                logger.info(f"✅ Product layer {layer}: {layer_score.score}/10")
-            
-            # Update state properly
-            new_state = state.copy()
-            new_state['layer_scores'].update(layer_scores)
-            new_state['context_memory'] = context_memory
-            new_state['completed_steps'].append("product_analysis")
-            new_state['current_step'] = "product_analysis"
-            new_state['analysis_progress']['PRODUCT'] = {
-                'layers_analyzed': len(layer_scores),
-                'average_score': sum(ls.score for ls in layer_scores.values()) / len(layer_scores) if layer_scores else 0.0,
-                'completion_time': datetime.now().isoformat()
-            }
-            
-            logger.info(f"✅ Product analysis completed with {len(layer_scores)} layers")
-            return new_state
-            
-        except Exception as e:
-            logger.error(f"❌ Product analysis failed: {str(e)}")
-            new_state = state.copy()
-            new_state['error_message'] = f"Product analysis failed: {str(e)}"
-            return new_state
+        return await self._run_segment_analysis(state, "PRODUCT")
 
     async def run_brand_analysis(self, state: ComprehensiveGraphState) -> ComprehensiveGraphState:
         """Run brand analysis with comprehensive context"""
         logger.info("🏷️ Running Context-Aware Brand Analysis")
+        return await self._run_segment_analysis(state, "BRAND")
+
+    async def run_experience_analysis(self, state: ComprehensiveGraphState) -> ComprehensiveGraphState:
+        """Run experience analysis with full strategic context"""
+        logger.info("🎯 Running Context-Aware Experience Analysis")
+        return await self._run_segment_analysis(state, "EXPERIENCE")
+
+    async def _run_segment_analysis(self, state: ComprehensiveGraphState, segment: str) -> ComprehensiveGraphState:
+        """Run the layers of a single segment through the scheduler"""
+        step = f"{segment.lower()}_analysis"
         
         try:
             app_state = state['app_state']
-            idea_description = app_state.idea_description
-            target_audience = app_state.target_audience
-            
-            # Get brand layers in optimal order
-            brand_layers = [layer for layer in self._get_analysis_order() 
-                          if self.layer_contexts[layer].segment == "BRAND"]
-            
-            layer_scores = {}
             context_memory = state.get('context_memory', {})
             
-            for layer in brand_layers:
-                # Build context from all previous analyses
-                context = self._build_layer_context(layer, context_memory, layer_scores)
-                
-                layer_score = await self.analytical_framework.analyze_layer(
-                    layer, idea_description, target_audience,
-                    {
-                        "analysis_type": "brand", 
-                        "layer": layer, 
-                        "persona": self.layer_contexts[layer].persona,
-                        "context": context,
-                        "strategic_context": {
-                            "consumer_insights": {k: v for k, v in context_memory.items() if 'consumer' in k.lower()},
-                            "market_insights": {k: v for k, v in context_memory.items() if 'market' in k.lower()},
-                            "product_insights": {k: v for k, v in context_memory.items() if 'product' in k.lower()}
-                        }
-                    }
-                )
-                
-                layer_scores[layer] = layer_score
-                context_memory[layer] = f"Brand {layer}: {layer_score.score}/10 - {layer_score.rationale[:100] if layer_score.rationale else 'No rationale'}"
-                
-                logger.info(f"✅ Brand layer {layer}: {layer_score.score}/10")
+            segment_layers = [layer for layer, ctx in self.layer_contexts.items()
+                              if ctx.segment == segment and layer not in state['layer_scores']]
+            layer_scores = await self._schedule_layers(
+                segment_layers, app_state.idea_description, app_state.target_audience,
+                context_memory, dict(state['layer_scores']), analysis_id=state.get('analysis_id'),
+                fingerprints=state.get('layer_fingerprints')
+            )
             
-            # Update state properly
+            # Update state properly; layer scores are copied into the run's columnar store
             new_state = state.copy()
-            new_state['layer_scores'].update(layer_scores)
+            store = new_state['score_store']
+            new_state['layer_scores'].update({layer: store.add(score) for layer, score in layer_scores.items()})
             new_state['context_memory'] = context_memory
-            new_state['completed_steps'].append("brand_analysis")
-            new_state['current_step'] = "brand_analysis"
-            new_state['analysis_progress']['BRAND'] = {
-                'layers_analyzed': len(layer_scores),
-                'average_score': sum(ls.score for ls in layer_scores.values()) / len(layer_scores) if layer_scores else 0.0,
-                'completion_time': datetime.now().isoformat()
-            }
+            new_state['completed_steps'].append(step)
+            new_state['current_step'] = step
+            await self._checkpoint_node(new_state)
+            self._record_segment_progress(new_state, segment, layer_scores)
             
-            logger.info(f"✅ Brand analysis completed with {len(layer_scores)} layers")
+            logger.info(f"✅ {segment.title()} analysis completed with {len(layer_scores)} layers")
             return new_state
             
         except Exception as e:
-            logger.error(f"❌ Brand analysis failed: {str(e)}")
+            logger.error(f"❌ {segment.title()} analysis failed: {str(e)}")
             new_state = state.copy()
-            new_state['error_message'] = f"Brand analysis failed: {str(e)}"
+            new_state['error_message'] = f"{segment.title()} analysis failed: {str(e)}"
             return new_state
 
-    async def run_experience_analysis(self, state: ComprehensiveGraphState) -> ComprehensiveGraphState:
-        """Run experience analysis with full strategic context"""
-        logger.info("🎯 Running Context-Aware Experience Analysis")
+    async def _schedule_layers(self, layers: List[str], idea_description: str, target_audience: str,
+                               context_memory: Dict[str, str],
+                               known_scores: Dict[str, LayerScore],
+                               analysis_id: Optional[str] = None,
+                               fingerprints: Optional[Dict[str, str]] = None) -> Dict[str, LayerScore]:
+        """
+        Analyze layers as a DAG over LayerContext.dependencies.
+        Every layer whose dependencies are scored is dispatched immediately, bounded by
+        LAYER_ANALYSIS_CONCURRENCY. Dependencies outside ``layers`` are treated as satisfied.
+        With LAYER_BATCH_MODE, ready layers of the same factor are dispatched as one batch.
+        Each scored layer is checkpointed under ``analysis_id`` (with its input fingerprint)
+        as soon as it completes.
+        """
+        scheduled = set(layers)
+        waiting = {
+            layer: {dep for dep in self.layer_contexts[layer].dependencies
+                    if dep in scheduled and dep != layer and dep not in known_scores}
+            for layer in layers
+        }
+        priority = lambda layer: (self.layer_contexts[layer].analysis_priority,
+                                  len(self.layer_contexts[layer].dependencies))
+        semaphore = asyncio.Semaphore(max(1, settings.LAYER_ANALYSIS_CONCURRENCY))
+        layer_scores: Dict[str, LayerScore] = {}
+        running: Dict[asyncio.Task, List[str]] = {}
         
-        try:
-            app_state = state['app_state']
-            idea_description = app_state.idea_description
-            target_audience = app_state.target_audience
-            
-            # Get experience layers in optimal order
-            experience_layers = [layer for layer in self._get_analysis_order() 
-                               if self.layer_contexts[layer].segment == "EXPERIENCE"]
-            
-            layer_scores = {}
-            context_memory = state.get('context_memory', {})
-            
-            for layer in experience_layers:
-                # Build context from all previous analyses
-                context = self._build_layer_context(layer, context_memory, layer_scores)
+        async def analyze(group: List[str]) -> Dict[str, LayerScore]:
+            async with semaphore:
+                # Context is built once the slot is acquired so it sees the latest results
+                current_scores = {**known_scores, **layer_scores}
+                if len(group) == 1:
+                    layer = group[0]
+                    context = self._build_layer_context(layer, context_memory, current_scores)
+                    return {layer: await self.analytical_framework.analyze_layer(
+                        layer, idea_description, target_audience,
+                        self._build_analysis_payload(layer, context, context_memory)
+                    )}
                 
-                layer_score = await self.analytical_framework.analyze_layer(
-                    layer, idea_description, target_audience,
-                    {
-                        "analysis_type": "experience", 
-                        "layer": layer, 
-                        "persona": self.layer_contexts[layer].persona,
-                        "context": context,
-                        "comprehensive_strategic_context": {
-                            "consumer_insights": {k: v for k, v in context_memory.items() if 'consumer' in k.lower()},
-                            "market_insights": {k: v for k, v in context_memory.items() if 'market' in k.lower()},
-                            "product_insights": {k: v for k, v in context_memory.items() if 'product' in k.lower()},
-                            "brand_insights": {k: v for k, v in context_memory.items() if 'brand' in k.lower()}
-                        }
-                    }
+                contexts = [self._build_layer_context(layer, context_memory, current_scores) for layer in group]
+                payload = self._build_analysis_payload(group[0], "\n".join(dict.fromkeys(contexts)), context_memory)
+                payload["layers"] = group
+                return await self.analytical_framework.analyze_layers_batch(
+                    group, idea_description, target_audience, payload
                 )
+        
+        try:
+            while waiting or running:
+                ready = sorted((layer for layer, deps in waiting.items() if not deps), key=priority)
+                if not ready and not running:
+                    # Dependency cycle: release the highest priority layer to keep progressing
+                    ready = [min(waiting, key=priority)]
+                    logger.warning(f"⚠️ Dependency cycle detected, releasing {ready[0]}")
                 
-                layer_scores[layer] = layer_score
-                context_memory[layer] = f"Experience {layer}: {layer_score.score}/10 - {layer_score.rationale[:100] if layer_score.rationale else 'No rationale'}"
+                for group in self._group_ready_layers(ready):
+                    for layer in group:
+                        del waiting[layer]
+                    running[asyncio.create_task(analyze(group))] = group
                 
-                logger.info(f"✅ Experience layer {layer}: {layer_score.score}/10")
-            
-            # Update state properly
-            new_state = state.copy()
-            new_state['layer_scores'].update(layer_scores)
-            new_state['context_memory'] = context_memory
-            new_state['completed_steps'].append("experience_analysis")
-            new_state['current_step'] = "experience_analysis"
-            new_state['analysis_progress']['EXPERIENCE'] = {
-                'layers_analyzed': len(layer_scores),
-                'average_score': sum(ls.score for ls in layer_scores.values()) / len(layer_scores) if layer_scores else 0.0,
-                'completion_time': datetime.now().isoformat()
-            }
-            
-            logger.info(f"✅ Experience analysis completed with {len(layer_scores)} layers")
-            return new_state
-            
-        except Exception as e:
-            logger.error(f"❌ Experience analysis failed: {str(e)}")
-            new_state = state.copy()
-            new_state['error_message'] = f"Experience analysis failed: {str(e)}"
-            return new_state
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    group = running.pop(task)
+                    try:
+                        group_scores = task.result()
+                    except Exception as e:
+                        logger.error(f"❌ Error analyzing {', '.join(group)}: {str(e)}")
+                        group_scores = {layer: self.analytical_framework._error_layer_score(layer, e)
+                                        for layer in group}
+                    for layer, layer_score in group_scores.items():
+                        layer_scores[layer] = layer_score
+                        
+                        segment = self.layer_contexts[layer].segment
+                        context_memory[layer] = f"{segment.title()} {layer}: {layer_score.score}/10 - {layer_score.rationale[:100] if layer_score.rationale else 'No rationale'}"
+                        logger.info(f"✅ {segment.title()} layer {layer}: {layer_score.score}/10")
+                        await self._checkpoint_layer(analysis_id, layer_score, context_memory[layer],
+                                                     (fingerprints or {}).get(layer))
+                        
+                        for deps in waiting.values():
+                            deps.discard(layer)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+        
+        return layer_scores
+
+    async def _checkpoint_layer(self, analysis_id: Optional[str], layer_score: LayerScore, context_summary: str,
+                                fingerprint: Optional[str] = None):
+        """Persist a scored layer so an interrupted run can resume after it"""
+        checkpoints = get_checkpoint_store()
+        if checkpoints and analysis_id:
+            await checkpoints.save_layer(analysis_id, layer_score, context_summary, fingerprint)
+
+    async def _checkpoint_node(self, state: ComprehensiveGraphState):
+        """Persist graph progress after a node completes"""
+        checkpoints = get_checkpoint_store()
+        if checkpoints and state.get('analysis_id'):
+            await checkpoints.save_node(state['analysis_id'], state)
+
+    def _group_ready_layers(self, ready: List[str]) -> List[List[str]]:
+        """Split ready layers into dispatch groups: one per layer, or per factor in batch mode"""
+        if not settings.LAYER_BATCH_MODE:
+            return [[layer] for layer in ready]
+        
+        batch_size = max(1, settings.LAYER_BATCH_MAX_SIZE)
+        factor_groups: Dict[tuple, List[str]] = {}
+        for layer in ready:
+            layer_ctx = self.layer_contexts[layer]
+            factor_groups.setdefault((layer_ctx.segment, layer_ctx.factor), []).append(layer)
+        
+        return [
+            group[start:start + batch_size]
+            for group in factor_groups.values()
+            for start in range(0, len(group), batch_size)
+        ]
+
+    def _build_analysis_payload(self, layer: str, context: str, context_memory: Dict[str, str]) -> Dict[str, Any]:
+        """Build the segment-specific analysis context passed to analyze_layer"""
+        segment = self.layer_contexts[layer].segment
+        insights = lambda key: {k: v for k, v in context_memory.items() if key in k.lower()}
+        
+        payload = {
+            "analysis_type": segment.lower(),
+            "layer": layer,
+            "persona": self.layer_contexts[layer].persona,
+            "context": context
+        }
+        
+        if segment == "CONSUMER":
+            payload["previous_insights"] = list(context_memory.values())
+            return payload
+        
+        segment_insights = {
+            f"{key}_insights": insights(key)
+            for key in SEGMENT_INSIGHT_KEYS.get(segment, SEGMENT_INSIGHT_KEYS["EXPERIENCE"])
+        }
+        if segment in ("MARKET", "PRODUCT"):
+            payload.update(segment_insights)
+        elif segment == "BRAND":
+            payload["strategic_context"] = segment_insights
+        else:
+            payload["comprehensive_strategic_context"] = segment_insights
+        
+        return payload
+
+    def _context_sources(self, layer: str) -> Set[str]:
+        """Layers whose context summaries can reach this layer's prompt (mirrors the two builders)"""
+        layer_ctx = self.layer_contexts[layer]
+        if layer_ctx.segment == "CONSUMER":
+            sources = set(self.layer_contexts)
+        else:
+            keys = SEGMENT_INSIGHT_KEYS.get(layer_ctx.segment, SEGMENT_INSIGHT_KEYS["EXPERIENCE"])
+            sources = {other for other in self.layer_contexts if any(key in other.lower() for key in keys)}
+        # Dependencies and same-segment layers feed _build_layer_context
+        sources.update(dep for dep in layer_ctx.dependencies if dep in self.layer_contexts)
+        sources.update(other for other, ctx in self.layer_contexts.items() if ctx.segment == layer_ctx.segment)
+        sources.discard(layer)
+        return sources
+
+    def _record_segment_progress(self, state: ComprehensiveGraphState, segment: str,
+                                 layer_scores: Dict[str, LayerScore]) -> None:
+        """Record per-segment progress in the graph state"""
+        state['analysis_progress'][segment] = {
+            'layers_analyzed': len(layer_scores),
+            'average_score': sum(ls.score for ls in layer_scores.values()) / len(layer_scores) if layer_scores else 0.0,
+            'completion_time': datetime.now().isoformat()
+        }
 
     def _build_layer_context(self, layer: str, context_memory: Dict[str, str], 
                            current_scores: Dict[str, LayerScore]) -> str:
@@ -563,6 +546,7 @@ class ContextAwareLangGraphWorkflow:
             new_state['factor_scores'] = factor_scores
             new_state['completed_steps'].append("factor_calculation")
             new_state['current_step'] = "factor_calculation"
+            await self._checkpoint_node(new_state)
             
             logger.info(f"✅ Factor calculation completed: {len(factor_scores)} factors")
             return new_state
@@ -588,6 +572,7 @@ class ContextAwareLangGraphWorkflow:
             new_state['segment_scores'] = segment_scores
             new_state['completed_steps'].append("segment_calculation")
             new_state['current_step'] = "segment_calculation"
+            await self._checkpoint_node(new_state)
             
             logger.info(f"✅ Segment calculation completed: {len(segment_scores)} segments")
             return new_state
@@ -618,6 +603,7 @@ class ContextAwareLangGraphWorkflow:
             new_state['analysis_results'] = analysis_results
             new_state['completed_steps'].append("strategic_synthesis")
             new_state['current_step'] = "strategic_synthesis"
+            await self._checkpoint_node(new_state)
             
             logger.info("✅ Strategic synthesis completed")
             return new_state
@@ -664,158 +650,7 @@ class ContextAwareLangGraphWorkflow:
         This matches the frontend expected structure for proper drill-down functionality.
         """
         try:
-            # Define the expected structure based on FRAMEWORK_STRUCTURE_REFERENCE.md
-            SEGMENTS = {
-                "consumer": {
-                    "name": "Consumer Segment",
-                    "description": "Consumer insights, behavior, loyalty, perception, and adoption",
-                    "factors": {
-                        "consumer_demand_need": "Consumer demand, need perception, trust, and purchase intent",
-                        "consumer_behavior_habits": "Usage patterns, engagement, habits, and emotional ties",
-                        "consumer_loyalty_retention": "Repeat purchase, loyalty, advocacy, and retention",
-                        "consumer_perception_sentiment": "Quality perception, sentiment, trust, and prestige",
-                        "consumer_adoption_engagement": "Adoption rates, engagement, and social influence"
-                    }
-                },
-                "market": {
-                    "name": "Market Segment", 
-                    "description": "Market research, trends, competition, demand, and growth",
-                    "factors": {
-                        "market_trends": "Future trends, technological shifts, cultural changes, and regulatory shifts",
-                        "market_competition_barriers": "Competition analysis, entry barriers, and differentiation",
-                        "market_demand_adoption": "Demand volume, growth, adoption rates, and accessibility",
-                        "market_growth_expansion": "Growth potential, scalability, and regional expansion",
-                        "market_stability_risk": "Economic stability, political stability, and risk exposure"
-                    }
-                },
-                "product": {
-                    "name": "Product Segment",
-                    "description": "Product strategy, innovation, quality, differentiation, and lifecycle",
-                    "factors": {
-                        "product_market_readiness": "Entry timing, market saturation, and cycle impact",
-                        "product_competitive_disruption": "Disruption potential, incumbent resistance, and response time",
-                        "product_dynamic_disruption": "Dynamic disruption, product strength, and value perception",
-                        "product_business_resilience": "Profit resilience and expansion growth",
-                        "product_hype_cycle": "Hype cycle analysis and market saturation",
-                        "product_quality_assurance": "Material quality, functional quality, and brand trust",
-                        "product_differentiation": "Technical features and competitive strength",
-                        "product_brand_perception": "Ad reach and organic buzz",
-                        "product_experience_design": "Visual appeal, haptic feedback, and sensory design",
-                        "product_innovation_lifecycle": "Market fit, entry barriers, and technology gaps"
-                    }
-                },
-                "brand": {
-                    "name": "Brand Segment",
-                    "description": "Brand positioning, equity, virality, monetization, and longevity",
-                    "factors": {
-                        "brand_positioning_strategy": "Heritage, innovation edge, and competitive positioning",
-                        "brand_equity_profile": "Review scores, social sentiment, and trust metrics",
-                        "brand_virality_impact": "Shareability, influencer impact, and cultural embedding",
-                        "brand_monetization_model": "Direct sales, licensing, and revenue diversification",
-                        "brand_longevity_outlook": "Evolution, generational appeal, and cultural relevance"
-                    }
-                },
-                "experience": {
-                    "name": "Experience Segment",
-                    "description": "User experience, engagement, satisfaction, interaction design, and loyalty",
-                    "factors": {
-                        "user_engagement_metrics": "Attention focus, interaction rates, and community activity",
-                        "satisfaction_feedback": "Value perception, sentiment, and support quality",
-                        "interaction_design_elements": "Usability, intuitive design, and personalization",
-                        "post_purchase_loyalty": "Repeat usage, emotional bonds, and advocacy",
-                        "experience_evolution": "Feature updates, trend alignment, and AI adaptation"
-                    }
-                }
-            }
-            
-            # Get the layer scores from the final state
-            layer_scores = final_state.get('layer_scores', {})
-            
-            # Create the new hierarchical structure
-            hierarchical_analysis = {
-                "segments": {},
-                "layer_scores": layer_scores  # Keep for backward compatibility
-            }
-            
-            # Process each segment
-            for segment_key, segment_info in SEGMENTS.items():
-                segment_data = {
-                    "segment_name": segment_info["name"],
-                    "description": segment_info["description"],
-                    "overall_score": 0,
-                    "summary": "",
-                    "factors": {},
-                    "segment_insights": [],
-                    "strategic_priorities": []
-                }
-                
-                total_segment_score = 0
-                factor_count = 0
-                
-                # Process each factor in the segment
-                for factor_key, factor_description in segment_info["factors"].items():
-                    factor_data = {
-                        "factor_name": factor_description,
-                        "overall_score": 0,
-                        "summary": "",
-                        "layers": {},
-                        "factor_insights": [],
-                        "recommendations": []
-                    }
-                    
-                    total_factor_score = 0
-                    layer_count = 0
-                    
-                    # Find layers that belong to this factor
-                    factor_layers = {}
-                    for layer_name, layer_data in layer_scores.items():
-                        # Map layers to factors based on naming patterns and descriptions
-                        if self._should_map_layer_to_factor(layer_name, factor_key, factor_description):
-                            factor_layers[layer_name] = layer_data
-                            total_factor_score += layer_data.get('score', 0)
-                            layer_count += 1
-                    
-                    # Calculate factor score
-                    if layer_count > 0:
-                        factor_data["overall_score"] = round(total_factor_score / layer_count, 2)
-                        factor_data["summary"] = f"Analyzed {layer_count} layers with average score {factor_data['overall_score']}/10"
-                        factor_data["layers"] = factor_layers
-                        
-                        # Generate factor insights
-                        if factor_data["overall_score"] >= 8:
-                            factor_data["factor_insights"] = [f"Strong performance in {factor_description.lower()}"]
-                            factor_data["recommendations"] = ["Leverage this strength", "Maintain current approach"]
-                        elif factor_data["overall_score"] >= 6:
-                            factor_data["factor_insights"] = [f"Moderate performance in {factor_description.lower()}"]
-                            factor_data["recommendations"] = ["Focus on improvement areas", "Develop action plan"]
-                        else:
-                            factor_data["factor_insights"] = [f"Needs improvement in {factor_description.lower()}"]
-                            factor_data["recommendations"] = ["Prioritize this area", "Develop improvement strategy"]
-                        
-                        total_segment_score += factor_data["overall_score"]
-                        factor_count += 1
-                    
-                    segment_data["factors"][factor_key] = factor_data
-                
-                # Calculate segment score
-                if factor_count > 0:
-                    segment_data["overall_score"] = round(total_segment_score / factor_count, 2)
-                    segment_data["summary"] = f"Overall segment score: {segment_data['overall_score']}/10 based on {factor_count} factors"
-                    
-                    # Generate segment insights
-                    if segment_data["overall_score"] >= 8:
-                        segment_data["segment_insights"] = [f"Strong performance across {segment_info['name'].lower()}"]
-                        segment_data["strategic_priorities"] = ["Maintain leadership position", "Leverage strengths"]
-                    elif segment_data["overall_score"] >= 6:
-                        segment_data["segment_insights"] = [f"Solid performance in {segment_info['name'].lower()}"]
-                        segment_data["strategic_priorities"] = ["Focus on improvement areas", "Build on strengths"]
-                    else:
-                        segment_data["segment_insights"] = [f"Needs attention in {segment_info['name'].lower()}"]
-                        segment_data["strategic_priorities"] = ["Develop improvement plan", "Allocate resources"]
-                
-                hierarchical_analysis["segments"][segment_key] = segment_data
-            
-            return hierarchical_analysis
+            return build_hierarchical_analysis(final_state.get('layer_scores', {}))
             
         except Exception as e:
             logger.error(f"❌ Error restructuring results: {str(e)}")
@@ -825,64 +660,67 @@ class ContextAwareLangGraphWorkflow:
         """
         Determine if a layer should be mapped to a specific factor based on naming patterns.
         """
-        layer_lower = layer_name.lower()
-        factor_lower = factor_key.lower()
-        
-        # Direct keyword matching
-        if factor_lower in layer_lower:
-            return True
-        
-        # Factor-specific mapping rules
-        factor_mapping = {
-            "consumer_demand_need": ["need", "trust", "purchase", "emotional", "awareness", "social", "accessibility", "value", "trend", "price"],
-            "consumer_behavior_habits": ["usage", "engagement", "habit", "emotional", "access", "trust", "interaction", "social", "incentive"],
-            "consumer_loyalty_retention": ["repeat", "loyalty", "advocacy", "retention", "switching", "reward"],
-            "consumer_perception_sentiment": ["sentiment", "quality", "perception", "innovation", "prestige", "impact"],
-            "consumer_adoption_engagement": ["adoption", "engagement", "frequency", "social", "emotional"],
-            
-            "market_trends": ["trend", "technological", "cultural", "regulatory", "future"],
-            "market_competition_barriers": ["competition", "barrier", "differentiation", "rival", "switching"],
-            "market_demand_adoption": ["demand", "growth", "adoption", "price", "accessibility"],
-            "market_growth_expansion": ["growth", "expansion", "scalability", "regional", "investment"],
-            "market_stability_risk": ["stability", "risk", "economic", "political", "regulatory"],
-            
-            "product_market_readiness": ["timing", "saturation", "cycle", "entry"],
-            "product_competitive_disruption": ["disruption", "incumbent", "response", "competitive"],
-            "product_dynamic_disruption": ["dynamic", "strength", "awareness", "value", "adoption", "error", "retention"],
-            "product_business_resilience": ["profit", "resilience", "expansion"],
-            "product_hype_cycle": ["hype", "buzz", "saturation"],
-            "product_quality_assurance": ["quality", "material", "functional", "trust", "complaint"],
-            "product_differentiation": ["tech", "feature", "competitive"],
-            "product_brand_perception": ["ad", "reach", "buzz", "organic"],
-            "product_experience_design": ["visual", "haptic", "sensory", "appeal"],
-            "product_innovation_lifecycle": ["market_fit", "barrier", "tech_gap", "innovation"],
-            
-            "brand_positioning_strategy": ["heritage", "legacy", "innovation", "edge", "exclusivity"],
-            "brand_equity_profile": ["review", "score", "sentiment", "trust", "crisis"],
-            "brand_virality_impact": ["shareability", "influencer", "platform", "cultural", "viral"],
-            "brand_monetization_model": ["sales", "licensing", "pricing", "revenue", "monetization"],
-            "brand_longevity_outlook": ["evolution", "generational", "resilience", "esg", "cultural"],
-            
-            "user_engagement_metrics": ["attention", "focus", "interaction", "community", "activity"],
-            "satisfaction_feedback": ["satisfaction", "feedback", "sentiment", "support", "expectation"],
-            "interaction_design_elements": ["usability", "intuitive", "design", "personalization", "inclusive"],
-            "post_purchase_loyalty": ["post_purchase", "loyalty", "repeat", "emotional", "advocacy"],
-            "experience_evolution": ["evolution", "update", "trend", "cognitive", "ai"]
-        }
-        
-        if factor_key in factor_mapping:
-            keywords = factor_mapping[factor_key]
-            return any(keyword in layer_lower for keyword in keywords)
-        
-        return False
+        return should_map_layer_to_factor(layer_name, factor_key, factor_description)
 
     async def execute(self, idea_description: str, target_audience: str, 
-                     additional_context: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Execute the fixed comprehensive workflow"""
+                     additional_context: Dict[str, Any] = None,
+                     resume_from: Optional[str] = None,
+                     incremental_from: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Execute the fixed comprehensive workflow.
+        Progress is checkpointed after every scored layer and node; pass a previous run's
+        ``analysis_id`` as ``resume_from`` to continue it, skipping layers that already have scores.
+        Pass it as ``incremental_from`` to re-run it with edited inputs: only layers whose input
+        fingerprint changed, and their dependents, are analyzed again; the rest are reused.
+        """
+        analysis_id = resume_from or new_analysis_id()
+        checkpoints = get_checkpoint_store()
+        
         try:
             logger.info("🚀 Starting Fixed Context-Aware LangGraph Workflow")
             logger.info(f"📊 Framework: {len(self.analytical_framework.get_all_layers())} total layers")
             
+            checkpoint = None
+            if resume_from:
+                checkpoint = await checkpoints.load(resume_from) if checkpoints else None
+                if checkpoint is None:
+                    return {"error": f"No checkpoint found for analysis {resume_from}", "success": False,
+                            "analysis_id": resume_from}
+                if checkpoint["status"] == "completed" and checkpoint["results"] is not None:
+                    logger.info(f"♻️ Analysis {resume_from} already completed, returning checkpointed results")
+                    return checkpoint["results"]
+                
+                # The run continues with the inputs it was started with
+                idea_description = checkpoint["idea_description"]
+                target_audience = checkpoint["target_audience"]
+                additional_context = checkpoint["additional_context"]
+                logger.info(f"♻️ Resuming analysis {resume_from} with {len(checkpoint['layer_scores'])} scored layers")
+            
+            fingerprints = self.fingerprinter.fingerprints(idea_description, target_audience, additional_context or {})
+            
+            if incremental_from and not resume_from:
+                base = await checkpoints.load(incremental_from) if checkpoints else None
+                if base is None:
+                    return {"error": f"No checkpoint found for analysis {incremental_from}", "success": False,
+                            "analysis_id": analysis_id}
+                
+                stale = self.fingerprinter.stale_layers(base["fingerprints"], fingerprints)
+                reused = {layer: score for layer, score in base["layer_scores"].items()
+                          if layer in fingerprints and layer not in stale}
+                checkpoint = {
+                    "score_store": base["score_store"],
+                    "layer_scores": reused,
+                    "context_memory": {layer: summary for layer, summary in base["context_memory"].items() if layer in reused}
+                }
+                logger.info(f"♻️ Incremental run from {incremental_from}: reusing {len(reused)} layers, "
+                            f"re-analyzing {len(fingerprints) - len(reused)}")
+            
+            if checkpoints:
+                # Reused layers are copied before start() purges expired runs, which may include the base run
+                if incremental_from and not resume_from:
+                    await checkpoints.copy_layers(incremental_from, analysis_id, list(checkpoint["layer_scores"]))
+                await checkpoints.start(analysis_id, idea_description, target_audience, additional_context or {})
+            
             # Initialize enhanced state
             initial_app_state = AppState(
                 idea_description=idea_description,
@@ -892,7 +730,10 @@ class ContextAwareLangGraphWorkflow:
             
             initial_graph_state = ComprehensiveGraphState(
                 app_state=initial_app_state,
-                layer_scores={},
+                analysis_id=analysis_id,
+                score_store=checkpoint["score_store"] if checkpoint else LayerScoreStore(),
+                layer_scores=dict(checkpoint["layer_scores"]) if checkpoint else {},
+                layer_fingerprints=fingerprints,
                 factor_scores={},
                 segment_scores={},
                 analysis_results={},
@@ -900,20 +741,32 @@ class ContextAwareLangGraphWorkflow:
                 current_step="",
                 completed_steps=[],
                 retry_count=0,
-                context_memory={},
+                context_memory=dict(checkpoint["context_memory"]) if checkpoint else {},
                 analysis_progress={},
                 strategic_insights=[]
             )
             
-            # Execute workflow with proper state management
-            final_state = await self.graph.ainvoke(initial_graph_state)
+            # Execute workflow with proper state management; research searches are shared across the run
+            with search_run_scope():
+                final_state = await self.graph.ainvoke(initial_graph_state)
+            
+            results = final_state.get('analysis_results', {})
+            if results:
+                results['analysis_id'] = analysis_id
+            if checkpoints:
+                if results:
+                    await checkpoints.finish(analysis_id, results)
+                else:
+                    await checkpoints.fail(analysis_id, final_state.get('error_message') or "No analysis results")
             
             logger.info("✅ Fixed context-aware workflow completed successfully")
-            return final_state.get('analysis_results', {})
+            return results
             
         except Exception as e:
             logger.error(f"❌ Fixed workflow execution failed: {str(e)}")
-            return {"error": str(e), "success": False}
+            if checkpoints:
+                await checkpoints.fail(analysis_id, str(e))
+            return {"error": str(e), "success": False, "analysis_id": analysis_id}
 
 if __name__ == "__main__":
     # Test the fixed comprehensive workflow
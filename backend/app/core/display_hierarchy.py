@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Display Hierarchy for Validatus Platform
+Frontend segment → factor grouping of layer results (FRAMEWORK_STRUCTURE_REFERENCE.md) with a
+cached layer → display-factor lookup shared by the workflow API and the offline restructuring script
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+
+DISPLAY_SEGMENTS: Dict[str, Dict[str, Any]] = {
+    "consumer": {
+        "name": "Consumer Segment",
+        "description": "Consumer insights, behavior, loyalty, perception, and adoption",
+        "factors": {
+            "consumer_demand_need": "Consumer demand, need perception, trust, and purchase intent",
+            "consumer_behavior_habits": "Usage patterns, engagement, habits, and emotional ties",
+            "consumer_loyalty_retention": "Repeat purchase, loyalty, advocacy, and retention",
+            "consumer_perception_sentiment": "Quality perception, sentiment, trust, and prestige",
+            "consumer_adoption_engagement": "Adoption rates, engagement, and social influence"
+        }
+    },
+    "market": {
+        "name": "Market Segment",
+        "description": "Market research, trends, competition, demand, and growth",
+        "factors": {
+            "market_trends": "Future trends, technological shifts, cultural changes, and regulatory shifts",
+            "market_competition_barriers": "Competition analysis, entry barriers, and differentiation",
+            "market_demand_adoption": "Demand volume, growth, adoption rates, and accessibility",
+            "market_growth_expansion": "Growth potential, scalability, and regional expansion",
+            "market_stability_risk": "Economic stability, political stability, and risk exposure"
+        }
+    },
+    "product": {
+        "name": "Product Segment",
+        "description": "Product strategy, innovation, quality, differentiation, and lifecycle",
+        "factors": {
+            "product_market_readiness": "Entry timing, market saturation, and cycle impact",
+            "product_competitive_disruption": "Disruption potential, incumbent resistance, and response time",
+            "product_dynamic_disruption": "Dynamic disruption, product strength, and value perception",
+            "product_business_resilience": "Profit resilience and expansion growth",
+            "product_hype_cycle": "Hype cycle analysis and market saturation",
+            "product_quality_assurance": "Material quality, functional quality, and brand trust",
+            "product_differentiation": "Technical features and competitive strength",
+            "product_brand_perception": "Ad reach and organic buzz",
+            "product_experience_design": "Visual appeal, haptic feedback, and sensory design",
+            "product_innovation_lifecycle": "Market fit, entry barriers, and technology gaps"
+        }
+    },
+    "brand": {
+        "name": "Brand Segment",
+        "description": "Brand positioning, equity, virality, monetization, and longevity",
+        "factors": {
+            "brand_positioning_strategy": "Heritage, innovation edge, and competitive positioning",
+            "brand_equity_profile": "Review scores, social sentiment, and trust metrics",
+            "brand_virality_impact": "Shareability, influencer impact, and cultural embedding",
+            "brand_monetization_model": "Direct sales, licensing, and revenue diversification",
+            "brand_longevity_outlook": "Evolution, generational appeal, and cultural relevance"
+        }
+    },
+    "experience": {
+        "name": "Experience Segment",
+        "description": "User experience, engagement, satisfaction, interaction design, and loyalty",
+        "factors": {
+            "user_engagement_metrics": "Attention focus, interaction rates, and community activity",
+            "satisfaction_feedback": "Value perception, sentiment, and support quality",
+            "interaction_design_elements": "Usability, intuitive design, and personalization",
+            "post_purchase_loyalty": "Repeat usage, emotional bonds, and advocacy",
+            "experience_evolution": "Feature updates, trend alignment, and AI adaptation"
+        }
+    }
+}
+
+# Substrings of a layer name that place it under a display factor (a layer may match several)
+DISPLAY_FACTOR_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "consumer_demand_need": ("need", "trust", "purchase", "emotional", "awareness", "social", "accessibility", "value", "trend", "price"),
+    "consumer_behavior_habits": ("usage", "engagement", "habit", "emotional", "access", "trust", "interaction", "social", "incentive"),
+    "consumer_loyalty_retention": ("repeat", "loyalty", "advocacy", "retention", "switching", "reward"),
+    "consumer_perception_sentiment": ("sentiment", "quality", "perception", "innovation", "prestige", "impact"),
+    "consumer_adoption_engagement": ("adoption", "engagement", "frequency", "social", "emotional"),
+
+    "market_trends": ("trend", "technological", "cultural", "regulatory", "future"),
+    "market_competition_barriers": ("competition", "barrier", "differentiation", "rival", "switching"),
+    "market_demand_adoption": ("demand", "growth", "adoption", "price", "accessibility"),
+    "market_growth_expansion": ("growth", "expansion", "scalability", "regional", "investment"),
+    "market_stability_risk": ("stability", "risk", "economic", "political", "regulatory"),
+
+    "product_market_readiness": ("timing", "saturation", "cycle", "entry"),
+    "product_competitive_disruption": ("disruption", "incumbent", "response", "competitive"),
+    "product_dynamic_disruption": ("dynamic", "strength", "awareness", "value", "adoption", "error", "retention"),
+    "product_business_resilience": ("profit", "resilience", "expansion"),
+    "product_hype_cycle": ("hype", "buzz", "saturation"),
+    "product_quality_assurance": ("quality", "material", "functional", "trust", "complaint"),
+    "product_differentiation": ("tech", "feature", "competitive"),
+    "product_brand_perception": ("ad", "reach", "buzz", "organic"),
+    "product_experience_design": ("visual", "haptic", "sensory", "appeal"),
+    "product_innovation_lifecycle": ("market_fit", "barrier", "tech_gap", "innovation"),
+
+    "brand_positioning_strategy": ("heritage", "legacy", "innovation", "edge", "exclusivity"),
+    "brand_equity_profile": ("review", "score", "sentiment", "trust", "crisis"),
+    "brand_virality_impact": ("shareability", "influencer", "platform", "cultural", "viral"),
+    "brand_monetization_model": ("sales", "licensing", "pricing", "revenue", "monetization"),
+    "brand_longevity_outlook": ("evolution", "generational", "resilience", "esg", "cultural"),
+
+    "user_engagement_metrics": ("attention", "focus", "interaction", "community", "activity"),
+    "satisfaction_feedback": ("satisfaction", "feedback", "sentiment", "support", "expectation"),
+    "interaction_design_elements": ("usability", "intuitive", "design", "personalization", "inclusive"),
+    "post_purchase_loyalty": ("post_purchase", "loyalty", "repeat", "emotional", "advocacy"),
+    "experience_evolution": ("evolution", "update", "trend", "cognitive", "ai")
+}
+
+# (segment_key, factor_key, match terms) in display order; the factor key itself always matches
+_FACTOR_MATCHERS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = tuple(
+    (segment_key, factor_key, (factor_key.lower(),) + DISPLAY_FACTOR_KEYWORDS.get(factor_key, ()))
+    for segment_key, segment_info in DISPLAY_SEGMENTS.items()
+    for factor_key in segment_info["factors"]
+)
+
+@lru_cache(maxsize=None)
+def layer_display_factors(layer_name: str) -> Tuple[Tuple[str, str], ...]:
+    """(segment_key, factor_key) of every display factor a layer belongs to, in display order"""
+    layer_lower = layer_name.lower()
+    return tuple(
+        (segment_key, factor_key)
+        for segment_key, factor_key, terms in _FACTOR_MATCHERS
+        if any(term in layer_lower for term in terms)
+    )
+
+def should_map_layer_to_factor(layer_name: str, factor_key: str, factor_description: str = "") -> bool:
+    """Whether a layer belongs to a display factor (looked up in the cached assignment)"""
+    return any(key == factor_key for _, key in layer_display_factors(layer_name))
+
+def _layer_score_value(layer_data: Any) -> float:
+    if isinstance(layer_data, dict):
+        return layer_data.get('score', 0)
+    return getattr(layer_data, 'score', 0)
+
+def build_hierarchical_analysis(layer_scores: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Group flat layer results into display segments → factors → layers in one pass over the layers.
+    Factor scores are layer averages and segment scores factor averages, rounded to 2 decimals.
+    """
+    # Bucket every layer under its display factors
+    factor_layers: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    factor_totals: Dict[Tuple[str, str], float] = {}
+    for layer_name, layer_data in layer_scores.items():
+        for placement in layer_display_factors(layer_name):
+            factor_layers.setdefault(placement, {})[layer_name] = layer_data
+            factor_totals[placement] = factor_totals.get(placement, 0) + _layer_score_value(layer_data)
+
+    hierarchical_analysis = {
+        "segments": {},
+        "layer_scores": layer_scores  # Keep for backward compatibility
+    }
+
+    for segment_key, segment_info in DISPLAY_SEGMENTS.items():
+        segment_data = {
+            "segment_name": segment_info["name"],
+            "description": segment_info["description"],
+            "overall_score": 0,
+            "summary": "",
+            "factors": {},
+            "segment_insights": [],
+            "strategic_priorities": []
+        }
+
+        total_segment_score = 0
+        factor_count = 0
+
+        for factor_key, factor_description in segment_info["factors"].items():
+            factor_data = {
+                "factor_name": factor_description,
+                "overall_score": 0,
+                "summary": "",
+                "layers": {},
+                "factor_insights": [],
+                "recommendations": []
+            }
+
+            layers = factor_layers.get((segment_key, factor_key), {})
+            layer_count = len(layers)
+
+            if layer_count > 0:
+                factor_data["overall_score"] = round(factor_totals[(segment_key, factor_key)] / layer_count, 2)
+                factor_data["summary"] = f"Analyzed {layer_count} layers with average score {factor_data['overall_score']}/10"
+                factor_data["layers"] = layers
+
+                # Generate factor insights
+                if factor_data["overall_score"] >= 8:
+                    factor_data["factor_insights"] = [f"Strong performance in {factor_description.lower()}"]
+                    factor_data["recommendations"] = ["Leverage this strength", "Maintain current approach"]
+                elif factor_data["overall_score"] >= 6:
+                    factor_data["factor_insights"] = [f"Moderate performance in {factor_description.lower()}"]
+                    factor_data["recommendations"] = ["Focus on improvement areas", "Develop action plan"]
+                else:
+                    factor_data["factor_insights"] = [f"Needs improvement in {factor_description.lower()}"]
+                    factor_data["recommendations"] = ["Prioritize this area", "Develop improvement strategy"]
+
+                total_segment_score += factor_data["overall_score"]
+                factor_count += 1
+
+            segment_data["factors"][factor_key] = factor_data
+
+        # Calculate segment score
+        if factor_count > 0:
+            segment_data["overall_score"] = round(total_segment_score / factor_count, 2)
+            segment_data["summary"] = f"Overall segment score: {segment_data['overall_score']}/10 based on {factor_count} factors"
+
+            # Generate segment insights
+            if segment_data["overall_score"] >= 8:
+                segment_data["segment_insights"] = [f"Strong performance across {segment_info['name'].lower()}"]
+                segment_data["strategic_priorities"] = ["Maintain leadership position", "Leverage strengths"]
+            elif segment_data["overall_score"] >= 6:
+                segment_data["segment_insights"] = [f"Solid performance in {segment_info['name'].lower()}"]
+                segment_data["strategic_priorities"] = ["Focus on improvement areas", "Build on strengths"]
+            else:
+                segment_data["segment_insights"] = [f"Needs attention in {segment_info['name'].lower()}"]
+                segment_data["strategic_priorities"] = ["Develop improvement plan", "Allocate resources"]
+
+        hierarchical_analysis["segments"][segment_key] = segment_data
+
+    return hierarchical_analysis
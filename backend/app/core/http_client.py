@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Shared pooled HTTP clients for research agents and LLM providers
+One keep-alive httpx.AsyncClient per host (HTTP/2 when available), created at
+application startup and shared process-wide, with connection-reuse metrics
+"""
+
+import asyncio
+import logging
+import threading
+import importlib.util
+from urllib.parse import urlsplit
+from typing import Dict, Any, Optional, Set
+
+import httpx
+
+from config import settings
+
+logger = logging.getLogger("http.pool")
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+class HostMetrics:
+    """Request and connection counters for one host"""
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        self.errors = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        reused = max(0, self.requests - self.new_connections)
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": reused,
+            "reuse_rate": reused / self.requests if self.requests else 0.0,
+            "tls_handshakes": self.tls_handshakes,
+            "errors": self.errors
+        }
+
+class HTTPClientPool:
+    """Process-wide pool of per-host async clients with keep-alive and per-host connection limits"""
+
+    def __init__(self, max_connections_per_host: int = 20, max_keepalive_per_host: int = 10,
+                 keepalive_expiry: float = 60.0, timeout: float = 30.0, http2: bool = True):
+        self.limits = httpx.Limits(
+            max_connections=max(1, max_connections_per_host),
+            max_keepalive_connections=max(0, max_keepalive_per_host),
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = timeout
+        self.http2 = http2 and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("⚠️ HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._metrics: Dict[str, HostMetrics] = {}
+        self._lock = threading.Lock()
+        # Clients are bound to the event loop they were created on
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme or 'https'}://{parts.netloc or parts.path}"
+
+    def client(self, url: str) -> httpx.AsyncClient:
+        """Get the shared client for the host of ``url``"""
+        host = self._host_key(url)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        stale = []
+        with self._lock:
+            if loop is not None and self._loop is not loop:
+                # A new event loop (e.g. a fresh asyncio.run) cannot reuse the old connections
+                stale = list(self._clients.values())
+                self._clients.clear()
+                self._loop = loop
+
+            if host not in self._clients:
+                self._clients[host] = httpx.AsyncClient(
+                    http2=self.http2,
+                    limits=self.limits,
+                    timeout=self.timeout,
+                    event_hooks={"request": [self._instrument(host)], "response": [self._record_response(host)]}
+                )
+                self._metrics.setdefault(host, HostMetrics())
+                logger.info(f"🔗 Pooled HTTP client created for {host} (http2={self.http2})")
+            client = self._clients[host]
+
+        if stale:
+            logger.info(f"🔄 Event loop changed, closing {len(stale)} pooled HTTP clients")
+            task = loop.create_task(self._close_clients(stale))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        return client
+
+    def _instrument(self, host: str):
+        metrics = self._metrics.setdefault(host, HostMetrics())
+
+        async def trace(event_name: str, info: Dict[str, Any]):
+            if event_name == "connection.connect_tcp.complete":
+                metrics.new_connections += 1
+            elif event_name == "connection.start_tls.complete":
+                metrics.tls_handshakes += 1
+
+        async def on_request(request: httpx.Request):
+            metrics.requests += 1
+            request.extensions["trace"] = trace
+
+        return on_request
+
+    def _record_response(self, host: str):
+        metrics = self._metrics.setdefault(host, HostMetrics())
+
+        async def on_response(response: httpx.Response):
+            if response.status_code >= 400:
+                metrics.errors += 1
+
+        return on_response
+
+    @staticmethod
+    async def _close_clients(clients):
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"⚠️ Error closing pooled HTTP client: {e}")
+
+    async def aclose(self):
+        """Close every pooled client (application shutdown)"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._loop = None
+        await self._close_clients(clients)
+        if clients:
+            logger.info(f"🔌 Closed {len(clients)} pooled HTTP clients")
+
+    def get_stats(self) -> Dict[str, Any]:
+        hosts = {host: metrics.to_dict() for host, metrics in self._metrics.items()}
+        requests = sum(m["requests"] for m in hosts.values())
+        reused = sum(m["reused_connections"] for m in hosts.values())
+        return {
+            "http2": self.http2,
+            "max_connections_per_host": self.limits.max_connections,
+            "max_keepalive_per_host": self.limits.max_keepalive_connections,
+            "open_clients": len(self._clients),
+            "requests": requests,
+            "reuse_rate": reused / requests if requests else 0.0,
+            "hosts": hosts
+        }
+
+_http_client_pool: Optional[HTTPClientPool] = None
+_http_client_pool_lock = threading.Lock()
+
+def get_http_client_pool() -> HTTPClientPool:
+    """Get the process-wide HTTP client pool"""
+    global _http_client_pool
+    if _http_client_pool is None:
+        with _http_client_pool_lock:
+            if _http_client_pool is None:
+                _http_client_pool = HTTPClientPool(
+                    max_connections_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+                    max_keepalive_per_host=settings.HTTP_MAX_KEEPALIVE_PER_HOST,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+                    timeout=settings.HTTP_DEFAULT_TIMEOUT,
+                    http2=settings.HTTP_HTTP2_ENABLED
+                )
+    return _http_client_pool
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """Get the shared keep-alive client for the host of ``url``; do not close it"""
+    return get_http_client_pool().client(url)
+
+async def close_http_client_pool():
+    """Close the pooled clients; a later request lazily reopens them"""
+    if _http_client_pool is not None:
+        await _http_client_pool.aclose()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Layer Input Fingerprints for Incremental Re-analysis
+Hashes each layer's inputs (idea, audience, additional_context and its dependencies'
+fingerprints) so a re-run only analyzes layers whose inputs changed plus everything
+downstream of them, including every layer whose prompt reads their context summaries
+"""
+
+import json
+import hashlib
+from typing import Dict, List, Any, Set, Iterable, Optional
+
+class LayerFingerprinter:
+    """
+    Fingerprints over the workflow's layer contexts (``LayerContext`` by layer name).
+
+    No layer prompt reads additional_context directly, so no key can be tied to particular
+    layers: the whole dict feeds every fingerprint and any edit re-analyzes every layer.
+
+    ``context_sources`` maps each layer to the layers whose context summaries its prompt can
+    read (segment context, previous/segment insights). Summaries are outputs, not hashed
+    inputs, so a re-analyzed source marks its readers stale through ``downstream`` instead.
+    """
+
+    def __init__(self, layer_contexts: Dict[str, Any], context_sources: Optional[Dict[str, Iterable[str]]] = None):
+        self.layer_contexts = layer_contexts
+
+        # Downstream edges: explicit provides_context_for, the reverse of dependencies and
+        # every context-summary reader
+        self.downstream: Dict[str, Set[str]] = {layer: set() for layer in layer_contexts}
+        for layer, ctx in layer_contexts.items():
+            for target in ctx.provides_context_for:
+                if target in self.downstream and target != layer:
+                    self.downstream[layer].add(target)
+            for dep in ctx.dependencies:
+                if dep in self.downstream and dep != layer:
+                    self.downstream[dep].add(layer)
+        for reader, sources in (context_sources or {}).items():
+            for source in sources:
+                if source in self.downstream and reader in self.downstream and source != reader:
+                    self.downstream[source].add(reader)
+
+    def fingerprints(self, idea_description: str, target_audience: str,
+                     additional_context: Dict[str, Any]) -> Dict[str, str]:
+        """Input fingerprint of every layer; a layer's fingerprint covers its dependencies' fingerprints"""
+        fingerprints: Dict[str, str] = {}
+        visiting: Set[str] = set()
+
+        def fingerprint(layer: str) -> str:
+            if layer in fingerprints:
+                return fingerprints[layer]
+            visiting.add(layer)
+            ctx = self.layer_contexts[layer]
+            # Dependencies inside a cycle are left out; downstream() still links them
+            dependency_fingerprints = {
+                dep: fingerprint(dep) for dep in sorted(ctx.dependencies)
+                if dep in self.layer_contexts and dep not in visiting
+            }
+            visiting.discard(layer)
+            payload = json.dumps(
+                [idea_description, target_audience, ctx.persona, additional_context or {}, dependency_fingerprints],
+                sort_keys=True, default=str
+            )
+            fingerprints[layer] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+            return fingerprints[layer]
+
+        for layer in self.layer_contexts:
+            fingerprint(layer)
+        return fingerprints
+
+    def with_dependents(self, layers: Iterable[str]) -> Set[str]:
+        """The given layers plus every layer downstream of them (dependents and summary readers)"""
+        affected: Set[str] = set()
+        pending: List[str] = [layer for layer in layers if layer in self.downstream]
+        while pending:
+            layer = pending.pop()
+            if layer not in affected:
+                affected.add(layer)
+                pending.extend(self.downstream[layer] - affected)
+        return affected
+
+    def stale_layers(self, previous: Dict[str, Optional[str]], current: Dict[str, str]) -> Set[str]:
+        """Layers to re-analyze: changed (or never fingerprinted) layers and their dependents"""
+        changed = [layer for layer, fingerprint in current.items() if previous.get(layer) != fingerprint]
+        return self.with_dependents(changed)
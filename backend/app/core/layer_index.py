@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Layer Hierarchy Index for Validatus Platform
+Immutable, import-time index of the Segment → Factor → Layer hierarchy with O(1) layer lookups
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+
+from app.scoring.layer_scorers import LAYER_FRAMEWORK_MAP
+
+class LayerType(Enum):
+    """Types of analysis layers"""
+    CONSUMER_INSIGHTS = "consumer_insights"
+    MARKET_RESEARCH = "market_research"
+    COMPETITOR_ANALYSIS = "competitor_analysis"
+    TREND_ANALYSIS = "trend_analysis"
+    PRICING_RESEARCH = "pricing_research"
+
+class AnalysisDomain(Enum):
+    """Analysis domains for specialized agents"""
+    CONSUMER_INSIGHTS = "consumer_insights"
+    MARKET_RESEARCH = "market_research"
+    COMPETITOR_ANALYSIS = "competitor_analysis"
+    PRODUCT_STRATEGY = "product_strategy"
+    BRAND_STRATEGY = "brand_strategy"
+    UX_STRATEGY = "ux_strategy"
+    FINANCIAL_ANALYSIS = "financial_analysis"
+    TECHNICAL_ANALYSIS = "technical_analysis"
+    TREND_ANALYSIS = "trend_analysis"
+    RISK_ASSESSMENT = "risk_assessment"
+
+# Segment → Factor → Layer hierarchy implementing all 156 layers
+ANALYTICAL_FRAMEWORK_STRUCTURE = {
+    "CONSUMER": {
+        "factors": {
+            "Consumer Demand & Need": [
+                "need_perception", "trust_level", "purchase_intent", "emotional_pull", "awareness",
+                "social_influence", "accessibility", "value_perception", "trend_alignment", "price_sensitivity"
+            ],
+            "Consumer Behavior & Habits": [
+                "usage_frequency", "engagement_level", "habit_formation", "emotional_tie", "ease_of_access",
+                "trust_in_usage", "interaction_rate", "perceived_value", "social_engagement", "incentives"
+            ],
+            "Consumer Loyalty & Retention": [
+                "repeat_purchase", "trust_level_retention", "value_perception_loyalty", "advocacy", "social_loyalty",
+                "emotional_bond", "switching_cost", "engagement_loyalty", "rewards", "access_loyalty"
+            ],
+            "Consumer Perception & Sentiment": [
+                "sentiment", "quality_perception", "value_perception_sentiment", "innovation_perception", "trend_alignment_sentiment",
+                "trust_perception", "prestige", "social_impact", "awareness_sentiment", "access_perception"
+            ],
+            "Consumer Adoption & Engagement": [
+                "adoption_rate", "trust_in_adoption", "value_perception_adoption", "frequency", "trend_alignment_adoption",
+                "engagement_adoption", "social_influence_adoption", "emotional_pull_adoption", "accessibility_adoption", "incentives_adoption"
+            ]
+        },
+        "agent": "consumer_insights"
+    },
+    "MARKET": {
+        "factors": {
+            "market_trends": [
+                "future_trends", "technological_shifts", "current_trends", "cultural_shift", "regulatory_shifts"
+            ],
+            "Market Competition and Barriers": [
+                "rival_strength", "entry_barriers", "differentiation_advantage", "customer_switching_costs", "regulatory_barriers"
+            ],
+            "Market Demand and Adoption": [
+                "demand_volume", "demand_growth", "adoption_rate", "price_elasticity", "market_accessibility"
+            ],
+            "Market Growth and Expansion": [
+                "growth_potential", "regional_growth", "scalability_capacity", "investment_in_growth", "infrastructure_support"
+            ],
+            "Market Stability and Risk": [
+                "economic_stability", "political_stability", "supply_chain_stability", "risk_exposure", "regulatory_stability"
+            ]
+        },
+        "agent": "market_research"
+    },
+    "PRODUCT": {
+        "factors": {
+            "Product Market Readiness": [
+                "entry_timing", "mid_cycle_impact", "market_saturation"
+            ],
+            "Product Competitive Disruption": [
+                "base_disruption", "incumbent_resistance", "response_time"
+            ],
+            "Product Dynamic Disruption": [
+                "base_disruption_dynamic", "product_strength", "awareness_width", "value_perception_dynamic", 
+                "adoption_growth", "error_perception", "retention_effect", "competitor_pull", "value_consistency"
+            ],
+            "Product Business Resilience": [
+                "profit_resilience", "expansion_growth"
+            ],
+            "Product Hype Cycle": [
+                "mid_cycle_buzz", "market_saturation_hype", "entry_timing_hype"
+            ],
+            "Product Quality Assurance": [
+                "material_quality", "functional_quality", "brand_trust", "complaint_rate", "social_verdict"
+            ],
+            "Product Differentiation": [
+                "tech_features", "competitor_strength"
+            ],
+            "Product Brand Perception": [
+                "ad_reach", "organic_buzz"
+            ],
+            "Product Experience Design": [
+                "visual_appeal", "haptic_feedback", "olfactory_appeal"
+            ],
+            "Product Innovation Lifecycle": [
+                "market_fit", "entry_barrier", "tech_gap"
+            ]
+        },
+        "agent": "product_strategist"
+    },
+    "BRAND": {
+        "factors": {
+            "Brand Positioning Strategy": [
+                "heritage_legacy", "innovation_edge", "public_perception", "exclusivity_factor", "competitor_edge"
+            ],
+            "Brand Equity Profile": [
+                "review_score", "social_sentiment", "legacy_trust", "ai_driven_trust", "crisis_handling"
+            ],
+            "Brand Virality Impact": [
+                "shareability_rate", "influencer_push", "platform_fit", "cultural_embed"
+            ],
+            "Brand Monetization Model": [
+                "direct_sales", "licensing_deals", "pricing_power", "revenue_diversification"
+            ],
+            "Brand Longevity Outlook": [
+                "evolution_adapt", "generational_appeal", "resilience_factor", "esg_adaptation", "cultural_relevance"
+            ]
+        },
+        "agent": "brand_strategist"
+    },
+    "EXPERIENCE": {
+        "factors": {
+            "User Engagement Metrics": [
+                "attention_focus", "interaction_rate", "community_activity", "emotional_pull", "user_flow"
+            ],
+            "Satisfaction Feedback": [
+                "value_perception", "sentiment_feedback", "support_quality", "expectation_match"
+            ],
+            "Interaction Design Elements": [
+                "usability_ease", "intuitive_design", "sensory_appeal", "personalization", "access_inclusivity"
+            ],
+            "Post-Purchase Loyalty": [
+                "repeat_usage", "emotional_bond", "practical_retention", "advocacy_power", "incentive_reward"
+            ],
+            "Experience Evolution": [
+                "feature_updates", "trend_alignment", "cognitive_shift", "ai_adaptation"
+            ]
+        },
+        "agent": "ux_strategist"
+    }
+}
+
+# Layer to agent mapping for optimal analysis
+LAYER_DOMAIN_OVERRIDES = {
+    # Consumer layers
+    "need_perception": AnalysisDomain.CONSUMER_INSIGHTS,
+    "purchase_intent": AnalysisDomain.CONSUMER_INSIGHTS,
+    "emotional_pull": AnalysisDomain.CONSUMER_INSIGHTS,
+    "trust_level": AnalysisDomain.CONSUMER_INSIGHTS,
+    "loyalty_metrics": AnalysisDomain.CONSUMER_INSIGHTS,
+    "adoption_patterns": AnalysisDomain.CONSUMER_INSIGHTS,
+    
+    # Market layers
+    "market_size": AnalysisDomain.MARKET_RESEARCH,
+    "growth_rate": AnalysisDomain.MARKET_RESEARCH,
+    "market_trends": AnalysisDomain.MARKET_RESEARCH,
+    "regulatory_environment": AnalysisDomain.MARKET_RESEARCH,
+    "economic_factors": AnalysisDomain.MARKET_RESEARCH,
+    
+    # Competitor layers
+    "competitor_analysis": AnalysisDomain.COMPETITOR_ANALYSIS,
+    "competitive_positioning": AnalysisDomain.COMPETITOR_ANALYSIS,
+    "market_share": AnalysisDomain.COMPETITOR_ANALYSIS,
+    "competitive_advantages": AnalysisDomain.COMPETITOR_ANALYSIS,
+    
+    # Product layers
+    "product_features": AnalysisDomain.PRODUCT_STRATEGY,
+    "innovation_level": AnalysisDomain.PRODUCT_STRATEGY,
+    "technical_feasibility": AnalysisDomain.TECHNICAL_ANALYSIS,
+    "quality_metrics": AnalysisDomain.PRODUCT_STRATEGY,
+    "differentiation": AnalysisDomain.PRODUCT_STRATEGY,
+    
+    # Brand layers
+    "brand_positioning": AnalysisDomain.BRAND_STRATEGY,
+    "brand_equity": AnalysisDomain.BRAND_STRATEGY,
+    "marketing_strategy": AnalysisDomain.BRAND_STRATEGY,
+    "brand_awareness": AnalysisDomain.BRAND_STRATEGY,
+    
+    # Experience layers
+    "user_experience": AnalysisDomain.UX_STRATEGY,
+    "usability": AnalysisDomain.UX_STRATEGY,
+    "design_quality": AnalysisDomain.UX_STRATEGY,
+    "customer_satisfaction": AnalysisDomain.UX_STRATEGY,
+    
+    # Financial layers
+    "revenue_model": AnalysisDomain.FINANCIAL_ANALYSIS,
+    "cost_structure": AnalysisDomain.FINANCIAL_ANALYSIS,
+    "profitability": AnalysisDomain.FINANCIAL_ANALYSIS,
+    "financial_risks": AnalysisDomain.RISK_ASSESSMENT,
+    
+    # Risk layers
+    "operational_risks": AnalysisDomain.RISK_ASSESSMENT,
+    "market_risks": AnalysisDomain.RISK_ASSESSMENT,
+    "strategic_risks": AnalysisDomain.RISK_ASSESSMENT,
+    
+    # Trend layers
+    "industry_trends": AnalysisDomain.TREND_ANALYSIS,
+    "technology_trends": AnalysisDomain.TREND_ANALYSIS,
+    "consumer_trends": AnalysisDomain.TREND_ANALYSIS
+}
+
+# Keyword rules used to classify layers, evaluated in order
+LAYER_TYPE_RULES: Tuple[Tuple[Tuple[str, ...], LayerType], ...] = (
+    (('consumer', 'need', 'purchase', 'loyalty', 'sentiment'), LayerType.CONSUMER_INSIGHTS),
+    (('market', 'trend', 'competition', 'growth'), LayerType.MARKET_RESEARCH),
+    (('competitor', 'rival', 'market_share'), LayerType.COMPETITOR_ANALYSIS),
+    (('trend', 'innovation', 'technology'), LayerType.TREND_ANALYSIS),
+    (('pricing', 'cost', 'value'), LayerType.PRICING_RESEARCH),
+)
+
+DOMAIN_RULES: Tuple[Tuple[Tuple[str, ...], AnalysisDomain], ...] = (
+    (('consumer', 'user', 'customer', 'need', 'behavior'), AnalysisDomain.CONSUMER_INSIGHTS),
+    (('market', 'industry', 'growth', 'trend'), AnalysisDomain.MARKET_RESEARCH),
+    (('competitor', 'competition', 'positioning'), AnalysisDomain.COMPETITOR_ANALYSIS),
+    (('product', 'feature', 'innovation'), AnalysisDomain.PRODUCT_STRATEGY),
+    (('brand', 'marketing', 'awareness'), AnalysisDomain.BRAND_STRATEGY),
+    (('experience', 'design', 'usability'), AnalysisDomain.UX_STRATEGY),
+    (('financial', 'revenue', 'cost', 'profit'), AnalysisDomain.FINANCIAL_ANALYSIS),
+    (('technical', 'technology', 'architecture'), AnalysisDomain.TECHNICAL_ANALYSIS),
+    (('trend', 'future', 'forecast'), AnalysisDomain.TREND_ANALYSIS),
+    (('risk', 'threat', 'vulnerability'), AnalysisDomain.RISK_ASSESSMENT),
+)
+
+DEFAULT_SCORING_FRAMEWORK = "sentiment"
+
+def classify_layer_type(layer_name: str) -> LayerType:
+    """Determine layer type from layer name"""
+    layer_lower = layer_name.lower()
+    for keywords, layer_type in LAYER_TYPE_RULES:
+        if any(term in layer_lower for term in keywords):
+            return layer_type
+    return LayerType.CONSUMER_INSIGHTS  # Default
+
+def classify_layer_domain(layer_name: str) -> AnalysisDomain:
+    """Determine the optimal agent domain for a layer name"""
+    if layer_name in LAYER_DOMAIN_OVERRIDES:
+        return LAYER_DOMAIN_OVERRIDES[layer_name]
+    
+    layer_lower = layer_name.lower()
+    for keywords, domain in DOMAIN_RULES:
+        if any(keyword in layer_lower for keyword in keywords):
+            return domain
+    
+    # Default to market research for general analysis
+    return AnalysisDomain.MARKET_RESEARCH
+
+@dataclass(frozen=True)
+class LayerInfo:
+    """Resolved placement and routing information for a single layer"""
+    layer: str
+    segment: str
+    factor: str
+    layer_type: LayerType
+    domain: AnalysisDomain
+    scoring_framework: str
+    
+    @property
+    def hierarchy_path(self) -> str:
+        return f"Segment: {self.segment} → Factor: {self.factor} → Layer: {self.layer}"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "layer": self.layer,
+            "segment": self.segment,
+            "factor": self.factor,
+            "layer_type": self.layer_type.value,
+            "domain": self.domain.value,
+            "scoring_framework": self.scoring_framework
+        }
+
+class LayerHierarchyIndex:
+    """
+    Read-only index over the analytical hierarchy.
+    Layer names that appear in several factors resolve to their first placement,
+    matching the order of ANALYTICAL_FRAMEWORK_STRUCTURE; all placements are kept.
+    """
+    
+    def __init__(self, structure: Dict[str, Dict[str, Any]]):
+        placements: Dict[str, List[LayerInfo]] = {}
+        segment_factors: Dict[str, Tuple[str, ...]] = {}
+        factor_layers: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        ordered: List[LayerInfo] = []
+        
+        for segment, segment_data in structure.items():
+            segment_factors[segment] = tuple(segment_data["factors"].keys())
+            for factor, layers in segment_data["factors"].items():
+                factor_layers[(segment, factor)] = tuple(layers)
+                for layer in layers:
+                    info = LayerInfo(
+                        layer=layer,
+                        segment=segment,
+                        factor=factor,
+                        layer_type=classify_layer_type(layer),
+                        domain=classify_layer_domain(layer),
+                        scoring_framework=LAYER_FRAMEWORK_MAP.get(layer, DEFAULT_SCORING_FRAMEWORK)
+                    )
+                    placements.setdefault(layer, []).append(info)
+                    ordered.append(info)
+        
+        self._entries: Tuple[LayerInfo, ...] = tuple(ordered)
+        self._placements = MappingProxyType({layer: tuple(infos) for layer, infos in placements.items()})
+        self._by_layer = MappingProxyType({layer: infos[0] for layer, infos in placements.items()})
+        self._segment_factors = MappingProxyType(segment_factors)
+        self._factor_layers = MappingProxyType(factor_layers)
+    
+    def __contains__(self, layer_name: str) -> bool:
+        return layer_name in self._by_layer
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __iter__(self) -> Iterator[LayerInfo]:
+        return iter(self._entries)
+    
+    def get(self, layer_name: str) -> Optional[LayerInfo]:
+        """Get the primary placement of a layer, or None if it is not in the hierarchy"""
+        return self._by_layer.get(layer_name)
+    
+    def placements(self, layer_name: str) -> Tuple[LayerInfo, ...]:
+        """Get every placement of a layer across segments and factors"""
+        return self._placements.get(layer_name, ())
+    
+    @property
+    def segments(self) -> Tuple[str, ...]:
+        return tuple(self._segment_factors.keys())
+    
+    def segment_factors(self, segment: str) -> Tuple[str, ...]:
+        return self._segment_factors.get(segment, ())
+    
+    def factor_layers(self, segment: str, factor: str) -> Tuple[str, ...]:
+        return self._factor_layers.get((segment, factor), ())
+    
+    def segment_factor(self, layer_name: str) -> Optional[Tuple[str, str]]:
+        info = self._by_layer.get(layer_name)
+        return (info.segment, info.factor) if info else None
+    
+    def layer_type(self, layer_name: str) -> LayerType:
+        info = self._by_layer.get(layer_name)
+        return info.layer_type if info else classify_layer_type(layer_name)
+    
+    def domain(self, layer_name: str) -> AnalysisDomain:
+        info = self._by_layer.get(layer_name)
+        return info.domain if info else classify_layer_domain(layer_name)
+    
+    def scoring_framework(self, layer_name: str) -> str:
+        info = self._by_layer.get(layer_name)
+        return info.scoring_framework if info else LAYER_FRAMEWORK_MAP.get(layer_name, DEFAULT_SCORING_FRAMEWORK)
+    
+    def hierarchy_path(self, layer_name: str) -> str:
+        info = self._by_layer.get(layer_name)
+        return info.hierarchy_path if info else f"Layer: {layer_name}"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index for API responses"""
+        return {
+            "total_layers": len(self._entries),
+            "unique_layers": len(self._by_layer),
+            "segments": {
+                segment: {factor: list(self._factor_layers[(segment, factor)]) for factor in factors}
+                for segment, factors in self._segment_factors.items()
+            },
+            "layers": [info.to_dict() for info in self._entries]
+        }
+
+# Built once at import and shared by the framework, agents, workflow and API
+LAYER_INDEX = LayerHierarchyIndex(ANALYTICAL_FRAMEWORK_STRUCTURE)
+
+def get_layer_index() -> LayerHierarchyIndex:
+    """Get the shared layer hierarchy index"""
+    return LAYER_INDEX
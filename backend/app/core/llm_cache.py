@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Content-addressed LLM response cache for the Multi-LLM Orchestrator
+Two tiers: a bounded in-memory LRU and an on-disk SQLite store, both with per-entry TTL
+"""
+
+import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger("llm.cache")
+
+class LLMResponseCache:
+    """LRU + SQLite cache of successful LLM analyses keyed on (provider, model, prompt, context)"""
+
+    def __init__(self, db_path: Optional[str], max_entries: int = 1024, default_ttl: float = 86400.0):
+        self.db_path = db_path
+        self.max_entries = max(1, max_entries)
+        self.default_ttl = default_ttl
+
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.stats = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0,
+                      "latency_saved": 0.0, "cost_saved": 0.0}
+
+        if db_path:
+            try:
+                directory = os.path.dirname(db_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._conn = sqlite3.connect(db_path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_responses ("
+                    "key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                self._conn.commit()
+            except Exception as e:
+                logger.warning(f"⚠️ LLM cache disk tier unavailable, using memory only: {e}")
+                self._conn = None
+
+    @staticmethod
+    def make_key(provider: str, model: str, query: str, context: Optional[Dict[str, Any]]) -> str:
+        """Build a content address from the provider, model, normalized prompt and context"""
+        normalized_query = re.sub(r'\s+', ' ', query or '').strip()
+        material = json.dumps(
+            {"provider": provider, "model": model, "query": normalized_query, "context": context or {}},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached payload, checking memory first and then disk"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and entry[0] > now:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return entry[1]
+            if entry:
+                del self._memory[key]
+
+        if self._conn is None:
+            return None
+
+        row = await asyncio.to_thread(self._disk_get, key, now)
+        if not row:
+            return None
+
+        expires_at, payload = row
+        self._remember(key, expires_at, payload)
+        self.stats["disk_hits"] += 1
+        return payload
+
+    async def set(self, key: str, payload: Dict[str, Any], ttl: Optional[float] = None):
+        """Store a payload in both tiers with its own TTL"""
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        self._remember(key, expires_at, payload)
+
+        if self._conn is not None:
+            await asyncio.to_thread(self._disk_set, key, payload, expires_at)
+
+    def record_hit(self, latency_saved: float, cost_saved: float):
+        self.stats["hits"] += 1
+        self.stats["latency_saved"] += latency_saved
+        self.stats["cost_saved"] += cost_saved
+
+    def record_miss(self):
+        self.stats["misses"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_enabled": self._conn is not None
+        }
+
+    def _remember(self, key: str, expires_at: float, payload: Dict[str, Any]):
+        with self._lock:
+            self._memory[key] = (expires_at, payload)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, Dict[str, Any]]]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, expires_at FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and row[1] <= now:
+                    self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                    return None
+            return (row[1], json.loads(row[0])) if row else None
+        except Exception as e:
+            logger.warning(f"⚠️ LLM cache read failed: {e}")
+            return None
+
+    def _disk_set(self, key: str, payload: Dict[str, Any], expires_at: float):
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, payload, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(payload, default=str), expires_at)
+                )
+                self._conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),))
+                self._conn.commit()
+        except Exception as e:
+            logger.warning(f"⚠️ LLM cache write failed: {e}")
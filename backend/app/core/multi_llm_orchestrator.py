@@ -6,11 +6,21 @@ import httpx
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import json
+import time
 import logging
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, replace
 from enum import Enum
 import numpy as np
 from config import settings
+from app.core.llm_cache import LLMResponseCache
+from app.core.provider_router import AdaptiveProviderRouter
+from app.core.circuit_breaker import get_circuit_breaker, get_circuit_breaker_states
+from app.core.rate_limiter import get_provider_rate_limiter, get_rate_limiter_stats, estimate_tokens
+from app.core.http_client import get_http_client
+
+# Converts token counts for providers priced per word
+WORDS_PER_TOKEN = 0.75
 
 class ConsensusMethod(Enum):
     """Methods for building consensus across multiple LLMs"""
@@ -39,6 +49,7 @@ class OpenAIAgent:
     def __init__(self, model: str = 'gpt-4o-mini'):
         self.model = model
         self.client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self.rate_limiter = get_provider_rate_limiter("openai")
         self.logger = logging.getLogger(f"llm.openai.{model}")
     
     async def analyze(self, query: str, context: Dict[str, Any] = None) -> LLMAnalysisResult:
@@ -52,15 +63,17 @@ class OpenAIAgent:
             else:
                 system_prompt = self._build_system_prompt(context)
             
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": query}
-                ],
-                temperature=0.3,
-                max_tokens=2000
-            )
+            async with self.rate_limiter.reserve(estimate_tokens(system_prompt, query, max_output_tokens=2000)) as reservation:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": query}
+                    ],
+                    temperature=0.3,
+                    max_tokens=2000
+                )
+                reservation.record(response.usage.total_tokens)
             
             analysis = response.choices[0].message.content
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -187,6 +200,10 @@ class OpenAIAgent:
         cost_per_1k = 0.005  # $0.005 per 1K tokens
         return (tokens / 1000) * cost_per_1k
     
+    def estimate_call_cost(self, tokens: int) -> float:
+        """Estimated cost of a call of ``tokens`` tokens"""
+        return self._estimate_cost(tokens)
+    
     def _build_json_prompt(self, query: str, context: Dict[str, Any] = None) -> str:
         """Build a prompt specifically for JSON-structured strategic analysis"""
         return f"""You are an expert business strategist. Analyze: "{query}"
@@ -226,6 +243,7 @@ class AnthropicAgent:
     def __init__(self, model: str = 'claude-3-5-sonnet-20241022'):
         self.model = model
         self.client = anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.rate_limiter = get_provider_rate_limiter("anthropic")
         self.logger = logging.getLogger(f"llm.anthropic.{model}")
     
     async def analyze(self, query: str, context: Dict[str, Any] = None) -> LLMAnalysisResult:
@@ -235,14 +253,16 @@ class AnthropicAgent:
         try:
             system_prompt = self._build_system_prompt(context)
             
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": query}
-                ]
-            )
+            async with self.rate_limiter.reserve(estimate_tokens(system_prompt, query, max_output_tokens=2000)) as reservation:
+                response = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=2000,
+                    system=system_prompt,
+                    messages=[
+                        {"role": "user", "content": query}
+                    ]
+                )
+                reservation.record(response.usage.input_tokens + response.usage.output_tokens)
             
             analysis = response.content[0].text
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -368,6 +388,10 @@ class AnthropicAgent:
         """Estimate cost based on token usage"""
         cost_per_1k = 0.003  # $0.003 per 1K tokens for Claude
         return (tokens / 1000) * cost_per_1k
+    
+    def estimate_call_cost(self, tokens: int) -> float:
+        """Estimated cost of a call of ``tokens`` tokens"""
+        return self._estimate_cost(tokens)
 
 class PerplexityAgent:
     """Perplexity Sonar agent for strategic analysis with current market focus"""
@@ -376,6 +400,7 @@ class PerplexityAgent:
         self.model = model
         self.base_url = "https://api.perplexity.ai"
         self.api_key = settings.PERPLEXITY_API_KEY
+        self.rate_limiter = get_provider_rate_limiter("perplexity")
         self.logger = logging.getLogger(f"llm.perplexity.{model}")
     
     async def analyze(self, query: str, context: Dict[str, Any] = None) -> LLMAnalysisResult:
@@ -383,11 +408,11 @@ class PerplexityAgent:
         start_time = datetime.now()
         
         try:
-            import httpx
-            
             enhanced_query = self._build_enhanced_query(query, context)
+            system_prompt = self._build_system_prompt(context)
             
-            async with httpx.AsyncClient() as client:
+            client = get_http_client(self.base_url)
+            async with self.rate_limiter.reserve(estimate_tokens(system_prompt, enhanced_query, max_output_tokens=2000)) as reservation:
                 response = await client.post(
                     f"{self.base_url}/chat/completions",
                     headers={
@@ -399,7 +424,7 @@ class PerplexityAgent:
                         "messages": [
                             {
                                 "role": "system",
-                                "content": self._build_system_prompt(context)
+                                "content": system_prompt
                             },
                             {
                                 "role": "user",
@@ -411,29 +436,30 @@ class PerplexityAgent:
                     },
                     timeout=60.0
                 )
-                
+            
                 response.raise_for_status()
                 data = response.json()
-                
-                analysis = data['choices'][0]['message']['content']
-                execution_time = (datetime.now() - start_time).total_seconds()
-                
-                key_insights = self._extract_key_insights(analysis)
-                recommendations = self._extract_recommendations(analysis)
-                confidence = self._calculate_confidence(analysis, key_insights, recommendations)
-                cost = self._estimate_cost(len(analysis.split()))
-                
-                return LLMAnalysisResult(
-                    model_name=f"Perplexity-{self.model}",
-                    analysis=analysis,
-                    confidence=confidence,
-                    key_insights=key_insights,
-                    recommendations=recommendations,
-                    execution_time=execution_time,
-                    cost=cost,
-                    timestamp=datetime.now(),
-                    metadata={"word_count": len(analysis.split()), "market_focus": "current"}
-                )
+                reservation.record(data.get('usage', {}).get('total_tokens'))
+            
+            analysis = data['choices'][0]['message']['content']
+            execution_time = (datetime.now() - start_time).total_seconds()
+            
+            key_insights = self._extract_key_insights(analysis)
+            recommendations = self._extract_recommendations(analysis)
+            confidence = self._calculate_confidence(analysis, key_insights, recommendations)
+            cost = self._estimate_cost(len(analysis.split()))
+            
+            return LLMAnalysisResult(
+                model_name=f"Perplexity-{self.model}",
+                analysis=analysis,
+                confidence=confidence,
+                key_insights=key_insights,
+                recommendations=recommendations,
+                execution_time=execution_time,
+                cost=cost,
+                timestamp=datetime.now(),
+                metadata={"word_count": len(analysis.split()), "market_focus": "current"}
+            )
                 
         except Exception as e:
             self.logger.error(f"Perplexity analysis failed: {str(e)}")
@@ -556,6 +582,10 @@ class PerplexityAgent:
         """Estimate cost based on word count"""
         cost_per_1k_words = 0.0002  # $0.0002 per 1K words
         return (word_count / 1000) * cost_per_1k_words
+    
+    def estimate_call_cost(self, tokens: int) -> float:
+        """Estimated cost of a call of ``tokens`` tokens (priced per word)"""
+        return self._estimate_cost(int(tokens * WORDS_PER_TOKEN))
 
 class GoogleGeminiAgent:
     """Google Gemini agent for strategic analysis"""
@@ -564,6 +594,7 @@ class GoogleGeminiAgent:
         self.model = model
         # Don't configure API key here - do it just before the API call
         self.model_instance = None
+        self.rate_limiter = get_provider_rate_limiter("google_gemini")
         self.logger = logging.getLogger(f"llm.gemini.{model}")
     
     async def analyze(self, query: str, context: Dict[str, Any] = None) -> LLMAnalysisResult:
@@ -594,7 +625,10 @@ class GoogleGeminiAgent:
             ]
             
             # Generate content using Gemini with adjusted safety settings
-            response = await self.model_instance.generate_content_async(prompt, safety_settings=safety_settings)
+            async with self.rate_limiter.reserve(estimate_tokens(prompt, max_output_tokens=2000)) as reservation:
+                response = await self.model_instance.generate_content_async(prompt, safety_settings=safety_settings)
+                usage = getattr(response, 'usage_metadata', None)
+                reservation.record(getattr(usage, 'total_token_count', None))
             
             # Validate response
             if not response or not response.candidates:
@@ -867,6 +901,10 @@ Return ONLY the JSON object."""
         """Estimate cost based on word count"""
         cost_per_1k_words = 0.0001  # $0.0001 per 1K words for Gemini
         return (word_count / 1000) * cost_per_1k_words
+    
+    def estimate_call_cost(self, tokens: int) -> float:
+        """Estimated cost of a call of ``tokens`` tokens (priced per word)"""
+        return self._estimate_cost(int(tokens * WORDS_PER_TOKEN))
 
 class MultiLLMOrchestrator:
     """Orchestrate multiple LLMs for comprehensive analysis with robust fallback chain"""
@@ -881,6 +919,30 @@ class MultiLLMOrchestrator:
         
         # Fallback chain priority (order matters) - User specified priority
         self.fallback_chain = ['google_gemini', 'perplexity_sonar', 'openai_gpt4', 'anthropic_claude']
+        
+        # Adaptive routing reorders the fallback chain from observed latency, errors and cost
+        self.router = None
+        if settings.LLM_ROUTING_MODE == "adaptive":
+            self.router = AdaptiveProviderRouter(
+                self.fallback_chain,
+                cost_ceiling=settings.LLM_ROUTING_COST_CEILING,
+                window=settings.LLM_ROUTING_WINDOW,
+                default_latency=settings.LLM_ROUTING_DEFAULT_LATENCY,
+                known_costs={
+                    name: agent.estimate_call_cost(settings.LLM_ROUTING_TYPICAL_CALL_SIZE)
+                    for name, agent in self.llm_agents.items()
+                }
+            )
+        
+        # Optional content-addressed response cache
+        self.response_cache = None
+        if settings.LLM_CACHE_ENABLED:
+            self.response_cache = LLMResponseCache(
+                db_path=settings.LLM_CACHE_PATH or None,
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+                default_ttl=settings.LLM_CACHE_TTL_SECONDS
+            )
+            self.logger.info(f"✅ LLM response cache enabled (TTL {settings.LLM_CACHE_TTL_SECONDS}s)")
     
     def _initialize_agents(self):
         """Initialize available LLM agents based on API keys - User specified priority order"""
@@ -954,7 +1016,7 @@ class MultiLLMOrchestrator:
         try:
             self.logger.info(f"🚀 Starting consensus analysis with {len(self.llm_agents)} agents")
             self.logger.info(f"📋 Available agents: {list(self.llm_agents.keys())}")
-            self.logger.info(f"🎯 Fallback priority: {' → '.join(self.fallback_chain)}")
+            self.logger.info(f"🎯 Fallback priority: {' → '.join(self._routing_order())}")
             
             # Try fallback chain approach first
             self.logger.info("🔄 Attempting fallback chain analysis...")
@@ -982,54 +1044,25 @@ class MultiLLMOrchestrator:
         Try analysis using the fallback chain - one model at a time until one succeeds.
         Follows user-specified priority: Gemini → Perplexity → OpenAI → Anthropic
         """
-        self.logger.info(f"🚀 Starting fallback chain with priority: {' → '.join(self.fallback_chain)}")
+        chain = self._routing_order()
+        self.logger.info(f"🚀 Starting fallback chain with priority: {' → '.join(chain)}")
         
-        for i, model_name in enumerate(self.fallback_chain, 1):
+        if settings.LLM_HEDGING_ENABLED:
+            return await self._try_hedged_fallback_chain(chain, query, context)
+        
+        for i, model_name in enumerate(chain, 1):
             if model_name not in self.llm_agents:
                 self.logger.warning(f"⚠️ {model_name} not available, skipping...")
                 continue
                 
             try:
-                self.logger.info(f"🎯 Trying {model_name} (Priority {i}/{len(self.fallback_chain)})...")
+                self.logger.info(f"🎯 Trying {model_name} (Priority {i}/{len(chain)})...")
                 
-                # Use retry mechanism for each model
-                result = await self._retry_with_backoff(
-                    lambda: self.llm_agents[model_name].analyze(query, context),
-                    max_retries=2,  # Reduced retries for faster fallback
-                    initial_delay=0.5  # Faster initial delay
-                )
+                result = await self._attempt_provider(model_name, query, context)
                 
                 if result and result.confidence > 0:
                     self.logger.info(f"✅ {model_name} succeeded in fallback chain!")
-                    
-                    # Create consensus-like structure from single successful result
-                    consensus = {
-                        "analysis": f"Fallback Chain Analysis - {model_name} succeeded\n\n{result.analysis}",
-                        "consensus_insights": result.key_insights,
-                        "consensus_recommendations": result.recommendations,
-                        "confidence": result.confidence,
-                        "successful_model": model_name,
-                        "method": "fallback_chain",
-                        "priority_used": i,
-                        "market_focus": "current"
-                    }
-                    
-                    return {
-                        "consensus": consensus,
-                        "individual_results": [self._result_to_dict(result)],
-                        "failed_results": [],
-                        "consensus_method": "fallback_chain",
-                        "aggregate_metrics": {
-                            "total_cost": result.cost,
-                            "average_confidence": result.confidence,
-                            "total_execution_time": result.execution_time,
-                            "successful_analyses": 1,
-                            "failed_analyses": 0,
-                            "priority_used": i
-                        },
-                        "market_focus": "current",
-                        "timestamp": datetime.now().isoformat()
-                    }
+                    return self._fallback_chain_response(model_name, i, result)
                     
             except Exception as e:
                 error_msg = str(e)
@@ -1042,11 +1075,231 @@ class MultiLLMOrchestrator:
         self.logger.error("💥 All models in fallback chain failed")
         return None
     
+    async def _try_hedged_fallback_chain(self, chain: List[str], query: str,
+                                         context: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fallback chain with hedging: if the newest attempt has not answered within its
+        provider's observed p95, the next provider is fired in parallel. The first valid
+        result wins and the remaining attempts are cancelled.
+        """
+        candidates = [name for name in chain if name in self.llm_agents]
+        pending: Dict[asyncio.Task, Tuple[str, int]] = {}
+        launch_times: Dict[asyncio.Task, float] = {}
+        max_parallel = max(1, settings.LLM_HEDGE_MAX_PARALLEL)
+        launched = 0
+        
+        def launch():
+            nonlocal launched
+            model_name = candidates[launched]
+            launched += 1
+            self.logger.info(f"🎯 Trying {model_name} (Priority {launched}/{len(candidates)})...")
+            task = asyncio.create_task(self._attempt_provider(model_name, query, context))
+            pending[task] = (model_name, launched)
+            launch_times[task] = time.perf_counter()
+        
+        if not candidates:
+            self.logger.error("💥 No models available in fallback chain")
+            return None
+        
+        launch()
+        try:
+            while pending:
+                timeout = None
+                if launched < len(candidates) and len(pending) < max_parallel:
+                    # Hedge once the newest attempt has run past its provider's p95
+                    newest = max(pending, key=launch_times.get)
+                    hedge_delay = self._hedge_delay(pending[newest][0])
+                    timeout = max(0.0, hedge_delay - (time.perf_counter() - launch_times[newest]))
+                done, _ = await asyncio.wait(pending.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not done:
+                    self.logger.info(f"⏱️ {pending[newest][0]} exceeded {hedge_delay:.1f}s, hedging with {candidates[launched]}")
+                    launch()
+                    continue
+                
+                for task in done:
+                    model_name, priority = pending.pop(task)
+                    launch_times.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        self.logger.warning(f"❌ {model_name} failed: {str(e)}")
+                        result = None
+                    
+                    if result and result.confidence > 0:
+                        self.logger.info(f"✅ {model_name} won hedged fallback chain ({launched} providers fired)")
+                        response = self._fallback_chain_response(model_name, priority, result)
+                        response["aggregate_metrics"]["hedged_requests"] = launched - 1
+                        return response
+                
+                # Every finished attempt failed: move on to the next provider
+                if launched < len(candidates) and len(pending) < max_parallel:
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let the losers release their breaker and rate-limiter slots before returning
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        self.logger.error("💥 All models in fallback chain failed")
+        return None
+    
+    def _hedge_delay(self, model_name: str) -> float:
+        """Seconds to wait on a provider before hedging: its observed p95, else the configured default"""
+        p95 = self.router.p95(model_name) if self.router is not None else None
+        if p95 is None:
+            return settings.LLM_HEDGE_DEFAULT_DELAY
+        return max(settings.LLM_HEDGE_MIN_DELAY, p95)
+    
+    async def _attempt_provider(self, model_name: str, query: str, context: Dict[str, Any] = None) -> Optional[LLMAnalysisResult]:
+        """Single fallback-chain attempt against one provider with a short retry budget"""
+        return await self._retry_with_backoff(
+            lambda: self._analyze_with_cache(model_name, query, context),
+            max_retries=2,  # Reduced retries for faster fallback
+            initial_delay=0.5  # Faster initial delay
+        )
+    
+    def _fallback_chain_response(self, model_name: str, priority: int, result: LLMAnalysisResult) -> Dict[str, Any]:
+        """Create consensus-like structure from single successful result"""
+        consensus = {
+            "analysis": f"Fallback Chain Analysis - {model_name} succeeded\n\n{result.analysis}",
+            "consensus_insights": result.key_insights,
+            "consensus_recommendations": result.recommendations,
+            "confidence": result.confidence,
+            "successful_model": model_name,
+            "method": "fallback_chain",
+            "priority_used": priority,
+            "market_focus": "current"
+        }
+        
+        return {
+            "consensus": consensus,
+            "individual_results": [self._result_to_dict(result)],
+            "failed_results": [],
+            "consensus_method": "fallback_chain",
+            "aggregate_metrics": {
+                "total_cost": result.cost,
+                "average_confidence": result.confidence,
+                "total_execution_time": result.execution_time,
+                "successful_analyses": 1,
+                "failed_analyses": 0,
+                "priority_used": priority,
+                "cache": self._cache_metrics([result])
+            },
+            "market_focus": "current",
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def _routing_order(self) -> List[str]:
+        """Provider order for the next request: adaptive ranking or the static fallback chain"""
+        if self.router is None:
+            return self.fallback_chain
+        return self.router.rank([name for name in self.fallback_chain if name in self.llm_agents])
+    
+    async def _call_agent(self, model_name: str, query: str, context: Dict[str, Any] = None) -> LLMAnalysisResult:
+        """Call a provider agent through its circuit breaker and feed the outcome into the router statistics"""
+        breaker = get_circuit_breaker(model_name)
+        if not breaker.allow_request():
+            self.logger.warning(f"🚫 Circuit open for {model_name}, skipping")
+            return LLMAnalysisResult(
+                model_name=model_name,
+                analysis=f"Analysis skipped: circuit open for {model_name}",
+                confidence=0.0,
+                key_insights=[],
+                recommendations=[],
+                execution_time=0.0,
+                cost=0.0,
+                timestamp=datetime.now(),
+                metadata={"error": f"circuit open for {model_name}", "circuit_open": True}
+            )
+        
+        start_time = time.perf_counter()
+        try:
+            result = await self.llm_agents[model_name].analyze(query, context)
+        except asyncio.CancelledError:
+            breaker.release()
+            if self.router is not None:
+                # A cancelled hedge loser took at least this long, so it counts as a slow sample
+                self.router.record_slow(model_name, time.perf_counter() - start_time)
+            raise
+        except Exception as e:
+            breaker.record_failure()
+            if self.router is not None:
+                error_msg = str(e).lower()
+                self.router.record(
+                    model_name,
+                    latency=time.perf_counter() - start_time,
+                    success=False,
+                    rate_limited="429" in error_msg or "rate limit" in error_msg or "quota" in error_msg
+                )
+            raise
+        
+        if result.confidence > 0:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        
+        if self.router is not None:
+            error_msg = str(result.metadata.get("error", "")).lower()
+            self.router.record(
+                model_name,
+                latency=result.execution_time,
+                success=result.confidence > 0,
+                rate_limited="429" in error_msg or "rate limit" in error_msg or "quota" in error_msg,
+                cost=result.cost
+            )
+        return result
+    
+    async def _analyze_with_cache(self, model_name: str, query: str, context: Dict[str, Any] = None) -> LLMAnalysisResult:
+        """Run a single agent analysis, serving successful results from the response cache"""
+        agent = self.llm_agents[model_name]
+        if self.response_cache is None:
+            return await self._call_agent(model_name, query, context)
+        
+        start_time = time.perf_counter()
+        key = LLMResponseCache.make_key(model_name, getattr(agent, 'model', ''), query, context)
+        payload = await self.response_cache.get(key)
+        
+        if payload:
+            cached = self._result_from_dict(payload)
+            self.response_cache.record_hit(cached.execution_time, cached.cost)
+            self.logger.info(f"♻️ Cache hit for {model_name} (saved {cached.execution_time:.2f}s)")
+            return replace(
+                cached,
+                execution_time=time.perf_counter() - start_time,
+                cost=0.0,
+                metadata={**cached.metadata, "cache_hit": True,
+                          "cached_execution_time": cached.execution_time, "cached_cost": cached.cost}
+            )
+        
+        self.response_cache.record_miss()
+        result = await self._call_agent(model_name, query, context)
+        if result.confidence > 0:
+            await self.response_cache.set(key, self._result_to_dict(result))
+        return result
+    
+    def _cache_metrics(self, results: List[LLMAnalysisResult]) -> Dict[str, Any]:
+        """Summarize cache usage for a set of results alongside process-wide cache stats"""
+        if self.response_cache is None:
+            return {"enabled": False}
+        
+        hits = [r for r in results if r.metadata.get("cache_hit")]
+        stats = self.response_cache.get_stats()
+        return {
+            "enabled": True,
+            "hits": len(hits),
+            "latency_saved": sum(r.metadata.get("cached_execution_time", 0.0) for r in hits),
+            "cost_saved": sum(r.metadata.get("cached_cost", 0.0) for r in hits),
+            "hit_rate": stats["hit_rate"],
+            "total_latency_saved": stats["latency_saved"],
+            "total_cost_saved": stats["cost_saved"]
+        }
+    
     async def _traditional_consensus_analysis(self, query: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Traditional consensus analysis when fallback chain fails"""
         try:
             # Execute all analyses in parallel
-            tasks = [agent.analyze(query, context) for agent in self.llm_agents.values()]
+            tasks = [self._analyze_with_cache(name, query, context) for name in self.llm_agents]
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # Filter out failed analyses
@@ -1081,7 +1334,8 @@ class MultiLLMOrchestrator:
                     "average_confidence": avg_confidence,
                     "total_execution_time": total_execution_time,
                     "successful_analyses": len(valid_results),
-                    "failed_analyses": len(failed_results)
+                    "failed_analyses": len(failed_results),
+                    "cache": self._cache_metrics(valid_results)
                 },
                 "market_focus": "current",
                 "timestamp": datetime.now().isoformat()
@@ -1180,6 +1434,9 @@ class MultiLLMOrchestrator:
                 "data_recency_prioritization"
             ],
             "supported_analysis_types": ["strategic", "market", "competitive", "financial"],
+            "rate_limits": get_rate_limiter_stats(),
+            "routing": self._routing_snapshot(),
+            "circuit_breakers": get_circuit_breaker_states(),
             "market_focus": "current",
             "timestamp": datetime.now().isoformat()
         }
@@ -1559,6 +1816,20 @@ class MultiLLMOrchestrator:
             "metadata": result.metadata
         }
     
+    def _result_from_dict(self, data: Dict[str, Any]) -> LLMAnalysisResult:
+        """Rebuild an LLMAnalysisResult from its dictionary form"""
+        return LLMAnalysisResult(
+            model_name=data["model_name"],
+            analysis=data["analysis"],
+            confidence=data["confidence"],
+            key_insights=data.get("key_insights", []),
+            recommendations=data.get("recommendations", []),
+            execution_time=data.get("execution_time", 0.0),
+            cost=data.get("cost", 0.0),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            metadata=data.get("metadata", {})
+        )
+    
     async def get_available_models(self) -> Dict[str, Any]:
         """Get information about available LLM models"""
         return {
@@ -1569,6 +1840,12 @@ class MultiLLMOrchestrator:
             "market_focus": "current"
         }
     
+    def _routing_snapshot(self) -> Dict[str, Any]:
+        """Routing mode, statistics and current provider order"""
+        if self.router is None:
+            return {"mode": "static", "current_order": self.fallback_chain}
+        return self.router.snapshot()
+    
     def set_consensus_method(self, method: ConsensusMethod):
         """Change the consensus method"""
         self.consensus_method = method
@@ -1597,6 +1874,21 @@ class MultiLLMOrchestrator:
         return {
             "overall_status": "healthy" if all(h["status"] == "healthy" for h in health_status.values()) else "degraded",
             "agents": health_status,
+            "routing": self._routing_snapshot(),
+            "circuit_breakers": get_circuit_breaker_states(),
             "market_focus": "current",
             "timestamp": datetime.now().isoformat()
         }
+
+# Process-wide orchestrator shared by every specialized agent and framework instance
+_shared_orchestrator: Optional[MultiLLMOrchestrator] = None
+_shared_orchestrator_lock = threading.Lock()
+
+def get_shared_llm_orchestrator() -> MultiLLMOrchestrator:
+    """Get the process-wide MultiLLMOrchestrator, creating it on first use"""
+    global _shared_orchestrator
+    if _shared_orchestrator is None:
+        with _shared_orchestrator_lock:
+            if _shared_orchestrator is None:
+                _shared_orchestrator = MultiLLMOrchestrator()
+    return _shared_orchestrator
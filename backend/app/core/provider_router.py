@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Latency-aware adaptive routing across LLM providers
+Keeps rolling per-provider statistics and orders providers by expected latency within a cost ceiling
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger("llm.router")
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(percentile / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+class ProviderStats:
+    """Rolling window of call outcomes for a single provider"""
+
+    def __init__(self, window: int):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.costs = deque(maxlen=window)
+        self.rate_limit_hits = deque(maxlen=window)
+
+    def record(self, latency: float, success: bool, rate_limited: bool, cost: float):
+        self.outcomes.append(success)
+        if success:
+            self.latencies.append(latency)
+            self.costs.append(cost)
+        if rate_limited:
+            self.rate_limit_hits.append(time.monotonic())
+
+    def record_slow(self, latency: float):
+        self.latencies.append(latency)
+
+    @property
+    def samples(self) -> int:
+        return len(self.outcomes)
+
+    @property
+    def error_rate(self) -> float:
+        return 1.0 - (sum(self.outcomes) / len(self.outcomes)) if self.outcomes else 0.0
+
+    @property
+    def p50(self) -> float:
+        return _percentile(list(self.latencies), 50)
+
+    @property
+    def p95(self) -> float:
+        return _percentile(list(self.latencies), 95)
+
+    @property
+    def average_cost(self) -> float:
+        return sum(self.costs) / len(self.costs) if self.costs else 0.0
+
+    def recent_rate_limits(self, seconds: float) -> int:
+        cutoff = time.monotonic() - seconds
+        return sum(1 for hit in self.rate_limit_hits if hit >= cutoff)
+
+class AdaptiveProviderRouter:
+    """
+    Orders providers by expected latency (p50 inflated by error rate).
+    Providers above the cost ceiling, or degrading (high error rate or recent
+    rate-limit hits), are demoted behind healthy ones. Providers without enough
+    samples are ranked at ``default_latency`` in static order, and are held to the
+    cost ceiling through their ``known_costs`` per-call price until measured.
+    """
+
+    def __init__(self, static_order: List[str], cost_ceiling: float = 0.0, window: int = 50,
+                 min_samples: int = 3, max_error_rate: float = 0.5, rate_limit_cooldown: float = 60.0,
+                 default_latency: float = 10.0, known_costs: Optional[Dict[str, float]] = None):
+        self.static_order = list(static_order)
+        self.cost_ceiling = cost_ceiling
+        self.default_latency = default_latency
+        self.known_costs = dict(known_costs or {})
+        self.window = window
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.rate_limit_cooldown = rate_limit_cooldown
+
+        self._stats: Dict[str, ProviderStats] = {}
+        self._lock = threading.Lock()
+        self.last_order: List[str] = list(static_order)
+
+    def _provider_stats(self, provider: str) -> ProviderStats:
+        if provider not in self._stats:
+            self._stats[provider] = ProviderStats(self.window)
+        return self._stats[provider]
+
+    def record(self, provider: str, latency: float, success: bool, rate_limited: bool = False, cost: float = 0.0):
+        with self._lock:
+            self._provider_stats(provider).record(latency, success, rate_limited, cost)
+
+    def record_slow(self, provider: str, latency: float):
+        """Record a call abandoned after ``latency`` seconds (e.g. a cancelled hedge loser) as a latency sample"""
+        with self._lock:
+            self._provider_stats(provider).record_slow(latency)
+
+    def p95(self, provider: str) -> Optional[float]:
+        """Observed p95 latency, or None until enough samples are collected"""
+        with self._lock:
+            stats = self._stats.get(provider)
+            if not stats or len(stats.latencies) < self.min_samples:
+                return None
+            return stats.p95
+
+    def _is_demoted(self, stats: ProviderStats) -> bool:
+        if stats.recent_rate_limits(self.rate_limit_cooldown) > 0:
+            return True
+        return stats.samples >= self.min_samples and stats.error_rate >= self.max_error_rate
+
+    def _expected_cost(self, provider: str, stats: ProviderStats) -> float:
+        if not stats.costs:
+            return self.known_costs.get(provider, 0.0)
+        return stats.average_cost
+
+    def _over_cost_ceiling(self, provider: str, stats: ProviderStats) -> bool:
+        return self.cost_ceiling > 0 and self._expected_cost(provider, stats) > self.cost_ceiling
+
+    def _expected_latency(self, stats: ProviderStats) -> float:
+        if len(stats.latencies) < self.min_samples:
+            return self.default_latency
+        return stats.p50 / max(0.05, 1.0 - stats.error_rate)
+
+    def rank(self, available: List[str]) -> List[str]:
+        """Order available providers for the next request"""
+        with self._lock:
+            def key(provider: str):
+                stats = self._provider_stats(provider)
+                static_index = self.static_order.index(provider) if provider in self.static_order else len(self.static_order)
+                return (self._is_demoted(stats), self._over_cost_ceiling(provider, stats),
+                        self._expected_latency(stats), static_index)
+
+            order = sorted(available, key=key)
+
+        if order != self.last_order:
+            logger.info(f"🧭 Provider routing order: {' → '.join(order)}")
+        self.last_order = order
+        return order
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Routing statistics and current decisions for observability"""
+        with self._lock:
+            providers = {
+                provider: {
+                    "samples": stats.samples,
+                    "p50_latency": round(stats.p50, 3),
+                    "p95_latency": round(stats.p95, 3),
+                    "error_rate": round(stats.error_rate, 3),
+                    "recent_rate_limit_hits": stats.recent_rate_limits(self.rate_limit_cooldown),
+                    "average_cost": round(stats.average_cost, 6),
+                    "demoted": self._is_demoted(stats),
+                    "over_cost_ceiling": self._over_cost_ceiling(provider, stats)
+                }
+                for provider, stats in self._stats.items()
+            }
+        return {
+            "mode": "adaptive",
+            "static_order": self.static_order,
+            "current_order": self.last_order,
+            "cost_ceiling": self.cost_ceiling,
+            "default_latency": self.default_latency,
+            "known_costs": self.known_costs,
+            "providers": providers
+        }
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Per-provider rate limiting for LLM agents
+Token buckets for requests-per-minute and tokens-per-minute plus an in-flight cap,
+with FIFO admission so concurrent layer analyses are served fairly
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional
+
+from config import settings
+
+logger = logging.getLogger("llm.rate_limiter")
+
+class TokenBucket:
+    """Continuously refilling token bucket; a capacity of 0 disables the limit"""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` can be consumed"""
+        if not self.enabled:
+            return 0.0
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_per_second
+
+    def consume(self, amount: float):
+        if self.enabled:
+            self._refill()
+            self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float):
+        """Correct a reservation once the real usage is known (may go into debt)"""
+        if self.enabled:
+            self.tokens = min(self.capacity, self.tokens - delta)
+
+class RateLimitReservation:
+    """Handle yielded to callers so they can report actual token usage"""
+
+    def __init__(self, limiter: "ProviderRateLimiter", estimated_tokens: int):
+        self.limiter = limiter
+        self.estimated_tokens = estimated_tokens
+
+    def record(self, actual_tokens: Optional[int]):
+        if actual_tokens is not None:
+            self.limiter.tokens.adjust(actual_tokens - self.estimated_tokens)
+            self.limiter.stats["tokens_used"] += actual_tokens
+
+class ProviderRateLimiter:
+    """Requests-per-minute, tokens-per-minute and concurrency governor for one provider"""
+
+    def __init__(self, provider: str, requests_per_minute: int, tokens_per_minute: int, max_in_flight: int):
+        self.provider = provider
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self.max_in_flight = max(1, max_in_flight)
+        self.in_flight = 0
+
+        # asyncio primitives are bound to the loop they were first used on
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._admission: Optional[asyncio.Lock] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        self.stats = {"requests": 0, "throttled": 0, "queued_seconds": 0.0, "tokens_used": 0}
+
+    def _primitives(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._admission = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        return self._admission, self._slots
+
+    @asynccontextmanager
+    async def reserve(self, estimated_tokens: int = 0):
+        """Wait for an in-flight slot and enough request/token budget, in arrival order"""
+        admission, slots = self._primitives()
+        queued_at = time.monotonic()
+
+        async with slots:
+            async with admission:
+                while True:
+                    wait = max(self.requests.wait_time(1), self.tokens.wait_time(estimated_tokens))
+                    if wait <= 0:
+                        break
+                    self.stats["throttled"] += 1
+                    await asyncio.sleep(wait)
+                self.requests.consume(1)
+                self.tokens.consume(estimated_tokens)
+
+            self.stats["requests"] += 1
+            self.stats["queued_seconds"] += time.monotonic() - queued_at
+            self.in_flight += 1
+            try:
+                yield RateLimitReservation(self, estimated_tokens)
+            finally:
+                self.in_flight -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "requests_per_minute": self.requests.capacity,
+            "tokens_per_minute": self.tokens.capacity,
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            **self.stats
+        }
+
+def estimate_tokens(*texts: str, max_output_tokens: int = 0) -> int:
+    """Rough prompt + completion token estimate (~4 characters per token)"""
+    return sum(len(text or "") for text in texts) // 4 + max_output_tokens
+
+# Limits per provider: (requests/min, tokens/min, max in-flight)
+def _provider_limits(provider: str) -> tuple:
+    limits = {
+        "openai": (settings.OPENAI_RPM, settings.OPENAI_TPM, settings.OPENAI_MAX_IN_FLIGHT),
+        "anthropic": (settings.ANTHROPIC_RPM, settings.ANTHROPIC_TPM, settings.ANTHROPIC_MAX_IN_FLIGHT),
+        "perplexity": (settings.PERPLEXITY_RPM, settings.PERPLEXITY_TPM, settings.PERPLEXITY_MAX_IN_FLIGHT),
+        "google_gemini": (settings.GOOGLE_GEMINI_RPM, settings.GOOGLE_GEMINI_TPM, settings.GOOGLE_GEMINI_MAX_IN_FLIGHT),
+    }
+    return limits.get(provider, (0, 0, 4))
+
+_limiters: Dict[str, ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_provider_rate_limiter(provider: str) -> ProviderRateLimiter:
+    """Get the process-wide limiter for a provider, shared by every agent instance"""
+    with _limiters_lock:
+        if provider not in _limiters:
+            rpm, tpm, max_in_flight = _provider_limits(provider)
+            _limiters[provider] = ProviderRateLimiter(provider, rpm, tpm, max_in_flight)
+            logger.info(f"✅ Rate limiter for {provider}: {rpm} RPM, {tpm} TPM, {max_in_flight} in flight")
+        return _limiters[provider]
+
+def get_rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    return {provider: limiter.get_stats() for provider, limiter in _limiters.items()}
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Vectorized Score Rollup Engine for Validatus Platform
+Holds layer scores and confidences in flat arrays over every Segment → Factor → Layer
+placement and rolls them up to all factors and segments in one NumPy pass
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+from app.core.layer_index import LAYER_INDEX, LayerHierarchyIndex
+
+ROLLUP_METHODS = ("weighted_average", "geometric_mean", "simple_average")
+
+@dataclass
+class LevelRollup:
+    """Rolled-up scores for every factor or segment, aligned with the engine's key order"""
+    scores: np.ndarray
+    confidences: np.ndarray
+    counts: np.ndarray
+
+    @property
+    def present(self) -> np.ndarray:
+        return self.counts > 0
+
+@dataclass
+class HierarchyRollup:
+    """Factor and segment rollups from one pass over the layer scores"""
+    factors: LevelRollup
+    segments: LevelRollup
+
+class ScoreRollupEngine:
+    """
+    Precomputes the placement → factor → segment index vectors once, then rolls up
+    any set of layer scores with bincount reductions instead of per-factor Python loops.
+    A layer placed under several factors contributes to each of them.
+    """
+
+    def __init__(self, index: LayerHierarchyIndex = LAYER_INDEX):
+        placements = list(index)
+
+        self.segment_names: Tuple[str, ...] = index.segments
+        self.factor_keys: Tuple[Tuple[str, str], ...] = tuple(
+            (segment, factor) for segment in self.segment_names for factor in index.segment_factors(segment)
+        )
+        self.layer_names: Tuple[str, ...] = tuple(dict.fromkeys(info.layer for info in placements))
+
+        factor_ids = {key: i for i, key in enumerate(self.factor_keys)}
+        segment_ids = {segment: i for i, segment in enumerate(self.segment_names)}
+        layer_ids = {layer: i for i, layer in enumerate(self.layer_names)}
+
+        self.placement_layers: Tuple[str, ...] = tuple(info.layer for info in placements)
+        self.placement_layer = np.array([layer_ids[info.layer] for info in placements], dtype=np.intp)
+        self.placement_factor = np.array([factor_ids[(info.segment, info.factor)] for info in placements], dtype=np.intp)
+        self.factor_segment = np.array([segment_ids[segment] for segment, _ in self.factor_keys], dtype=np.intp)
+
+        # Placement → factor membership matrix for batched what-if rescoring
+        self._factor_membership = np.zeros((len(placements), len(self.factor_keys)))
+        self._factor_membership[np.arange(len(placements)), self.placement_factor] = 1.0
+        self._segment_membership = np.zeros((len(self.factor_keys), len(self.segment_names)))
+        self._segment_membership[np.arange(len(self.factor_keys)), self.factor_segment] = 1.0
+
+    @property
+    def factor_names(self) -> List[str]:
+        """Factor keys in the ``SEGMENT_Factor`` form used by the framework"""
+        return [f"{segment}_{factor}" for segment, factor in self.factor_keys]
+
+    def layer_arrays(self, layer_scores: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-layer (scores, confidences, present) arrays aligned with ``layer_names``"""
+        scores = np.zeros(len(self.layer_names))
+        confidences = np.zeros(len(self.layer_names))
+        present = np.zeros(len(self.layer_names), dtype=bool)
+        for i, layer in enumerate(self.layer_names):
+            layer_score = layer_scores.get(layer)
+            if layer_score is not None:
+                scores[i] = layer_score.score
+                confidences[i] = layer_score.confidence
+                present[i] = True
+        return scores, confidences, present
+
+    def rollup_factors(self, scores: np.ndarray, confidences: np.ndarray, present: np.ndarray,
+                       method: str = "weighted_average") -> LevelRollup:
+        """Roll per-layer arrays up to every factor"""
+        mask = present[self.placement_layer]
+        return self._rollup(
+            scores[self.placement_layer], confidences[self.placement_layer], mask,
+            self.placement_factor, len(self.factor_keys), method
+        )
+
+    def rollup_segments(self, factors: LevelRollup, method: str = "weighted_average") -> LevelRollup:
+        """Roll factor arrays up to every segment, using only factors that have layers"""
+        return self._rollup(
+            factors.scores, factors.confidences, factors.present,
+            self.factor_segment, len(self.segment_names), method
+        )
+
+    def rollup(self, layer_scores: Dict[str, Any], method: str = "weighted_average",
+               segment_method: str = "weighted_average") -> HierarchyRollup:
+        """
+        Roll layer scores up to all factors and segments. Factor scores are rounded
+        to one decimal and confidences to two before the segment rollup, as
+        FactorScore stores them.
+        """
+        factors = self.rollup_factors(*self.layer_arrays(layer_scores), method=method)
+        rounded = LevelRollup(
+            scores=_round(factors.scores, 1),
+            confidences=_round(factors.confidences, 2),
+            counts=factors.counts
+        )
+        return HierarchyRollup(factors=factors, segments=self.rollup_segments(rounded, method=segment_method))
+
+    def what_if(self, layer_scores: Dict[str, Any], weights: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Re-score the hierarchy under many layer weightings at once.
+
+        ``weights`` has shape (n_scenarios, len(layer_names)) (or a single vector) and
+        replaces the layer confidences in the weighted averages; a factor's weight in
+        its segment is the mean weight of its layers. Returns unrounded factor,
+        segment and overall scores with one row per scenario.
+        """
+        scores, _, present = self.layer_arrays(layer_scores)
+        weights = np.atleast_2d(np.asarray(weights, dtype=float))
+        if weights.shape[1] != len(self.layer_names):
+            raise ValueError(f"Expected {len(self.layer_names)} layer weights, got {weights.shape[1]}")
+
+        mask = present[self.placement_layer].astype(float)
+        placement_scores = scores[self.placement_layer] * mask
+        placement_weights = weights[:, self.placement_layer] * mask
+
+        counts = mask @ self._factor_membership
+        factor_weight_sums = placement_weights @ self._factor_membership
+        factor_means = _safe_divide(placement_scores @ self._factor_membership, counts)
+        factor_scores = np.where(
+            factor_weight_sums > 0,
+            _safe_divide((placement_weights * placement_scores) @ self._factor_membership, factor_weight_sums),
+            factor_means
+        )
+        factor_weights = _safe_divide(factor_weight_sums, counts)
+
+        factor_present = (counts > 0).astype(float)
+        segment_counts = factor_present @ self._segment_membership
+        segment_weight_sums = factor_weights @ self._segment_membership
+        segment_means = _safe_divide((factor_scores * factor_present) @ self._segment_membership, segment_counts)
+        segment_scores = np.where(
+            segment_weight_sums > 0,
+            _safe_divide((factor_weights * factor_scores) @ self._segment_membership, segment_weight_sums),
+            segment_means
+        )
+
+        # Overall viability is the plain mean of the segment scores
+        segment_present = segment_counts > 0
+        n_segments = int(segment_present.sum())
+        overall = (segment_scores * segment_present).sum(axis=1) / n_segments if n_segments else np.full(len(weights), 5.0)
+
+        return {
+            "factor_scores": np.where(counts > 0, factor_scores, np.nan),
+            "segment_scores": np.where(segment_present, segment_scores, np.nan),
+            "overall_scores": overall
+        }
+
+    @staticmethod
+    def _rollup(values: np.ndarray, confidences: np.ndarray, mask: np.ndarray,
+                groups: np.ndarray, n_groups: int, method: str) -> LevelRollup:
+        if method not in ROLLUP_METHODS:
+            method = "simple_average"
+
+        # bincount accumulates in input order, so sums match the sequential Python sums
+        values = np.where(mask, values, 0.0)
+        confidences = np.where(mask, confidences, 0.0)
+        counts = np.bincount(groups, weights=mask.astype(float), minlength=n_groups)
+        score_sums = np.bincount(groups, weights=values, minlength=n_groups)
+        confidence_sums = np.bincount(groups, weights=confidences, minlength=n_groups)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = np.where(counts > 0, score_sums / counts, 0.0)
+            mean_confidences = np.where(counts > 0, confidence_sums / counts, 0.0)
+
+            if method == "weighted_average":
+                weighted_sums = np.bincount(groups, weights=values * confidences, minlength=n_groups)
+                scores = np.where(confidence_sums > 0, weighted_sums / confidence_sums, means)
+            elif method == "geometric_mean":
+                # multiply.at is unbuffered and applies the factors in input order
+                products = np.ones(n_groups)
+                np.multiply.at(products, groups[mask], values[mask])
+                scores = np.where(counts > 0, products ** (1.0 / np.maximum(counts, 1)), 0.0)
+            else:
+                scores = means
+
+        return LevelRollup(scores=scores, confidences=mean_confidences, counts=counts.astype(int))
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise division that yields 0 where the denominator is 0"""
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+    return np.divide(numerator, denominator, out=np.zeros(numerator.shape), where=denominator > 0)
+
+def _round(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """Round like the builtin round() (np.round can differ on values such as 2.675)"""
+    return np.array([round(float(value), ndigits) for value in values])
+
+_shared_engine: Optional[ScoreRollupEngine] = None
+
+def get_score_rollup_engine() -> ScoreRollupEngine:
+    """Get the rollup engine for the shared layer hierarchy index"""
+    global _shared_engine
+    if _shared_engine is None:
+        _shared_engine = ScoreRollupEngine(LAYER_INDEX)
+    return _shared_engine
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Columnar Score Store for Validatus Platform
+Layer scores of one analysis live in parallel arrays (score, confidence, type,
+timestamp) with interned layer names and rationale text held once; LayerScore,
+FactorScore and SegmentScore are lightweight __slots__ records over that store
+"""
+
+import sys
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple, Iterable
+
+from app.core.layer_index import LayerType
+
+_LAYER_TYPES: Tuple[LayerType, ...] = tuple(LayerType)
+_LAYER_TYPE_CODES: Dict[LayerType, int] = {layer_type: code for code, layer_type in enumerate(_LAYER_TYPES)}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _to_micros(timestamp: datetime) -> int:
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone().replace(tzinfo=None)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+class LayerScoreStore:
+    """Parallel-array storage for the layer scores of one analysis run"""
+
+    def __init__(self):
+        self.layer_names: List[str] = []
+        self.scores = array('d')
+        self.confidences = array('d')
+        self.layer_types = array('B')
+        self.timestamps = array('q')  # Microseconds since the epoch (naive local time)
+        self.rationale_ids = array('I')
+        self.sources: List[Tuple[Any, ...]] = []
+        self.metadata: List[Dict[str, Any]] = []
+
+        # Rationale text pool: identical rationales (e.g. fallbacks) are stored once
+        self.texts: List[str] = []
+        self._text_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.layer_names)
+
+    def _intern_text(self, text: str) -> int:
+        text_id = self._text_ids.get(text)
+        if text_id is None:
+            text_id = len(self.texts)
+            self._text_ids[text] = text_id
+            self.texts.append(text)
+        return text_id
+
+    def append(self, layer_name: str, layer_type: LayerType, score: float, rationale: str,
+               sources: Iterable[Any], confidence: float, timestamp: Optional[datetime] = None,
+               metadata: Optional[Dict[str, Any]] = None) -> int:
+        """Append a layer score row and return its index"""
+        self.layer_names.append(sys.intern(layer_name))
+        self.scores.append(float(score))
+        self.confidences.append(float(confidence))
+        self.layer_types.append(_LAYER_TYPE_CODES[layer_type])
+        self.timestamps.append(_to_micros(timestamp or datetime.now()))
+        self.rationale_ids.append(self._intern_text(rationale or ""))
+        self.sources.append(tuple(sources or ()))
+        self.metadata.append(metadata if metadata is not None else {})
+        return len(self.layer_names) - 1
+
+    def view(self, row: int) -> "LayerScore":
+        return LayerScore._view(self, row)
+
+    def add(self, layer_score: "LayerScore") -> "LayerScore":
+        """Copy a layer score into this store (no-op if it already lives here) and return the view"""
+        if layer_score._store is self:
+            return layer_score
+        return self.view(self.append(
+            layer_score.layer_name, layer_score.layer_type, layer_score.score, layer_score.rationale,
+            layer_score.sources, layer_score.confidence, layer_score.timestamp, layer_score.metadata
+        ))
+
+    @classmethod
+    def rows_for(cls, layer_scores: List["LayerScore"]) -> Tuple["LayerScoreStore", Tuple[int, ...]]:
+        """Resolve layer scores to (store, rows), copying them into one store if they span several"""
+        stores = {id(layer_score._store) for layer_score in layer_scores}
+        if len(stores) == 1:
+            return layer_scores[0]._store, tuple(layer_score._row for layer_score in layer_scores)
+        store = cls()
+        return store, tuple(store.add(layer_score)._row for layer_score in layer_scores)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "layers": len(self),
+            "unique_rationales": len(self.texts),
+            "array_bytes": sum(column.itemsize * len(column) for column in
+                               (self.scores, self.confidences, self.layer_types, self.timestamps, self.rationale_ids))
+        }
+
+class LayerScore:
+    """Individual layer score with source attribution (a view onto one LayerScoreStore row)"""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, layer_name: str, layer_type: LayerType, score: float, rationale: str,
+                 sources: List[Any], confidence: float, timestamp: Optional[datetime] = None,
+                 metadata: Optional[Dict[str, Any]] = None, store: Optional[LayerScoreStore] = None):
+        self._store = store if store is not None else LayerScoreStore()
+        self._row = self._store.append(layer_name, layer_type, score, rationale, sources,
+                                       confidence, timestamp, metadata)
+
+    @classmethod
+    def _view(cls, store: LayerScoreStore, row: int) -> "LayerScore":
+        layer_score = cls.__new__(cls)
+        layer_score._store = store
+        layer_score._row = row
+        return layer_score
+
+    @property
+    def layer_name(self) -> str:
+        return self._store.layer_names[self._row]
+
+    @property
+    def layer_type(self) -> LayerType:
+        return _LAYER_TYPES[self._store.layer_types[self._row]]
+
+    @property
+    def score(self) -> float:  # 1-10 scale
+        return self._store.scores[self._row]
+
+    @property
+    def rationale(self) -> str:
+        return self._store.texts[self._store.rationale_ids[self._row]]
+
+    @property
+    def sources(self) -> List[Any]:
+        return list(self._store.sources[self._row])
+
+    @property
+    def confidence(self) -> float:
+        return self._store.confidences[self._row]
+
+    @property
+    def timestamp(self) -> datetime:
+        return _EPOCH + timedelta(microseconds=self._store.timestamps[self._row])
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self._store.metadata[self._row]
+
+    def _fields(self) -> Tuple[Any, ...]:
+        return (self.layer_name, self.layer_type, self.score, self.rationale, self.sources,
+                self.confidence, self.timestamp, self.metadata)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, LayerScore):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LayerScore(layer_name={self.layer_name!r}, score={self.score}, confidence={self.confidence})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "layer_name": self.layer_name,
+            "layer_type": self.layer_type.value,
+            "score": self.score,
+            "rationale": self.rationale,
+            "sources": [source.to_dict() for source in self.sources],
+            "confidence": self.confidence,
+            "timestamp": self.timestamp.isoformat(),
+            "metadata": self.metadata
+        }
+
+class FactorScore:
+    """Factor score calculated from layer scores, referencing them by store row"""
+
+    __slots__ = ("factor_name", "factor_type", "score", "calculation_method", "rationale",
+                 "confidence", "timestamp", "_store", "_rows")
+
+    def __init__(self, factor_name: str, factor_type: str, score: float, contributing_layers: List[str],
+                 layer_scores: List[LayerScore], calculation_method: str, rationale: str,
+                 confidence: float, timestamp: Optional[datetime] = None):
+        # contributing_layers is derived from layer_scores; the argument is kept for compatibility
+        self.factor_name = factor_name
+        self.factor_type = factor_type
+        self.score = score  # 1-10 scale
+        self.calculation_method = calculation_method
+        self.rationale = rationale
+        self.confidence = confidence
+        self.timestamp = timestamp or datetime.now()
+        self._store, self._rows = LayerScoreStore.rows_for(layer_scores) if layer_scores else (None, ())
+
+    @property
+    def contributing_layers(self) -> List[str]:
+        return [self._store.layer_names[row] for row in self._rows]
+
+    @property
+    def layer_scores(self) -> List[LayerScore]:
+        return [self._store.view(row) for row in self._rows]
+
+    def __repr__(self) -> str:
+        return f"FactorScore(factor_name={self.factor_name!r}, score={self.score}, layers={len(self._rows)})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "factor_name": self.factor_name,
+            "factor_type": self.factor_type,
+            "score": self.score,
+            "contributing_layers": self.contributing_layers,
+            "calculation_method": self.calculation_method,
+            "rationale": self.rationale,
+            "confidence": self.confidence,
+            "timestamp": self.timestamp.isoformat()
+        }
+
+class SegmentScore:
+    """Segment score calculated from factor scores"""
+
+    __slots__ = ("segment_name", "segment_type", "score", "factor_scores", "calculation_method",
+                 "rationale", "confidence", "timestamp")
+
+    def __init__(self, segment_name: str, segment_type: Any, score: float, contributing_factors: List[str],
+                 factor_scores: List[FactorScore], calculation_method: str, rationale: str,
+                 confidence: float, timestamp: Optional[datetime] = None):
+        # contributing_factors is derived from factor_scores; the argument is kept for compatibility
+        self.segment_name = segment_name
+        self.segment_type = segment_type  # StrategicDimension
+        self.score = score  # 1-10 scale
+        self.factor_scores = factor_scores
+        self.calculation_method = calculation_method
+        self.rationale = rationale
+        self.confidence = confidence
+        self.timestamp = timestamp or datetime.now()
+
+    @property
+    def contributing_factors(self) -> List[str]:
+        return [factor.factor_name for factor in self.factor_scores]
+
+    def __repr__(self) -> str:
+        return f"SegmentScore(segment_name={self.segment_name!r}, score={self.score}, factors={len(self.factor_scores)})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "segment_name": self.segment_name,
+            "segment_type": self.segment_type.value,
+            "score": self.score,
+            "contributing_factors": self.contributing_factors,
+            "calculation_method": self.calculation_method,
+            "rationale": self.rationale,
+            "confidence": self.confidence,
+            "timestamp": self.timestamp.isoformat()
+        }
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Persistent search-result cache for Tavily, Perplexity and NewsAPI
+SQLite store keyed on (endpoint, normalized parameters) with per-source freshness
+windows; stale entries are served while a background refresh revalidates them
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import sqlite3
+import threading
+from urllib.parse import urlsplit
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple
+
+from config import settings
+from app.core.search_coalescer import make_search_key
+
+logger = logging.getLogger("research.search_cache")
+
+# Seconds between sweeps of entries too old to be served even as stale
+PURGE_INTERVAL = 300.0
+
+def search_source(endpoint: str) -> str:
+    """Map an endpoint to the source whose freshness policy applies"""
+    host = urlsplit(endpoint).netloc or endpoint
+    if "tavily" in host:
+        return "tavily"
+    if "perplexity" in host:
+        return "perplexity"
+    if "newsapi" in host:
+        return "newsapi"
+    return "default"
+
+class SearchResultCache:
+    """On-disk cache of successful search results with stale-while-revalidate"""
+
+    def __init__(self, db_path: str, freshness: Dict[str, float], stale_window: float):
+        self.db_path = db_path
+        self.freshness = freshness
+        self.stale_window = stale_window
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._last_purge = 0.0
+
+        self.stats = {"fresh_hits": 0, "stale_hits": 0, "misses": 0,
+                      "revalidations": 0, "revalidation_failures": 0}
+
+        try:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_results ("
+                "key TEXT PRIMARY KEY, source TEXT NOT NULL, payload TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_results_source_fetched ON search_results (source, fetched_at)"
+            )
+            self._purge_expired()
+            self._conn.commit()
+        except Exception as e:
+            logger.warning(f"⚠️ Search cache unavailable, searches will not be cached: {e}")
+            self._conn = None
+
+    def freshness_for(self, source: str) -> float:
+        return self.freshness.get(source, self.freshness.get("default", 0.0))
+
+    async def get_or_fetch(self, endpoint: str, params: Dict[str, Any],
+                           fetcher: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Serve fresh results locally, serve stale ones while refreshing, otherwise fetch"""
+        if self._conn is None:
+            return await fetcher()
+
+        source = search_source(endpoint)
+        key = make_search_key(endpoint, params)
+        row = await asyncio.to_thread(self._read, key)
+
+        if row:
+            fetched_at, payload = row
+            age = time.time() - fetched_at
+            freshness = self.freshness_for(source)
+            if age <= freshness:
+                self.stats["fresh_hits"] += 1
+                return payload
+            if age <= freshness + self.stale_window:
+                self.stats["stale_hits"] += 1
+                self._revalidate(key, source, fetcher)
+                return payload
+
+        self.stats["misses"] += 1
+        result = await fetcher()
+        await self._store(key, source, result)
+        return result
+
+    def _revalidate(self, key: str, source: str, fetcher: Callable[[], Awaitable[Dict[str, Any]]]):
+        """Refresh a stale entry in the background, at most once at a time per key"""
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self._store(key, source, await fetcher())
+                self.stats["revalidations"] += 1
+            except Exception as e:
+                self.stats["revalidation_failures"] += 1
+                logger.warning(f"⚠️ Background refresh of {source} search failed: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    async def _store(self, key: str, source: str, result: Dict[str, Any]):
+        # Only successful results are cached
+        if isinstance(result, dict) and not result.get("error"):
+            await asyncio.to_thread(self._write, key, source, result)
+
+    def _read(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, fetched_at FROM search_results WHERE key = ?", (key,)
+                ).fetchone()
+            return (row[1], json.loads(row[0])) if row else None
+        except Exception as e:
+            logger.warning(f"⚠️ Search cache read failed: {e}")
+            return None
+
+    def _write(self, key: str, source: str, payload: Dict[str, Any]):
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO search_results (key, source, payload, fetched_at) VALUES (?, ?, ?, ?)",
+                    (key, source, json.dumps(payload, default=str), time.time())
+                )
+                if time.time() - self._last_purge >= PURGE_INTERVAL:
+                    self._purge_expired()
+                self._conn.commit()
+        except Exception as e:
+            logger.warning(f"⚠️ Search cache write failed: {e}")
+
+    def _purge_expired(self):
+        """Drop entries too old to be served even as stale (caller holds the lock or is __init__)"""
+        now = time.time()
+        for cached_source, freshness in self.freshness.items():
+            self._conn.execute(
+                "DELETE FROM search_results WHERE source = ? AND fetched_at < ?",
+                (cached_source, now - freshness - self.stale_window)
+            )
+        self._last_purge = now
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["fresh_hits"] + self.stats["stale_hits"] + self.stats["misses"]
+        hits = self.stats["fresh_hits"] + self.stats["stale_hits"]
+        return {
+            **self.stats,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "refreshing": len(self._refreshing),
+            "freshness_seconds": self.freshness,
+            "stale_window_seconds": self.stale_window,
+            "enabled": self._conn is not None
+        }
+
+_search_cache: Optional[SearchResultCache] = None
+_search_cache_lock = threading.Lock()
+
+def get_search_cache() -> Optional[SearchResultCache]:
+    """Get the process-wide search cache, or None when SEARCH_CACHE_ENABLED is off"""
+    global _search_cache
+    if not settings.SEARCH_CACHE_ENABLED:
+        return None
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = SearchResultCache(
+                    settings.SEARCH_CACHE_PATH,
+                    freshness={
+                        "tavily": settings.SEARCH_CACHE_TAVILY_FRESHNESS,
+                        "perplexity": settings.SEARCH_CACHE_PERPLEXITY_FRESHNESS,
+                        "newsapi": settings.SEARCH_CACHE_NEWSAPI_FRESHNESS,
+                        "default": settings.SEARCH_CACHE_TAVILY_FRESHNESS
+                    },
+                    stale_window=settings.SEARCH_CACHE_STALE_WINDOW
+                )
+    return _search_cache
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Singleflight coalescing for external research searches
+Concurrent identical (or normalized-equivalent) queries share one in-flight request,
+and results are reused for the rest of an analysis run
+"""
+
+import re
+import json
+import asyncio
+import hashlib
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+logger = logging.getLogger("research.coalescer")
+
+# Payload fields that do not change the result (credentials)
+IGNORED_PAYLOAD_FIELDS = {"api_key"}
+
+# Results shared by every search issued inside the current analysis run
+_run_results: contextvars.ContextVar[Optional[Dict[str, Dict[str, Any]]]] = contextvars.ContextVar(
+    "search_run_results", default=None
+)
+
+def normalize_query(query: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace so equivalent queries match"""
+    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', ' ', (query or '').lower())).strip()
+
+def _normalize_value(key: str, value: Any) -> Any:
+    if isinstance(value, str) and key in ("query", "q", "content", "enhanced_query"):
+        return normalize_query(value)
+    if isinstance(value, dict):
+        return {k: _normalize_value(k, v) for k, v in value.items() if k not in IGNORED_PAYLOAD_FIELDS}
+    if isinstance(value, list):
+        return [_normalize_value(key, v) for v in value]
+    return value
+
+def make_search_key(endpoint: str, payload: Dict[str, Any]) -> str:
+    """Key a search on its endpoint and normalized parameters"""
+    material = json.dumps({"endpoint": endpoint, "payload": _normalize_value("", payload)}, sort_keys=True, default=str)
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+@contextmanager
+def search_run_scope():
+    """Reuse successful search results for every search issued inside this block"""
+    token = _run_results.set({})
+    try:
+        yield
+    finally:
+        _run_results.reset(token)
+
+class SearchCoalescer:
+    """Deduplicates external searches: one in-flight request per key, plus per-run reuse"""
+
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "executed": 0, "coalesced": 0, "run_hits": 0}
+
+    async def fetch(self, endpoint: str, payload: Dict[str, Any],
+                    fetcher: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Return the result for (endpoint, payload), calling ``fetcher`` only if nobody else is"""
+        key = make_search_key(endpoint, payload)
+        self.stats["requests"] += 1
+
+        run_results = _run_results.get()
+        if run_results is not None and key in run_results:
+            self.stats["run_hits"] += 1
+            return run_results[key]
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is not loop:
+                self._loop = loop
+                self._in_flight = {}
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = loop.create_future()
+                self._in_flight[key] = future
+
+        if not leader:
+            self.stats["coalesced"] += 1
+            logger.debug(f"🔁 Coalesced search on {endpoint}")
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    # The leading request was cancelled, not us: issue our own
+                    return await self.fetch(endpoint, payload, fetcher)
+                raise
+
+        self.stats["executed"] += 1
+        try:
+            result = await fetcher()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved so failures without followers are not logged
+            raise
+        else:
+            future.set_result(result)
+            if run_results is not None and isinstance(result, dict) and not result.get("error"):
+                run_results[key] = result
+            return result
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        requests = self.stats["requests"]
+        saved = self.stats["coalesced"] + self.stats["run_hits"]
+        return {
+            **self.stats,
+            "in_flight": len(self._in_flight),
+            "dedup_rate": saved / requests if requests else 0.0
+        }
+
+_search_coalescer: Optional[SearchCoalescer] = None
+_search_coalescer_lock = threading.Lock()
+
+def get_search_coalescer() -> SearchCoalescer:
+    """Get the process-wide search coalescer shared by every research agent"""
+    global _search_coalescer
+    if _search_coalescer is None:
+        with _search_coalescer_lock:
+            if _search_coalescer is None:
+                _search_coalescer = SearchCoalescer()
+    return _search_coalescer
@@ -5,29 +5,19 @@ Each agent specializes in specific domains with expert personas for comprehensiv
 Enhanced with hierarchical context (Segment → Factor → Layer) for precise analysis
 """
 
+import re
+import json
 import asyncio
 import logging
+import threading
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-from enum import Enum
 
-from app.core.multi_llm_orchestrator import MultiLLMOrchestrator
+from app.core.multi_llm_orchestrator import MultiLLMOrchestrator, get_shared_llm_orchestrator
+from app.core.layer_index import AnalysisDomain, LAYER_DOMAIN_OVERRIDES, LAYER_INDEX
 
 logger = logging.getLogger(__name__)
 
-class AnalysisDomain(Enum):
-    """Analysis domains for specialized agents"""
-    CONSUMER_INSIGHTS = "consumer_insights"
-    MARKET_RESEARCH = "market_research"
-    COMPETITOR_ANALYSIS = "competitor_analysis"
-    PRODUCT_STRATEGY = "product_strategy"
-    BRAND_STRATEGY = "brand_strategy"
-    UX_STRATEGY = "ux_strategy"
-    FINANCIAL_ANALYSIS = "financial_analysis"
-    TECHNICAL_ANALYSIS = "technical_analysis"
-    TREND_ANALYSIS = "trend_analysis"
-    RISK_ASSESSMENT = "risk_assessment"
-
 @dataclass
 class AgentPersona:
     """Persona configuration for specialized agents"""
@@ -41,10 +31,12 @@ class AgentPersona:
 class BaseSpecializedAgent:
     """Base class for all specialized agents"""
     
-    def __init__(self, domain: AnalysisDomain, persona: AgentPersona):
+    def __init__(self, domain: AnalysisDomain, persona: AgentPersona,
+                 llm_orchestrator: Optional[MultiLLMOrchestrator] = None):
         self.domain = domain
         self.persona = persona
-        self.llm_orchestrator = MultiLLMOrchestrator()
+        # Provider clients are shared process-wide unless an orchestrator is injected
+        self.llm_orchestrator = llm_orchestrator or get_shared_llm_orchestrator()
         self.logger = logging.getLogger(f"agent.{domain.value}")
         
     async def analyze_layer(self, layer_name: str, idea_description: str, 
@@ -95,23 +87,131 @@ Your analysis should reflect your specialized expertise and professional backgro
     
     def _get_hierarchical_context(self, layer_name: str) -> str:
         """Get the full hierarchical context for a layer (Segment → Factor → Layer)"""
+        return LAYER_INDEX.hierarchy_path(layer_name)
+    
+    async def analyze_layers_batch(self, layer_names: List[str], idea_description: str,
+                                   target_audience: str, context: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Score several layers of one factor in a single structured-JSON request.
+        Falls back to per-layer analyze_layer calls if the batch response is malformed.
+        """
+        if len(layer_names) == 1:
+            return {layer_names[0]: await self.analyze_layer(layer_names[0], idea_description, target_audience, context)}
+        
+        prompt = self._create_batch_prompt(layer_names, idea_description, target_audience, context)
+        
         try:
-            # Import the framework to get hierarchical information
-            from .comprehensive_analytical_framework_fixed import ComprehensiveAnalyticalFramework
-            framework = ComprehensiveAnalyticalFramework()
+            analysis_result = await asyncio.wait_for(
+                self.llm_orchestrator.consensus_analysis(
+                    query=prompt,
+                    context={"agent_type": self.domain.value, "persona": self.persona.name, "batch_layers": layer_names}
+                ),
+                timeout=120.0  # 2 minute timeout
+            )
             
-            # Find which segment and factor this layer belongs to
-            for segment_name, segment_data in framework.analytical_framework.items():
-                for factor_name, layers in segment_data["factors"].items():
-                    if layer_name in layers:
-                        return f"Segment: {segment_name} → Factor: {factor_name} → Layer: {layer_name}"
+            layer_results = self._parse_batch_response(analysis_result, layer_names)
+            if layer_results:
+                self.logger.info(f"📦 Batch scored {len(layer_names)} layers in one request")
+                return {
+                    layer: {
+                        "agent": self.domain.value,
+                        "persona": self.persona.name,
+                        "score": layer_result["score"],
+                        "rationale": layer_result["rationale"],
+                        "analysis": analysis_result,
+                        "methodology": self.persona.methodology,
+                        "batched": True
+                    }
+                    for layer, layer_result in layer_results.items()
+                }
             
-            # If not found, return basic context
-            return f"Layer: {layer_name}"
+            self.logger.warning(f"⚠️ Malformed batch response for {layer_names}, falling back to per-layer analysis")
             
+        except asyncio.TimeoutError:
+            self.logger.error(f"Batch analysis timed out for {layer_names}, falling back to per-layer analysis")
         except Exception as e:
-            # Fallback if framework import fails
-            return f"Layer: {layer_name}"
+            self.logger.error(f"Batch analysis failed for {layer_names}: {e}, falling back to per-layer analysis")
+        
+        results = await asyncio.gather(*[
+            self.analyze_layer(layer, idea_description, target_audience, context) for layer in layer_names
+        ])
+        return dict(zip(layer_names, results))
+    
+    def _create_batch_prompt(self, layer_names: List[str], idea_description: str,
+                             target_audience: str, context: Dict[str, Any]) -> str:
+        """Create one persona prompt that asks for a JSON score and rationale per layer"""
+        layer_lines = chr(10).join(f"- {layer}: {self._get_hierarchical_context(layer)}" for layer in layer_names)
+        response_schema = json.dumps(
+            {"layers": {layer: {"score": 7, "rationale": "Concise evidence-based rationale"} for layer in layer_names[:2]}},
+            indent=2
+        )
+        
+        prompt = f"""
+You are {self.persona.name}, a {self.persona.expertise} with {self.persona.background}.
+
+ANALYSIS TASK:
+Analyze each of the following strategic layers for the business idea: "{idea_description}"
+Target Audience: {target_audience}
+
+LAYERS AND HIERARCHICAL CONTEXT (CRITICAL FOR ACCURATE ANALYSIS):
+{layer_lines}
+
+YOUR EXPERTISE:
+- {self.persona.analysis_style}
+- {self.persona.methodology}
+
+KEY QUESTIONS TO CONSIDER:
+{chr(10).join(f"- {q}" for q in self.persona.key_questions)}
+
+CONTEXT: {context}
+
+ANALYSIS REQUIREMENTS:
+1. Assess every layer separately from your expert perspective, within its factor and segment
+2. Consider industry best practices, current trends, risks and opportunities for each layer
+3. Give each layer a score from 1 to 10 and a rationale of 2-4 sentences
+
+Return ONLY valid JSON, with one entry for every layer listed above, in this structure:
+{response_schema}
+"""
+        return prompt.strip()
+    
+    def _parse_batch_response(self, analysis_result: Dict[str, Any], layer_names: List[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Extract per-layer scores from a batch response; None if any layer is missing or invalid"""
+        if not isinstance(analysis_result, dict):
+            return None
+        
+        candidates = [r.get("analysis", "") for r in analysis_result.get("individual_results", []) if isinstance(r, dict)]
+        consensus = analysis_result.get("consensus")
+        if isinstance(consensus, dict):
+            candidates.append(consensus.get("analysis", ""))
+        
+        for text in candidates:
+            match = re.search(r'\{.*\}', str(text), re.DOTALL)
+            if not match:
+                continue
+            try:
+                payload = json.loads(match.group(0))
+            except (ValueError, TypeError):
+                continue
+            
+            layers = payload.get("layers", payload) if isinstance(payload, dict) else None
+            if not isinstance(layers, dict):
+                continue
+            
+            parsed = {}
+            for layer in layer_names:
+                entry = layers.get(layer)
+                try:
+                    score = float(entry["score"])
+                except (TypeError, KeyError, ValueError):
+                    break
+                if not 1.0 <= score <= 10.0:
+                    break
+                parsed[layer] = {"score": score, "rationale": str(entry.get("rationale", ""))}
+            else:
+                return parsed
+        
+        return None
 
 class ConsumerInsightsAgent(BaseSpecializedAgent):
     """Specialized agent for consumer behavior, psychology, and market research"""
@@ -621,63 +721,7 @@ class SpecializedAgentOrchestrator:
         }
         
         # Layer to agent mapping for optimal analysis
-        self.layer_agent_mapping = {
-            # Consumer layers
-            "need_perception": AnalysisDomain.CONSUMER_INSIGHTS,
-            "purchase_intent": AnalysisDomain.CONSUMER_INSIGHTS,
-            "emotional_pull": AnalysisDomain.CONSUMER_INSIGHTS,
-            "trust_level": AnalysisDomain.CONSUMER_INSIGHTS,
-            "loyalty_metrics": AnalysisDomain.CONSUMER_INSIGHTS,
-            "adoption_patterns": AnalysisDomain.CONSUMER_INSIGHTS,
-            
-            # Market layers
-            "market_size": AnalysisDomain.MARKET_RESEARCH,
-            "growth_rate": AnalysisDomain.MARKET_RESEARCH,
-            "market_trends": AnalysisDomain.MARKET_RESEARCH,
-            "regulatory_environment": AnalysisDomain.MARKET_RESEARCH,
-            "economic_factors": AnalysisDomain.MARKET_RESEARCH,
-            
-            # Competitor layers
-            "competitor_analysis": AnalysisDomain.COMPETITOR_ANALYSIS,
-            "competitive_positioning": AnalysisDomain.COMPETITOR_ANALYSIS,
-            "market_share": AnalysisDomain.COMPETITOR_ANALYSIS,
-            "competitive_advantages": AnalysisDomain.COMPETITOR_ANALYSIS,
-            
-            # Product layers
-            "product_features": AnalysisDomain.PRODUCT_STRATEGY,
-            "innovation_level": AnalysisDomain.PRODUCT_STRATEGY,
-            "technical_feasibility": AnalysisDomain.TECHNICAL_ANALYSIS,
-            "quality_metrics": AnalysisDomain.PRODUCT_STRATEGY,
-            "differentiation": AnalysisDomain.PRODUCT_STRATEGY,
-            
-            # Brand layers
-            "brand_positioning": AnalysisDomain.BRAND_STRATEGY,
-            "brand_equity": AnalysisDomain.BRAND_STRATEGY,
-            "marketing_strategy": AnalysisDomain.BRAND_STRATEGY,
-            "brand_awareness": AnalysisDomain.BRAND_STRATEGY,
-            
-            # Experience layers
-            "user_experience": AnalysisDomain.UX_STRATEGY,
-            "usability": AnalysisDomain.UX_STRATEGY,
-            "design_quality": AnalysisDomain.UX_STRATEGY,
-            "customer_satisfaction": AnalysisDomain.UX_STRATEGY,
-            
-            # Financial layers
-            "revenue_model": AnalysisDomain.FINANCIAL_ANALYSIS,
-            "cost_structure": AnalysisDomain.FINANCIAL_ANALYSIS,
-            "profitability": AnalysisDomain.FINANCIAL_ANALYSIS,
-            "financial_risks": AnalysisDomain.RISK_ASSESSMENT,
-            
-            # Risk layers
-            "operational_risks": AnalysisDomain.RISK_ASSESSMENT,
-            "market_risks": AnalysisDomain.RISK_ASSESSMENT,
-            "strategic_risks": AnalysisDomain.RISK_ASSESSMENT,
-            
-            # Trend layers
-            "industry_trends": AnalysisDomain.TREND_ANALYSIS,
-            "technology_trends": AnalysisDomain.TREND_ANALYSIS,
-            "consumer_trends": AnalysisDomain.TREND_ANALYSIS
-        }
+        self.layer_agent_mapping = dict(LAYER_DOMAIN_OVERRIDES)
         
     def get_optimal_agent(self, layer_name: str) -> BaseSpecializedAgent:
         """Get the optimal agent for analyzing a specific layer"""
@@ -685,32 +729,8 @@ class SpecializedAgentOrchestrator:
         if layer_name in self.layer_agent_mapping:
             return self.agents[self.layer_agent_mapping[layer_name]]
         
-        # Try partial matching based on keywords
-        layer_lower = layer_name.lower()
-        
-        if any(keyword in layer_lower for keyword in ['consumer', 'user', 'customer', 'need', 'behavior']):
-            return self.agents[AnalysisDomain.CONSUMER_INSIGHTS]
-        elif any(keyword in layer_lower for keyword in ['market', 'industry', 'growth', 'trend']):
-            return self.agents[AnalysisDomain.MARKET_RESEARCH]
-        elif any(keyword in layer_lower for keyword in ['competitor', 'competition', 'positioning']):
-            return self.agents[AnalysisDomain.COMPETITOR_ANALYSIS]
-        elif any(keyword in layer_lower for keyword in ['product', 'feature', 'innovation']):
-            return self.agents[AnalysisDomain.PRODUCT_STRATEGY]
-        elif any(keyword in layer_lower for keyword in ['brand', 'marketing', 'awareness']):
-            return self.agents[AnalysisDomain.BRAND_STRATEGY]
-        elif any(keyword in layer_lower for keyword in ['experience', 'design', 'usability']):
-            return self.agents[AnalysisDomain.UX_STRATEGY]
-        elif any(keyword in layer_lower for keyword in ['financial', 'revenue', 'cost', 'profit']):
-            return self.agents[AnalysisDomain.FINANCIAL_ANALYSIS]
-        elif any(keyword in layer_lower for keyword in ['technical', 'technology', 'architecture']):
-            return self.agents[AnalysisDomain.TECHNICAL_ANALYSIS]
-        elif any(keyword in layer_lower for keyword in ['trend', 'future', 'forecast']):
-            return self.agents[AnalysisDomain.TREND_ANALYSIS]
-        elif any(keyword in layer_lower for keyword in ['risk', 'threat', 'vulnerability']):
-            return self.agents[AnalysisDomain.RISK_ASSESSMENT]
-        else:
-            # Default to market research for general analysis
-            return self.agents[AnalysisDomain.MARKET_RESEARCH]
+        # Resolve through the precomputed layer index
+        return self.agents[LAYER_INDEX.domain(layer_name)]
     
     async def analyze_layer_with_optimal_agent(self, layer_name: str, idea_description: str,
                                               target_audience: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -752,10 +772,19 @@ class SpecializedAgentOrchestrator:
         
         return processed_results
 
+# Process-wide agent registry shared by every framework and layer call
+_agent_orchestrator: Optional[SpecializedAgentOrchestrator] = None
+_agent_orchestrator_lock = threading.Lock()
+
 # Convenience functions for easy access
 def get_specialized_agent_orchestrator() -> SpecializedAgentOrchestrator:
-    """Get a configured specialized agent orchestrator"""
-    return SpecializedAgentOrchestrator()
+    """Get the shared specialized agent orchestrator, creating it on first use"""
+    global _agent_orchestrator
+    if _agent_orchestrator is None:
+        with _agent_orchestrator_lock:
+            if _agent_orchestrator is None:
+                _agent_orchestrator = SpecializedAgentOrchestrator()
+    return _agent_orchestrator
 
 def get_agent_by_domain(domain: AnalysisDomain) -> BaseSpecializedAgent:
     """Get a specific agent by domain"""
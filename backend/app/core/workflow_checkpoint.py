@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Workflow checkpoints for resumable analyses
+SQLite store of each run's inputs, completed nodes, context memory and every scored
+layer (with its input fingerprint), written as the run progresses so an interrupted analysis
+can resume where it stopped and a re-run with edited inputs can reuse unchanged layers
+"""
+
+import os
+import json
+import time
+import uuid
+import asyncio
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from config import settings
+from app.core.comprehensive_analytical_framework_fixed import SourceAttribution
+from app.core.layer_index import LayerType
+from app.core.score_store import LayerScore, LayerScoreStore
+
+logger = logging.getLogger("workflow.checkpoint")
+
+def new_analysis_id() -> str:
+    return uuid.uuid4().hex
+
+class WorkflowCheckpointStore:
+    """Per-analysis checkpoints: one row per run plus one row per scored layer"""
+
+    def __init__(self, db_path: str, max_age: float = 0.0):
+        self.db_path = db_path
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.stats = {"layers_saved": 0, "nodes_saved": 0, "resumed": 0, "layers_restored": 0,
+                      "layers_reused": 0, "write_failures": 0}
+
+        try:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS analyses ("
+                "analysis_id TEXT PRIMARY KEY, idea_description TEXT NOT NULL, target_audience TEXT NOT NULL, "
+                "additional_context TEXT NOT NULL, status TEXT NOT NULL, current_step TEXT NOT NULL, "
+                "completed_steps TEXT NOT NULL, context_memory TEXT NOT NULL, results TEXT, error TEXT, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS layer_scores ("
+                "analysis_id TEXT NOT NULL, layer_name TEXT NOT NULL, payload TEXT NOT NULL, "
+                "context_summary TEXT, saved_at REAL NOT NULL, fingerprint TEXT, PRIMARY KEY (analysis_id, layer_name))"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(layer_scores)")}
+            if "fingerprint" not in columns:
+                self._conn.execute("ALTER TABLE layer_scores ADD COLUMN fingerprint TEXT")
+            self._conn.commit()
+        except Exception as e:
+            logger.warning(f"⚠️ Workflow checkpoints unavailable, runs will not be resumable: {e}")
+            self._conn = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    async def start(self, analysis_id: str, idea_description: str, target_audience: str,
+                    additional_context: Dict[str, Any]):
+        """Record a new run (or reopen a resumed one)"""
+        await self._run(self._start, analysis_id, idea_description, target_audience, additional_context)
+
+    async def save_layer(self, analysis_id: str, layer_score: LayerScore, context_summary: Optional[str],
+                         fingerprint: Optional[str] = None):
+        """Checkpoint one scored layer as soon as it completes"""
+        if await self._run(self._save_layer, analysis_id, layer_score, context_summary, fingerprint):
+            self.stats["layers_saved"] += 1
+
+    async def copy_layers(self, source_id: str, analysis_id: str, layers: List[str]):
+        """Carry layers reused by an incremental run over from the run they were scored in"""
+        if layers and await self._run(self._copy_layers, source_id, analysis_id, layers):
+            self.stats["layers_reused"] += len(layers)
+
+    async def save_node(self, analysis_id: str, state: Dict[str, Any]):
+        """Checkpoint graph progress after a node completes"""
+        if await self._run(self._save_node, analysis_id, state.get('current_step', ""),
+                           list(state.get('completed_steps', [])), dict(state.get('context_memory', {}))):
+            self.stats["nodes_saved"] += 1
+
+    async def finish(self, analysis_id: str, results: Dict[str, Any]):
+        await self._run(self._finish, analysis_id, "completed", results, None)
+
+    async def fail(self, analysis_id: str, error: str):
+        await self._run(self._finish, analysis_id, "failed", None, error)
+
+    async def load(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """Load a run's inputs, progress and usable layer scores; None if it is unknown"""
+        if self._conn is None:
+            return None
+        checkpoint = await asyncio.to_thread(self._load, analysis_id)
+        if checkpoint:
+            self.stats["resumed"] += 1
+            self.stats["layers_restored"] += len(checkpoint["layer_scores"])
+        return checkpoint
+
+    async def _run(self, func, *args) -> bool:
+        if self._conn is None:
+            return False
+        return await asyncio.to_thread(func, *args)
+
+    def _start(self, analysis_id: str, idea_description: str, target_audience: str,
+               additional_context: Dict[str, Any]) -> bool:
+        now = time.time()
+        return self._write(
+            "INSERT INTO analyses (analysis_id, idea_description, target_audience, additional_context, status, "
+            "current_step, completed_steps, context_memory, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, 'running', '', '[]', '{}', ?, ?) "
+            "ON CONFLICT(analysis_id) DO UPDATE SET status = 'running', error = NULL, updated_at = excluded.updated_at",
+            (analysis_id, idea_description, target_audience, json.dumps(additional_context, default=str), now, now),
+            purge=True
+        )
+
+    def _save_layer(self, analysis_id: str, layer_score: LayerScore, context_summary: Optional[str],
+                    fingerprint: Optional[str]) -> bool:
+        return self._write(
+            "INSERT OR REPLACE INTO layer_scores (analysis_id, layer_name, payload, context_summary, saved_at, fingerprint) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (analysis_id, layer_score.layer_name, json.dumps(layer_score.to_dict(), default=str),
+             context_summary, time.time(), fingerprint)
+        )
+
+    def _copy_layers(self, source_id: str, analysis_id: str, layers: List[str]) -> bool:
+        return self._write_many(
+            "INSERT OR REPLACE INTO layer_scores (analysis_id, layer_name, payload, context_summary, saved_at, fingerprint) "
+            "SELECT ?, layer_name, payload, context_summary, saved_at, fingerprint FROM layer_scores "
+            "WHERE analysis_id = ? AND layer_name = ?",
+            [(analysis_id, source_id, layer) for layer in layers]
+        )
+
+    def _save_node(self, analysis_id: str, current_step: str, completed_steps: List[str],
+                   context_memory: Dict[str, str]) -> bool:
+        return self._write(
+            "UPDATE analyses SET current_step = ?, completed_steps = ?, context_memory = ?, updated_at = ? "
+            "WHERE analysis_id = ?",
+            (current_step, json.dumps(completed_steps), json.dumps(context_memory), time.time(), analysis_id)
+        )
+
+    def _finish(self, analysis_id: str, status: str, results: Optional[Dict[str, Any]], error: Optional[str]) -> bool:
+        return self._write(
+            "UPDATE analyses SET status = ?, results = ?, error = ?, updated_at = ? WHERE analysis_id = ?",
+            (status, json.dumps(results, default=str) if results is not None else None, error, time.time(), analysis_id)
+        )
+
+    def _write(self, sql: str, params: tuple, purge: bool = False) -> bool:
+        try:
+            with self._lock:
+                self._conn.execute(sql, params)
+                if purge and self.max_age > 0:
+                    cutoff = time.time() - self.max_age
+                    self._conn.execute(
+                        "DELETE FROM layer_scores WHERE analysis_id IN "
+                        "(SELECT analysis_id FROM analyses WHERE updated_at < ?)", (cutoff,)
+                    )
+                    self._conn.execute("DELETE FROM analyses WHERE updated_at < ?", (cutoff,))
+                self._conn.commit()
+            return True
+        except Exception as e:
+            self.stats["write_failures"] += 1
+            logger.warning(f"⚠️ Workflow checkpoint write failed: {e}")
+            return False
+
+    def _write_many(self, sql: str, rows: List[tuple]) -> bool:
+        try:
+            with self._lock:
+                self._conn.executemany(sql, rows)
+                self._conn.commit()
+            return True
+        except Exception as e:
+            self.stats["write_failures"] += 1
+            logger.warning(f"⚠️ Workflow checkpoint write failed: {e}")
+            return False
+
+    def _load(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with self._lock:
+                run = self._conn.execute(
+                    "SELECT idea_description, target_audience, additional_context, status, current_step, "
+                    "completed_steps, context_memory, results FROM analyses WHERE analysis_id = ?", (analysis_id,)
+                ).fetchone()
+                layers = self._conn.execute(
+                    "SELECT payload, context_summary, fingerprint FROM layer_scores WHERE analysis_id = ? ORDER BY saved_at",
+                    (analysis_id,)
+                ).fetchall() if run else []
+        except Exception as e:
+            logger.warning(f"⚠️ Workflow checkpoint read failed: {e}")
+            return None
+
+        if not run:
+            return None
+
+        store = LayerScoreStore()
+        layer_scores: Dict[str, LayerScore] = {}
+        fingerprints: Dict[str, Optional[str]] = {}
+        context_memory: Dict[str, str] = json.loads(run[6])
+        for payload, context_summary, fingerprint in layers:
+            data = json.loads(payload)
+            # Layers that failed (e.g. provider outage) are analyzed again on resume
+            if data.get("metadata", {}).get("analysis_failed"):
+                context_memory.pop(data["layer_name"], None)
+                continue
+            layer_scores[data["layer_name"]] = LayerScore(
+                layer_name=data["layer_name"],
+                layer_type=LayerType(data["layer_type"]),
+                score=data["score"],
+                rationale=data["rationale"],
+                sources=[SourceAttribution(**source) for source in data.get("sources", [])],
+                confidence=data["confidence"],
+                timestamp=datetime.fromisoformat(data["timestamp"]),
+                metadata=data.get("metadata", {}),
+                store=store
+            )
+            fingerprints[data["layer_name"]] = fingerprint
+            if context_summary:
+                context_memory[data["layer_name"]] = context_summary
+
+        return {
+            "analysis_id": analysis_id,
+            "idea_description": run[0],
+            "target_audience": run[1],
+            "additional_context": json.loads(run[2]),
+            "status": run[3],
+            "current_step": run[4],
+            "completed_steps": json.loads(run[5]),
+            "context_memory": context_memory,
+            "results": json.loads(run[7]) if run[7] else None,
+            "score_store": store,
+            "layer_scores": layer_scores,
+            "fingerprints": fingerprints
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "enabled": self.enabled, "max_age_seconds": self.max_age}
+
+_checkpoint_store: Optional[WorkflowCheckpointStore] = None
+_checkpoint_store_lock = threading.Lock()
+
+def get_checkpoint_store() -> Optional[WorkflowCheckpointStore]:
+    """Get the process-wide checkpoint store, or None when WORKFLOW_CHECKPOINT_ENABLED is off"""
+    global _checkpoint_store
+    if not settings.WORKFLOW_CHECKPOINT_ENABLED:
+        return None
+    if _checkpoint_store is None:
+        with _checkpoint_store_lock:
+            if _checkpoint_store is None:
+                _checkpoint_store = WorkflowCheckpointStore(
+                    settings.WORKFLOW_CHECKPOINT_PATH,
+                    max_age=settings.WORKFLOW_CHECKPOINT_MAX_AGE
+                )
+    return _checkpoint_store
@@ -0,0 +1,46 @@
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+class KeywordHit(NamedTuple):
+    keyword: str
+    start: int
+    end: int
+
+class KeywordMatcher:
+    """Matches a whole keyword set in one pass over the text with a single precompiled regex."""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = sorted({keyword.lower() for keyword in keywords}, key=lambda k: (-len(k), k))
+
+        # Longest alternatives first so the longest keyword wins at each position; the
+        # lookahead keeps hits that start inside an earlier hit (e.g. "quality" in
+        # "high-quality"). Shorter keywords that are prefixes of the winner ("new" under
+        # "new market") are checked at the same position, so every keyword is counted
+        # as a per-keyword findall would count it
+        alternation = "|".join(re.escape(keyword) for keyword in self.keywords)
+        self.pattern = re.compile(r'\b(?=(' + alternation + r')\b)', re.IGNORECASE) if self.keywords else None
+        self.prefixes: Dict[str, List[Tuple[str, re.Pattern]]] = {
+            keyword: [
+                (prefix, re.compile(re.escape(prefix) + r'\b', re.IGNORECASE))
+                for prefix in self.keywords if len(prefix) < len(keyword) and keyword.startswith(prefix)
+            ]
+            for keyword in self.keywords
+        }
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """All keyword hits in the text with their positions, in order of appearance."""
+        if not self.pattern or not text:
+            return []
+        hits = []
+        for match in self.pattern.finditer(text):
+            keyword, start = match.group(1).lower(), match.start(1)
+            hits.append(KeywordHit(keyword, start, match.end(1)))
+            for prefix, prefix_pattern in self.prefixes[keyword]:
+                if prefix_pattern.match(text, start):
+                    hits.append(KeywordHit(prefix, start, start + len(prefix)))
+        return hits
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of hits per keyword."""
+        return dict(Counter(hit.keyword for hit in self.find_all(text)))
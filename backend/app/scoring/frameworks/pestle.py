@@ -1,7 +1,7 @@
 import numpy as np
-import re
 from typing import Dict, Any, List
 from .base_framework import BaseScoringFramework
+from .keyword_matcher import KeywordMatcher, KeywordHit
 
 class PESTLEAnalysisFramework(BaseScoringFramework):
     """Production implementation of PESTLE analysis with real data extraction."""
@@ -33,6 +33,13 @@ class PESTLEAnalysisFramework(BaseScoringFramework):
                 "weight": 0.12
             }
         }
+        
+        # One matcher for every category; a keyword may belong to several (e.g. "regulation")
+        self.keyword_categories: Dict[str, List[str]] = {}
+        for category, config in self.pestle_categories.items():
+            for keyword in config["keywords"]:
+                self.keyword_categories.setdefault(keyword.lower(), []).append(category)
+        self.keyword_matcher = KeywordMatcher(self.keyword_categories)
 
     async def calculate_score(self, research_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate comprehensive PESTLE analysis score."""
@@ -43,12 +50,15 @@ class PESTLEAnalysisFramework(BaseScoringFramework):
             if not texts:
                 return {"raw_score": 5.0, "confidence": 0.0, "supporting_data": {"text_count": 0}}
             
+            # Scan each text once for the keywords of all categories
+            text_hits = [self.keyword_matcher.find_all(text.lower()) for text in texts]
+            
             # Analyze each PESTLE category
             category_scores = {}
             category_insights = {}
             
-            for category, config in self.pestle_categories.items():
-                score_data = self._analyze_category(texts, category, config["keywords"])
+            for category in self.pestle_categories:
+                score_data = self._analyze_category(texts, text_hits, category)
                 category_scores[category] = score_data["score"]
                 category_insights[category] = score_data["insights"]
             
@@ -109,24 +119,25 @@ class PESTLEAnalysisFramework(BaseScoringFramework):
         
         return texts
 
-    def _analyze_category(self, texts: List[str], category: str, keywords: List[str]) -> Dict[str, Any]:
-        """Analyze a specific PESTLE category."""
+    def _analyze_category(self, texts: List[str], text_hits: List[List[KeywordHit]], category: str) -> Dict[str, Any]:
+        """Analyze a specific PESTLE category from the keyword hits of each text."""
         category_mentions = 0
         category_sentiment = 0
         insights = []
         
-        for text in texts:
+        for text, hits in zip(texts, text_hits):
             text_lower = text.lower()
             
             # Count keyword mentions
-            for keyword in keywords:
-                count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text_lower, re.IGNORECASE))
-                if count > 0:
-                    category_mentions += count
-                    
-                    # Analyze sentiment for this mention
-                    sentiment = self._analyze_text_sentiment(text_lower, keyword)
-                    category_sentiment += sentiment
+            first_hits: Dict[str, KeywordHit] = {}
+            for hit in hits:
+                if category in self.keyword_categories[hit.keyword]:
+                    category_mentions += 1
+                    first_hits.setdefault(hit.keyword, hit)
+            
+            # Analyze sentiment around the first mention of each keyword
+            for hit in first_hits.values():
+                category_sentiment += self._analyze_text_sentiment(text_lower, hit)
         
         # Calculate category score (0-10 scale)
         if category_mentions > 0:
@@ -160,20 +171,15 @@ class PESTLEAnalysisFramework(BaseScoringFramework):
             "insights": insights
         }
 
-    def _analyze_text_sentiment(self, text: str, keyword: str) -> float:
-        """Analyze sentiment around a specific keyword."""
+    def _analyze_text_sentiment(self, text: str, hit: KeywordHit) -> float:
+        """Analyze sentiment around a specific keyword mention."""
         # Simple sentiment analysis based on surrounding context
         positive_words = ["positive", "good", "beneficial", "favorable", "growth", "increase", "improve"]
         negative_words = ["negative", "bad", "harmful", "unfavorable", "decline", "decrease", "worse"]
         
-        # Find keyword position and analyze surrounding context
-        keyword_pos = text.lower().find(keyword.lower())
-        if keyword_pos == -1:
-            return 0.0
-        
         # Analyze context within 100 characters of keyword
-        start = max(0, keyword_pos - 50)
-        end = min(len(text), keyword_pos + len(keyword) + 50)
+        start = max(0, hit.start - 50)
+        end = min(len(text), hit.end + 50)
         context = text[start:end].lower()
         
         positive_count = sum(1 for word in positive_words if word in context)
@@ -1,6 +1,7 @@
 from .base_framework import BaseScoringFramework
+from .keyword_matcher import KeywordMatcher, KeywordHit
 from typing import Dict, Any, List
-import re
+from collections import Counter
 import numpy as np
 
 class SentimentAnalysisFramework(BaseScoringFramework):
@@ -26,6 +27,9 @@ class SentimentAnalysisFramework(BaseScoringFramework):
             "expensive": -1.0, "overpriced": -1.5, "waste": -1.8, "regret": -1.5
         }
         
+        # Weighted keywords of both polarities, matched in a single pass per text
+        self.keyword_matcher = KeywordMatcher([*self.positive_keywords, *self.negative_keywords])
+        
         # Context-specific sentiment indicators
         self.context_keywords = {
             "quality": {
@@ -53,13 +57,16 @@ class SentimentAnalysisFramework(BaseScoringFramework):
         sentiment_scores = []
         context_scores = {}
         mentions = 0
+        text_hits = []
         
         for text in texts:
             if not text:
                 continue
                 
             text_lower = text.lower()
-            text_score = self._calculate_text_sentiment(text_lower)
+            hits = self.keyword_matcher.find_all(text_lower)
+            text_hits.append(hits)
+            text_score = self._calculate_text_sentiment(hits)
             
             if text_score != 0:
                 sentiment_scores.append(text_score)
@@ -90,7 +97,7 @@ class SentimentAnalysisFramework(BaseScoringFramework):
             "text_count": len(texts),
             "context_scores": {k: np.mean(v) for k, v in context_scores.items() if v},
             "sentiment_distribution": self._analyze_sentiment_distribution(sentiment_scores),
-            "keyword_analysis": self._analyze_keyword_usage(texts)
+            "keyword_analysis": self._analyze_keyword_usage(text_hits)
         }
         
         return {
@@ -141,20 +148,12 @@ class SentimentAnalysisFramework(BaseScoringFramework):
         
         return texts
 
-    def _calculate_text_sentiment(self, text: str) -> float:
-        """Calculate sentiment score for a single text using weighted keywords."""
-        positive_score = 0
-        negative_score = 0
-        
-        # Calculate positive sentiment
-        for keyword, weight in self.positive_keywords.items():
-            count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE))
-            positive_score += count * weight
+    def _calculate_text_sentiment(self, hits: List[KeywordHit]) -> float:
+        """Calculate sentiment score for a single text from its weighted keyword hits."""
+        counts = Counter(hit.keyword for hit in hits)
         
-        # Calculate negative sentiment
-        for keyword, weight in self.negative_keywords.items():
-            count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE))
-            negative_score += abs(count * weight)
+        positive_score = sum(counts[keyword] * weight for keyword, weight in self.positive_keywords.items())
+        negative_score = sum(abs(counts[keyword] * weight) for keyword, weight in self.negative_keywords.items())
         
         # Return net sentiment score
         return positive_score - negative_score
@@ -203,20 +202,13 @@ class SentimentAnalysisFramework(BaseScoringFramework):
             "neutral_count": sum(1 for s in scores if s == 0)
         }
 
-    def _analyze_keyword_usage(self, texts: List[str]) -> Dict[str, Any]:
+    def _analyze_keyword_usage(self, text_hits: List[List[KeywordHit]]) -> Dict[str, Any]:
         """Analyze keyword usage patterns."""
         keyword_counts = {"positive": {}, "negative": {}}
         
-        # Count positive keywords
-        for keyword in self.positive_keywords:
-            count = sum(len(re.findall(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE)) for text in texts)
-            if count > 0:
-                keyword_counts["positive"][keyword] = count
-        
-        # Count negative keywords
-        for keyword in self.negative_keywords:
-            count = sum(len(re.findall(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE)) for text in texts)
-            if count > 0:
-                keyword_counts["negative"][keyword] = count
+        for hits in text_hits:
+            for hit in hits:
+                polarity = "positive" if hit.keyword in self.positive_keywords else "negative"
+                keyword_counts[polarity][hit.keyword] = keyword_counts[polarity].get(hit.keyword, 0) + 1
         
         return keyword_counts
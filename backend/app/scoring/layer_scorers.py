@@ -8,6 +8,119 @@ from .frameworks.market_sizing import MarketSizingFramework
 from .frameworks.competitive_analysis import CompetitiveAnalysisFramework
 from .frameworks.innovation_scoring import InnovationScoringFramework
 
+# Comprehensive mapping ensuring every layer gets scored
+LAYER_FRAMEWORK_MAP = {
+    # Consumer Segment
+    "need_perception": "sentiment",
+    "purchase_intent": "sentiment", 
+    "emotional_pull": "sentiment",
+    "unmet_needs": "sentiment",
+    "shopping_habits": "sentiment",
+    "media_consumption": "sentiment",
+    "decision_making_process": "sentiment",
+    "brand_interaction": "sentiment",
+    "repeat_purchase_rate": "market_sizing",
+    "churn_risk": "sentiment",
+    "advocacy_potential": "sentiment",
+    "loyalty_program_effectiveness": "market_sizing",
+    "overall_sentiment": "sentiment",
+    "quality_perception": "sentiment",
+    "trust_perception": "sentiment",
+    "value_for_money": "sentiment",
+    "product_usage_frequency": "market_sizing",
+    "feature_adoption_rate": "market_sizing",
+    "community_engagement": "sentiment",
+    "feedback_submission_rate": "market_sizing",
+    
+    # Market Segment
+    "total_addressable_market": "market_sizing",
+    "serviceable_addressable_market": "market_sizing",
+    "market_growth_rate": "market_sizing",
+    "future_projections": "market_sizing",
+    "emerging_trends": "pestle",
+    "technological_shifts": "pestle",
+    "white_space_opportunities": "pestle",
+    "macroeconomic_factors": "pestle",
+    "key_competitors": "competitive",
+    "market_share_distribution": "competitive",
+    "competitor_strengths_weaknesses": "competitive",
+    "rival_intensity": "porters",
+    "key_regulations": "pestle",
+    "compliance_requirements": "pestle",
+    "political_stability": "pestle",
+    "trade_policies": "pestle",
+    "economic_risks": "pestle",
+    "competitive_threats": "competitive",
+    "supply_chain_vulnerabilities": "pestle",
+    "market_volatility": "pestle",
+    
+    # Product Segment
+    "core_features_analysis": "competitive",
+    "feature_completeness": "competitive",
+    "user_friendliness": "sentiment",
+    "performance_reliability": "competitive",
+    "unique_selling_proposition": "competitive",
+    "technological_innovation": "innovation",
+    "design_innovation": "innovation",
+    "patent_portfolio": "innovation",
+    "clarity_of_value": "sentiment",
+    "problem_solution_fit": "sentiment",
+    "cost_benefit_analysis": "market_sizing",
+    "emotional_benefits": "sentiment",
+    "supply_chain_resilience": "pestle",
+    "cost_structure_stability": "market_sizing",
+    "scalability_potential": "market_sizing",
+    "dependency_risks": "pestle",
+    "defect_rate": "competitive",
+    "customer_reported_issues": "sentiment",
+    "performance_benchmarks": "competitive",
+    "compliance_standards": "competitive",
+    
+    # Brand Segment
+    "unaided_brand_recall": "market_sizing",
+    "aided_brand_recognition": "market_sizing",
+    "share_of_voice": "market_sizing",
+    "social_media_presence": "market_sizing",
+    "brand_associations": "sentiment",
+    "perceived_quality": "sentiment",
+    "brand_loyalty_metrics": "market_sizing",
+    "brand_advocacy": "sentiment",
+    "market_positioning": "competitive",
+    "target_audience_alignment": "sentiment",
+    "competitive_differentiation": "competitive",
+    "brand_story_clarity": "sentiment",
+    "message_consistency": "sentiment",
+    "tone_of_voice": "sentiment",
+    "channel_effectiveness": "market_sizing",
+    "content_engagement": "market_sizing",
+    "pricing_strategy": "market_sizing",
+    "customer_lifetime_value": "market_sizing",
+    "revenue_streams": "market_sizing",
+    "profitability_analysis": "market_sizing",
+    
+    # Experience Segment
+    "onboarding_experience": "sentiment",
+    "ease_of_use": "sentiment",
+    "navigation_clarity": "sentiment",
+    "visual_appeal": "sentiment",
+    "touchpoint_analysis": "market_sizing",
+    "friction_points": "sentiment",
+    "emotional_journey": "sentiment",
+    "channel_consistency": "market_sizing",
+    "first_response_time": "market_sizing",
+    "resolution_rate": "market_sizing",
+    "support_channel_effectiveness": "market_sizing",
+    "agent_satisfaction": "sentiment",
+    "post_purchase_communication": "market_sizing",
+    "loyalty_program_engagement": "market_sizing",
+    "review_and_rating_behavior": "sentiment",
+    "referral_rate": "market_sizing",
+    "community_activity_level": "market_sizing",
+    "user_generated_content": "market_sizing",
+    "brand_interaction_rate": "market_sizing",
+    "event_participation": "market_sizing",
+}
+
 class LayerScoringEngine:
     """Central engine for calculating layer scores using strategic frameworks"""
     
@@ -21,118 +134,7 @@ class LayerScoringEngine:
             "innovation": InnovationScoringFramework(),
         }
         
-        # Comprehensive mapping ensuring every layer gets scored
-        self.layer_framework_map = {
-            # Consumer Segment
-            "need_perception": "sentiment",
-            "purchase_intent": "sentiment", 
-            "emotional_pull": "sentiment",
-            "unmet_needs": "sentiment",
-            "shopping_habits": "sentiment",
-            "media_consumption": "sentiment",
-            "decision_making_process": "sentiment",
-            "brand_interaction": "sentiment",
-            "repeat_purchase_rate": "market_sizing",
-            "churn_risk": "sentiment",
-            "advocacy_potential": "sentiment",
-            "loyalty_program_effectiveness": "market_sizing",
-            "overall_sentiment": "sentiment",
-            "quality_perception": "sentiment",
-            "trust_perception": "sentiment",
-            "value_for_money": "sentiment",
-            "product_usage_frequency": "market_sizing",
-            "feature_adoption_rate": "market_sizing",
-            "community_engagement": "sentiment",
-            "feedback_submission_rate": "market_sizing",
-            
-            # Market Segment
-            "total_addressable_market": "market_sizing",
-            "serviceable_addressable_market": "market_sizing",
-            "market_growth_rate": "market_sizing",
-            "future_projections": "market_sizing",
-            "emerging_trends": "pestle",
-            "technological_shifts": "pestle",
-            "white_space_opportunities": "pestle",
-            "macroeconomic_factors": "pestle",
-            "key_competitors": "competitive",
-            "market_share_distribution": "competitive",
-            "competitor_strengths_weaknesses": "competitive",
-            "rival_intensity": "porters",
-            "key_regulations": "pestle",
-            "compliance_requirements": "pestle",
-            "political_stability": "pestle",
-            "trade_policies": "pestle",
-            "economic_risks": "pestle",
-            "competitive_threats": "competitive",
-            "supply_chain_vulnerabilities": "pestle",
-            "market_volatility": "pestle",
-            
-            # Product Segment
-            "core_features_analysis": "competitive",
-            "feature_completeness": "competitive",
-            "user_friendliness": "sentiment",
-            "performance_reliability": "competitive",
-            "unique_selling_proposition": "competitive",
-            "technological_innovation": "innovation",
-            "design_innovation": "innovation",
-            "patent_portfolio": "innovation",
-            "clarity_of_value": "sentiment",
-            "problem_solution_fit": "sentiment",
-            "cost_benefit_analysis": "market_sizing",
-            "emotional_benefits": "sentiment",
-            "supply_chain_resilience": "pestle",
-            "cost_structure_stability": "market_sizing",
-            "scalability_potential": "market_sizing",
-            "dependency_risks": "pestle",
-            "defect_rate": "competitive",
-            "customer_reported_issues": "sentiment",
-            "performance_benchmarks": "competitive",
-            "compliance_standards": "competitive",
-            
-            # Brand Segment
-            "unaided_brand_recall": "market_sizing",
-            "aided_brand_recognition": "market_sizing",
-            "share_of_voice": "market_sizing",
-            "social_media_presence": "market_sizing",
-            "brand_associations": "sentiment",
-            "perceived_quality": "sentiment",
-            "brand_loyalty_metrics": "market_sizing",
-            "brand_advocacy": "sentiment",
-            "market_positioning": "competitive",
-            "target_audience_alignment": "sentiment",
-            "competitive_differentiation": "competitive",
-            "brand_story_clarity": "sentiment",
-            "message_consistency": "sentiment",
-            "tone_of_voice": "sentiment",
-            "channel_effectiveness": "market_sizing",
-            "content_engagement": "market_sizing",
-            "pricing_strategy": "market_sizing",
-            "customer_lifetime_value": "market_sizing",
-            "revenue_streams": "market_sizing",
-            "profitability_analysis": "market_sizing",
-            
-            # Experience Segment
-            "onboarding_experience": "sentiment",
-            "ease_of_use": "sentiment",
-            "navigation_clarity": "sentiment",
-            "visual_appeal": "sentiment",
-            "touchpoint_analysis": "market_sizing",
-            "friction_points": "sentiment",
-            "emotional_journey": "sentiment",
-            "channel_consistency": "market_sizing",
-            "first_response_time": "market_sizing",
-            "resolution_rate": "market_sizing",
-            "support_channel_effectiveness": "market_sizing",
-            "agent_satisfaction": "sentiment",
-            "post_purchase_communication": "market_sizing",
-            "loyalty_program_engagement": "market_sizing",
-            "review_and_rating_behavior": "sentiment",
-            "referral_rate": "market_sizing",
-            "community_activity_level": "market_sizing",
-            "user_generated_content": "market_sizing",
-            "brand_interaction_rate": "market_sizing",
-            "event_participation": "market_sizing",
-        }
+        self.layer_framework_map = LAYER_FRAMEWORK_MAP
     
     async def calculate_layer_score(self, layer_name: str, research_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate score for a specific layer using the appropriate framework"""
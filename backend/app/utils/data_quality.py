@@ -1,24 +1,142 @@
 import asyncio
+import logging
 import re
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime, timedelta
 import numpy as np
 from urllib.parse import urlparse
 import aiohttp
 from textstat import flesch_reading_ease, flesch_kincaid_grade
-import spacy
 from transformers import pipeline
+from config import settings
+from .spacy_pipeline import get_entity_nlp, get_entity_cache
+
+logger = logging.getLogger("data_quality")
+
+# Quality dimensions and the assessment method scoring each, in result order
+QUALITY_DIMENSIONS = [
+    ('content_quality', '_assess_content_quality'),
+    ('source_credibility', '_assess_source_credibility'),
+    ('temporal_relevance', '_assess_temporal_relevance'),
+    ('information_completeness', '_assess_information_completeness'),
+    ('factual_consistency', '_assess_factual_consistency'),
+    ('linguistic_quality', '_assess_linguistic_quality')
+]
+
+# Index fields each assessment method reads; process-pool workers receive only these
+DIMENSION_FIELDS = {
+    '_assess_content_quality': ('texts',),
+    '_assess_source_credibility': ('sources',),
+    '_assess_temporal_relevance': ('dates',),
+    '_assess_information_completeness': ('lowered_text',),
+    '_assess_factual_consistency': ('numerical_data',),
+    '_assess_linguistic_quality': ('texts',)
+}
+
+# Patterns collected while indexing a research payload
+DATE_PATTERNS = [
+    re.compile(r'\d{4}-\d{2}-\d{2}'),  # YYYY-MM-DD
+    re.compile(r'\d{2}/\d{2}/\d{4}'),   # MM/DD/YYYY
+    re.compile(r'\d{4}'),               # Year only
+]
+PERCENTAGE_PATTERN = re.compile(r'(\d+(?:\.\d+)?)%')
+CURRENCY_PATTERN = re.compile(r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)')
+SOURCE_KEYS = ('url', 'source', 'citation', 'reference')
+
+class ResearchPayloadIndex:
+    """Texts, source URLs, dates and numeric values (with paths) of a research payload, built in one traversal"""
+    
+    def __init__(self, research_data: Any):
+        self.research_data = research_data
+        self.texts: List[str] = []
+        self.sources: List[str] = []
+        self.numerical_data: List[Dict[str, Any]] = []
+        self._dates = set()
+        self._lowered_text: Optional[str] = None
+        
+        self._index(research_data, "", True)
+        self.dates: List[str] = list(self._dates)
+    
+    @classmethod
+    def of(cls, research_data: Any) -> "ResearchPayloadIndex":
+        """Reuse an existing index, or build one for raw research data"""
+        return research_data if isinstance(research_data, cls) else cls(research_data)
+    
+    def subset(self, fields: Tuple[str, ...]) -> "ResearchPayloadIndex":
+        """Copy holding only ``fields`` (others empty, raw payload dropped), cheap to pickle to a worker"""
+        subset = ResearchPayloadIndex.__new__(ResearchPayloadIndex)
+        subset.research_data = None
+        subset.texts = self.texts if 'texts' in fields else []
+        subset.sources = self.sources if 'sources' in fields else []
+        subset.numerical_data = self.numerical_data if 'numerical_data' in fields else []
+        subset.dates = self.dates if 'dates' in fields else []
+        subset._dates = set(subset.dates)
+        subset._lowered_text = self.lowered_text if 'lowered_text' in fields else ""
+        return subset
+    
+    @property
+    def lowered_text(self) -> str:
+        """Lowercased string form of the whole payload (keys included), computed once"""
+        if self._lowered_text is None:
+            self._lowered_text = str(self.research_data).lower()
+        return self._lowered_text
+    
+    def _index(self, obj: Any, path: str, collect_sources: bool):
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                current_path = f"{path}.{key}" if path else key
+                if collect_sources and key in SOURCE_KEYS:
+                    # Only the direct URL of a source field counts as a source
+                    if isinstance(value, str) and value.startswith('http'):
+                        self.sources.append(value)
+                    self._index(value, current_path, False)
+                else:
+                    self._index(value, current_path, collect_sources)
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                self._index(item, f"{path}[{i}]", collect_sources)
+        elif isinstance(obj, str):
+            self.texts.append(obj)
+            if collect_sources and obj.startswith('http'):
+                self.sources.append(obj)
+            
+            for pattern in DATE_PATTERNS:
+                self._dates.update(pattern.findall(obj))
+            
+            # Look for percentage patterns
+            percentage_match = PERCENTAGE_PATTERN.search(obj)
+            if percentage_match:
+                self.numerical_data.append({
+                    'value': float(percentage_match.group(1)),
+                    'path': path,
+                    'type': 'percentage'
+                })
+            
+            # Look for currency patterns
+            currency_match = CURRENCY_PATTERN.search(obj)
+            if currency_match:
+                self.numerical_data.append({
+                    'value': float(currency_match.group(1).replace(',', '')),
+                    'path': path,
+                    'type': 'currency'
+                })
+        elif isinstance(obj, (int, float)):
+            self.numerical_data.append({
+                'value': obj,
+                'path': path,
+                'type': 'number'
+            })
 
 class AdvancedDataQualityAssessment:
     """Production-grade data quality assessment with comprehensive metrics"""
     
-    def __init__(self):
-        # Load NLP models
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # Fallback for development environments
-            self.nlp = None
+    def __init__(self, load_classifier: bool = True):
+        # Entities come from the shared NER-only spaCy pipeline (see the nlp property)
+        self.entity_cache = get_entity_cache()
             
         # Initialize quality assessment models
         try:
@@ -26,7 +144,7 @@ class AdvancedDataQualityAssessment:
                 "text-classification",
                 model="microsoft/DialoGPT-medium",
                 device=-1  # CPU
-            )
+            ) if load_classifier else None
         except Exception:
             self.quality_classifier = None
         
@@ -49,28 +167,27 @@ class AdvancedDataQualityAssessment:
             'min_readability_score': 30
         }
 
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline, looked up per use so the model registry can unload it; None without spaCy"""
+        return get_entity_nlp()
+
     async def comprehensive_quality_assessment(self, research_data: Dict[str, Any]) -> Dict[str, Any]:
         """Conduct comprehensive quality assessment across all dimensions"""
         try:
-            assessment_tasks = [
-                self._assess_content_quality(research_data),
-                self._assess_source_credibility(research_data),
-                self._assess_temporal_relevance(research_data),
-                self._assess_information_completeness(research_data),
-                self._assess_factual_consistency(research_data),
-                self._assess_linguistic_quality(research_data)
-            ]
+            # Traverse the payload once; every dimension reads from the index
+            payload_index = ResearchPayloadIndex(research_data)
             
-            results = await asyncio.gather(*assessment_tasks, return_exceptions=True)
+            if settings.DATA_QUALITY_EXECUTION_MODE == "process":
+                results = await self._assess_dimensions_in_processes(payload_index)
+            else:
+                assessment_tasks = [getattr(self, method)(payload_index) for _, method in QUALITY_DIMENSIONS]
+                results = await asyncio.gather(*assessment_tasks, return_exceptions=True)
             
             # Process results
             quality_dimensions = {
-                'content_quality': results[0] if not isinstance(results[0], Exception) else 0.0,
-                'source_credibility': results[1] if not isinstance(results[1], Exception) else 0.0,
-                'temporal_relevance': results[2] if not isinstance(results[2], Exception) else 0.0,
-                'information_completeness': results[3] if not isinstance(results[3], Exception) else 0.0,
-                'factual_consistency': results[4] if not isinstance(results[4], Exception) else 0.0,
-                'linguistic_quality': results[5] if not isinstance(results[5], Exception) else 0.0
+                dimension: result if not isinstance(result, Exception) else 0.0
+                for (dimension, _), result in zip(QUALITY_DIMENSIONS, results)
             }
             
             # Calculate weighted overall score
@@ -105,6 +222,28 @@ class AdvancedDataQualityAssessment:
                 'assessment_timestamp': datetime.utcnow().isoformat()
             }
 
+    async def _assess_dimensions_in_processes(self, payload_index: ResearchPayloadIndex) -> List[Any]:
+        """Score each dimension in the shared process pool so CPU-bound scoring runs across cores"""
+        loop = asyncio.get_running_loop()
+        try:
+            pool = get_quality_process_pool()
+            results = await asyncio.gather(*[
+                loop.run_in_executor(pool, _assess_dimension_in_worker, method,
+                                     payload_index.subset(DIMENSION_FIELDS[method]))
+                for _, method in QUALITY_DIMENSIONS
+            ], return_exceptions=True)
+            broken = next((r for r in results if isinstance(r, BrokenProcessPool)), None)
+            if broken:
+                shutdown_quality_process_pool()  # Recreated on next use
+                raise broken
+            return results
+        except Exception as e:
+            # Broken or unavailable pool: score inline with the same schema
+            logger.warning(f"⚠️ Data quality process pool unavailable, assessing inline: {e}")
+            return await asyncio.gather(*[
+                getattr(self, method)(payload_index) for _, method in QUALITY_DIMENSIONS
+            ], return_exceptions=True)
+
     async def _assess_content_quality(self, research_data: Dict[str, Any]) -> float:
         """Assess content quality using multiple linguistic and semantic metrics"""
         try:
@@ -115,6 +254,12 @@ class AdvancedDataQualityAssessment:
             
             quality_scores = []
             
+            # Parse all eligible texts for entities in one nlp.pipe batch
+            if self.nlp:
+                self.entity_cache.entities([
+                    text for text in content_texts if len(text) >= self.thresholds['min_content_length']
+                ])
+            
             for text in content_texts:
                 if len(text) < self.thresholds['min_content_length']:
                     continue
@@ -150,20 +295,7 @@ class AdvancedDataQualityAssessment:
 
     def _extract_content_texts(self, research_data: Dict[str, Any]) -> List[str]:
         """Extract all text content from research data"""
-        texts = []
-        
-        def extract_text_recursive(obj):
-            if isinstance(obj, str):
-                texts.append(obj)
-            elif isinstance(obj, dict):
-                for value in obj.values():
-                    extract_text_recursive(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    extract_text_recursive(item)
-        
-        extract_text_recursive(research_data)
-        return texts
+        return ResearchPayloadIndex.of(research_data).texts
 
     def _score_content_length(self, text: str) -> float:
         """Score content length appropriateness"""
@@ -203,10 +335,12 @@ class AdvancedDataQualityAssessment:
             if not self.nlp:
                 return 0.5  # Default score if NLP model unavailable
                 
-            doc = self.nlp(text)
+            doc_entities = self.entity_cache.entities([text])
+            if doc_entities is None:
+                return 0.5
             
             # Count entities (organizations, people, locations, etc.)
-            entities = len([ent for ent in doc.ents if ent.label_ in 
+            entities = len([label for _, label in doc_entities[0] if label in 
                           ['ORG', 'PERSON', 'GPE', 'MONEY', 'PERCENT', 'DATE']])
             
             # Count numerical data
@@ -319,24 +453,7 @@ class AdvancedDataQualityAssessment:
 
     def _extract_sources(self, research_data: Dict[str, Any]) -> List[str]:
         """Extract all source URLs from research data"""
-        sources = []
-        
-        def extract_sources_recursive(obj):
-            if isinstance(obj, str) and obj.startswith('http'):
-                sources.append(obj)
-            elif isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key in ['url', 'source', 'citation', 'reference']:
-                        if isinstance(value, str) and value.startswith('http'):
-                            sources.append(value)
-                    else:
-                        extract_sources_recursive(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    extract_sources_recursive(item)
-        
-        extract_sources_recursive(research_data)
-        return sources
+        return ResearchPayloadIndex.of(research_data).sources
 
     async def _assess_temporal_relevance(self, research_data: Dict[str, Any]) -> float:
         """Assess temporal relevance of research data"""
@@ -378,30 +495,7 @@ class AdvancedDataQualityAssessment:
 
     def _extract_dates(self, research_data: Dict[str, Any]) -> List[str]:
         """Extract date strings from research data"""
-        dates = []
-        
-        def extract_dates_recursive(obj):
-            if isinstance(obj, str):
-                # Look for date patterns
-                date_patterns = [
-                    r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-                    r'\d{2}/\d{2}/\d{4}',   # MM/DD/YYYY
-                    r'\d{4}',               # Year only
-                ]
-                
-                for pattern in date_patterns:
-                    matches = re.findall(pattern, obj)
-                    dates.extend(matches)
-                    
-            elif isinstance(obj, dict):
-                for value in obj.values():
-                    extract_dates_recursive(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    extract_dates_recursive(item)
-        
-        extract_dates_recursive(research_data)
-        return list(set(dates))  # Remove duplicates
+        return ResearchPayloadIndex.of(research_data).dates
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string in multiple formats"""
@@ -449,7 +543,7 @@ class AdvancedDataQualityAssessment:
     def _check_info_type_presence(self, data: Dict[str, Any], keywords: List[str]) -> float:
         """Check presence of specific information type"""
         try:
-            data_str = str(data).lower()
+            data_str = ResearchPayloadIndex.of(data).lowered_text
             matches = sum(1 for keyword in keywords if keyword in data_str)
             return min(1.0, matches / len(keywords))
             
@@ -483,45 +577,7 @@ class AdvancedDataQualityAssessment:
 
     def _extract_numerical_data(self, research_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract numerical data points from research data"""
-        numerical_data = []
-        
-        def extract_numbers_recursive(obj, path=""):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    extract_numbers_recursive(value, current_path)
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    current_path = f"{path}[{i}]"
-                    extract_numbers_recursive(item, current_path)
-            elif isinstance(obj, (int, float)):
-                numerical_data.append({
-                    'value': obj,
-                    'path': path,
-                    'type': 'number'
-                })
-            elif isinstance(obj, str):
-                # Look for percentage patterns
-                percentage_match = re.search(r'(\d+(?:\.\d+)?)%', obj)
-                if percentage_match:
-                    numerical_data.append({
-                        'value': float(percentage_match.group(1)),
-                        'path': path,
-                        'type': 'percentage'
-                    })
-                
-                # Look for currency patterns
-                currency_match = re.search(r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)', obj)
-                if currency_match:
-                    value_str = currency_match.group(1).replace(',', '')
-                    numerical_data.append({
-                        'value': float(value_str),
-                        'path': path,
-                        'type': 'currency'
-                    })
-        
-        extract_numbers_recursive(research_data)
-        return numerical_data
+        return ResearchPayloadIndex.of(research_data).numerical_data
 
     def _group_numerical_metrics(self, numerical_data: List[Dict[str, Any]]) -> Dict[str, List[float]]:
         """Group numerical data by metric type"""
@@ -754,3 +810,39 @@ class AdvancedDataQualityAssessment:
             
         except Exception:
             return 0.5
+
+# Process-pool execution: each worker holds its own assessor with spaCy pre-warmed
+_worker_assessor: Optional[AdvancedDataQualityAssessment] = None
+
+def _init_quality_worker():
+    global _worker_assessor
+    _worker_assessor = AdvancedDataQualityAssessment(load_classifier=False)
+    if _worker_assessor.nlp:
+        _worker_assessor.nlp("Warm up the pipeline.")
+
+def _assess_dimension_in_worker(method: str, research_data: ResearchPayloadIndex) -> float:
+    # The dimension scorers are synchronous work behind an async signature
+    return asyncio.run(getattr(_worker_assessor, method)(research_data))
+
+_quality_process_pool: Optional[ProcessPoolExecutor] = None
+_quality_process_pool_lock = threading.Lock()
+
+def get_quality_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool for data quality scoring, creating it on first use"""
+    global _quality_process_pool
+    with _quality_process_pool_lock:
+        if _quality_process_pool is None:
+            _quality_process_pool = ProcessPoolExecutor(
+                max_workers=settings.DATA_QUALITY_PROCESS_WORKERS or None,
+                # spawn: forking a process that already runs threads and an event loop is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_quality_worker
+            )
+        return _quality_process_pool
+
+def shutdown_quality_process_pool():
+    global _quality_process_pool
+    with _quality_process_pool_lock:
+        if _quality_process_pool is not None:
+            _quality_process_pool.shutdown(wait=False, cancel_futures=True)
+            _quality_process_pool = None
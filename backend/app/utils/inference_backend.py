@@ -0,0 +1,145 @@
+"""
+Inference backends for the transformer pipelines used by ProductionNLPProcessor.
+
+- torch:              full-precision PyTorch (default)
+- torch_dynamic_int8: PyTorch with dynamic int8 quantization of Linear layers (CPU)
+- onnx_int8:          ONNX Runtime with dynamic int8 quantization via optimum; falls
+                      back to torch_dynamic_int8 when optimum/onnxruntime are missing.
+                      Kernels target NLP_ONNX_QUANTIZATION_TARGET, detected from the CPU by default
+"""
+
+import os
+import logging
+import platform
+from typing import Any, Dict, Optional
+
+import torch
+from transformers import AutoTokenizer, pipeline
+
+from config import settings
+
+try:
+    from optimum.onnxruntime import (
+        ORTModelForSequenceClassification, ORTModelForTokenClassification,
+        ORTModelForQuestionAnswering, ORTModelForSeq2SeqLM, ORTQuantizer
+    )
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+logger = logging.getLogger("nlp.inference_backend")
+
+INFERENCE_BACKENDS = ("torch", "torch_dynamic_int8", "onnx_int8")
+QUANTIZATION_TARGETS = ("avx512_vnni", "avx512", "avx2", "arm64")
+
+def _ort_model_classes() -> Dict[str, Any]:
+    return {
+        "sentiment-analysis": ORTModelForSequenceClassification,
+        "ner": ORTModelForTokenClassification,
+        "question-answering": ORTModelForQuestionAnswering,
+        "summarization": ORTModelForSeq2SeqLM,
+    }
+
+def _device() -> int:
+    return 0 if torch.cuda.is_available() else -1
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """Validate the configured backend, degrading to what is installed"""
+    backend = (backend or settings.NLP_INFERENCE_BACKEND).lower()
+    if backend not in INFERENCE_BACKENDS:
+        logger.warning(f"⚠️ Unknown NLP inference backend '{backend}', using torch")
+        return "torch"
+    if backend == "onnx_int8" and not ONNX_AVAILABLE:
+        logger.warning("⚠️ optimum[onnxruntime] not installed, using torch_dynamic_int8")
+        return "torch_dynamic_int8"
+    return backend
+
+def _cpu_flags() -> set:
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+def resolve_quantization_target(target: Optional[str] = None) -> str:
+    """ONNX int8 kernel target: the configured one, or the best match for this CPU"""
+    target = (target or settings.NLP_ONNX_QUANTIZATION_TARGET).lower()
+    if target in QUANTIZATION_TARGETS:
+        return target
+    if target != "auto":
+        logger.warning(f"⚠️ Unknown ONNX quantization target '{target}', detecting from the CPU")
+
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "arm64"
+    flags = _cpu_flags()
+    if "avx512_vnni" in flags:
+        return "avx512_vnni"
+    if "avx512f" in flags:
+        return "avx512"
+    return "avx2"
+
+def build_pipeline(task: str, model: str, backend: Optional[str] = None, **kwargs) -> Any:
+    """Build a transformers pipeline for ``task`` on the selected inference backend"""
+    backend = resolve_backend(backend)
+
+    if backend == "torch":
+        return pipeline(task, model=model, device=_device(), **kwargs)
+
+    if backend == "torch_dynamic_int8":
+        # Quantized kernels are CPU-only
+        nlp_pipeline = pipeline(task, model=model, device=-1, **kwargs)
+        nlp_pipeline.model = torch.quantization.quantize_dynamic(
+            nlp_pipeline.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        logger.info(f"✅ {task} pipeline using torch dynamic int8 quantization")
+        return nlp_pipeline
+
+    model_dir = _quantized_onnx_model(task, model)
+    ort_model = _load_ort_model(task, model_dir)
+    tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    logger.info(f"✅ {task} pipeline using ONNX Runtime int8")
+    return pipeline(task, model=ort_model, tokenizer=tokenizer, **kwargs)
+
+def _quantized_onnx_model(task: str, model: str) -> str:
+    """Export ``model`` to ONNX and dynamically quantize it, reusing earlier exports"""
+    target = resolve_quantization_target()
+    export_dir = os.path.join(settings.NLP_ONNX_CACHE_DIR, model.replace("/", "__"))
+    quantized_dir = os.path.join(export_dir, f"int8_{target}")
+    if os.path.isdir(quantized_dir) and any(f.endswith(".onnx") for f in os.listdir(quantized_dir)):
+        return quantized_dir
+
+    logger.info(f"📦 Exporting {model} to ONNX for int8 quantization ({target})")
+    ort_model = _ort_model_classes()[task].from_pretrained(model, export=True)
+    ort_model.save_pretrained(export_dir)
+    AutoTokenizer.from_pretrained(model).save_pretrained(export_dir)
+
+    # Seq2seq exports have several graphs (encoder, decoder, decoder with past)
+    quantization_config = getattr(AutoQuantizationConfig, target)(is_static=False, per_channel=False)
+    for file_name in sorted(f for f in os.listdir(export_dir) if f.endswith(".onnx")):
+        quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=file_name)
+        quantizer.quantize(save_dir=quantized_dir, quantization_config=quantization_config)
+
+    AutoTokenizer.from_pretrained(export_dir).save_pretrained(quantized_dir)
+    ort_model.config.save_pretrained(quantized_dir)
+    return quantized_dir
+
+def _load_ort_model(task: str, model_dir: str) -> Any:
+    files = sorted(f for f in os.listdir(model_dir) if f.endswith(".onnx"))
+    model_class = _ort_model_classes()[task]
+
+    if task != "summarization":
+        return model_class.from_pretrained(model_dir, file_name=files[0])
+
+    def find(prefix: str) -> Optional[str]:
+        return next((f for f in files if f.startswith(prefix)), None)
+
+    seq2seq_files = {
+        "encoder_file_name": find("encoder_model"),
+        "decoder_file_name": find("decoder_model_quantized") or find("decoder_model"),
+        "decoder_with_past_file_name": find("decoder_with_past_model"),
+    }
+    return model_class.from_pretrained(model_dir, **{k: v for k, v in seq2seq_files.items() if v})
@@ -0,0 +1,143 @@
+"""
+Dynamic micro-batching for transformer inference.
+Requests from all coroutines are queued for a few milliseconds, sorted by length
+and run in a worker thread as forward passes over buckets of similar-length texts
+(so padding is minimal), then fanned back out to the callers; the event loop is
+never blocked by inference.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Callable, Optional, Tuple
+
+from config import settings
+from .model_registry import get_model_registry
+
+logger = logging.getLogger("nlp.inference_batcher")
+
+class ModelUnavailableError(RuntimeError):
+    """The model behind a batcher could not be loaded"""
+
+class InferenceBatcher:
+    """Collects concurrent inference requests for one model into batched forward passes"""
+
+    def __init__(self, name: str, model_getter: Callable[[], Any],
+                 max_batch_size: int = 32, max_wait_ms: float = 5.0, bucket_size: int = 8):
+        self.name = name
+        self.model_getter = model_getter
+        self.max_batch_size = max(1, max_batch_size)
+        self.bucket_size = max(1, bucket_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        # One worker thread per model: pipelines are not safe for concurrent calls
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"inference-{name}")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.stats = {"requests": 0, "batches": 0, "inference_seconds": 0.0}
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect(self._queue))
+        return self._queue
+
+    async def submit(self, texts: List[str], **call_kwargs) -> List[Any]:
+        """Run the model on ``texts``, batched with whatever other callers are submitting"""
+        if not texts:
+            return []
+        queue = self._ensure_worker()
+        kwargs_key = tuple(sorted((k, repr(v)) for k, v in call_kwargs.items()))
+
+        futures = []
+        for text in texts:
+            future = self._loop.create_future()
+            queue.put_nowait((kwargs_key, call_kwargs, text, future))
+            futures.append(future)
+        self.stats["requests"] += len(texts)
+        return list(await asyncio.gather(*futures))
+
+    async def _collect(self, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Requests with different call arguments cannot share a forward pass
+            groups: Dict[Tuple, List] = {}
+            for item in batch:
+                groups.setdefault(item[0], []).append(item)
+            for items in groups.values():
+                await self._run(loop, items)
+
+    async def _run(self, loop: asyncio.AbstractEventLoop, items: List):
+        items = [item for item in items if not item[3].done()]  # Skip cancelled callers
+        if not items:
+            return
+        items.sort(key=lambda item: len(item[2]))
+        texts = [item[2] for item in items]
+        call_kwargs = items[0][1]
+
+        def infer():
+            model = self.model_getter()
+            if model is None:
+                raise ModelUnavailableError(f"NLP model {self.name} is unavailable")
+            started = time.perf_counter()
+            # The pipeline slices the length-sorted texts into consecutive forward passes
+            outputs = model(texts, batch_size=min(self.bucket_size, len(texts)), **call_kwargs)
+            return outputs, time.perf_counter() - started
+
+        try:
+            outputs, elapsed = await loop.run_in_executor(self._executor, infer)
+            self.stats["batches"] += 1
+            self.stats["inference_seconds"] += elapsed
+            for item, output in zip(items, outputs):
+                if not item[3].done():
+                    item[3].set_result(output)
+        except Exception as e:
+            for item in items:
+                if not item[3].done():
+                    item[3].set_exception(e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        batches = self.stats["batches"]
+        return {
+            **self.stats,
+            "average_batch_size": self.stats["requests"] / batches if batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "bucket_size": self.bucket_size,
+            "max_wait_ms": self.max_wait * 1000
+        }
+
+_batchers: Dict[str, InferenceBatcher] = {}
+_batchers_lock = threading.Lock()
+
+def get_inference_batcher(model_name: str) -> InferenceBatcher:
+    """Get the process-wide batcher for a model registered in the model registry"""
+    with _batchers_lock:
+        if model_name not in _batchers:
+            _batchers[model_name] = InferenceBatcher(
+                model_name,
+                lambda: get_model_registry().get(model_name),
+                max_batch_size=settings.NLP_BATCH_MAX_SIZE,
+                max_wait_ms=settings.NLP_BATCH_MAX_WAIT_MS,
+                bucket_size=settings.NLP_BATCH_BUCKET_SIZE
+            )
+        return _batchers[model_name]
+
+def get_inference_batcher_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: batcher.get_stats() for name, batcher in _batchers.items()}
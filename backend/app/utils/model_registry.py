@@ -0,0 +1,179 @@
+"""
+Process-wide registry of lazily loaded NLP models.
+Each model is loaded once, on first use, and shared by every caller; models idle
+for longer than NLP_MODEL_IDLE_TIMEOUT, or least recently used ones under memory
+pressure, are unloaded and transparently reloaded on next use.
+"""
+
+import gc
+import os
+import time
+import logging
+import threading
+from typing import Dict, Any, Callable, Optional
+
+from config import settings
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger("nlp.model_registry")
+
+def current_rss_mb() -> Optional[float]:
+    """Resident memory of this process in MB, if it can be determined"""
+    try:
+        if PSUTIL_AVAILABLE:
+            return psutil.Process().memory_info().rss / (1024 * 1024)
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except Exception:
+        return None
+
+class _ModelSlot:
+    """A registered model: its loader, the loaded instance and usage bookkeeping"""
+
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self.loader = loader
+        self.model: Any = None
+        self.loaded = False
+        self.failed = False
+        self.last_used = 0.0
+        self.load_count = 0
+        self.load_seconds = 0.0
+        self.lock = threading.Lock()
+
+class ModelRegistry:
+    """Loads models on first use, shares them process-wide and unloads idle ones"""
+
+    def __init__(self, idle_timeout: float = 0.0, memory_limit_mb: float = 0.0):
+        self.idle_timeout = idle_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._slots: Dict[str, _ModelSlot] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        """Register a loader; nothing is loaded until the model is first requested"""
+        with self._lock:
+            if name not in self._slots:
+                self._slots[name] = _ModelSlot(name, loader)
+
+    def get(self, name: str) -> Any:
+        """Get a model, loading it on first use; None if it is unavailable"""
+        slot = self._slots.get(name)
+        if slot is None:
+            raise KeyError(f"Unknown model: {name}")
+
+        with slot.lock:
+            if not slot.loaded:
+                self._load(slot)
+            model = slot.model
+            slot.last_used = time.monotonic()
+
+        self._evict(keep=name)
+        return model
+
+    def is_unavailable(self, name: str) -> bool:
+        """Whether a model already failed to load (checked without loading it)"""
+        slot = self._slots.get(name)
+        return slot is None or slot.failed
+
+    def _load(self, slot: _ModelSlot):
+        started = time.monotonic()
+        try:
+            slot.model = slot.loader()
+            slot.failed = False
+            logger.info(f"✅ Loaded NLP model {slot.name} in {time.monotonic() - started:.1f}s")
+        except Exception as e:
+            # Failed loads are remembered so callers fall back instead of retrying on every call
+            slot.model = None
+            slot.failed = True
+            logger.warning(f"⚠️ NLP model {slot.name} unavailable: {e}")
+        slot.loaded = True
+        slot.load_count += 1
+        slot.load_seconds += time.monotonic() - started
+
+    def unload(self, name: str) -> bool:
+        """Release a loaded model; it is reloaded on next use"""
+        slot = self._slots.get(name)
+        if slot is None or not slot.loaded or slot.failed:
+            return False
+        with slot.lock:
+            slot.model = None
+            slot.loaded = False
+        logger.info(f"🧹 Unloaded NLP model {name}")
+        return True
+
+    def _evict(self, keep: str):
+        """Unload idle models, then least recently used ones while over the memory limit"""
+        now = time.monotonic()
+        loaded = [s for s in self._slots.values() if s.loaded and not s.failed and s.name != keep]
+        released = False
+
+        if self.idle_timeout > 0:
+            for slot in loaded:
+                if now - slot.last_used > self.idle_timeout:
+                    released |= self.unload(slot.name)
+
+        if self.memory_limit_mb > 0:
+            for slot in sorted(loaded, key=lambda s: s.last_used):
+                rss = current_rss_mb()
+                if rss is None or rss <= self.memory_limit_mb:
+                    break
+                if slot.loaded:
+                    logger.info(f"📉 Memory pressure ({rss:.0f} MB > {self.memory_limit_mb:.0f} MB)")
+                    released |= self.unload(slot.name)
+                    gc.collect()
+
+        if released:
+            gc.collect()
+            self._empty_device_cache()
+
+    @staticmethod
+    def _empty_device_cache():
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            pass
+
+    def unload_idle(self) -> None:
+        """Sweep idle models now (e.g. from a periodic task)"""
+        self._evict(keep="")
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "idle_timeout": self.idle_timeout,
+            "memory_limit_mb": self.memory_limit_mb,
+            "rss_mb": current_rss_mb(),
+            "models": {
+                name: {
+                    "loaded": slot.loaded and not slot.failed,
+                    "failed": slot.failed,
+                    "load_count": slot.load_count,
+                    "load_seconds": round(slot.load_seconds, 2),
+                    "idle_seconds": round(now - slot.last_used, 1) if slot.last_used else None
+                }
+                for name, slot in self._slots.items()
+            }
+        }
+
+_model_registry: Optional[ModelRegistry] = None
+_model_registry_lock = threading.Lock()
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry"""
+    global _model_registry
+    if _model_registry is None:
+        with _model_registry_lock:
+            if _model_registry is None:
+                _model_registry = ModelRegistry(
+                    idle_timeout=settings.NLP_MODEL_IDLE_TIMEOUT,
+                    memory_limit_mb=settings.NLP_MODEL_MEMORY_LIMIT_MB
+                )
+    return _model_registry
@@ -1,6 +1,5 @@
 import asyncio
 import openai
-import spacy
 from typing import Dict, Any, List, Optional, Tuple
 from transformers import (
     AutoTokenizer, AutoModelForSequenceClassification,
@@ -8,16 +7,49 @@ from transformers import (
 )
 import torch
 import re
+import threading
 from datetime import datetime
 import json
 from config import settings
+from .model_registry import get_model_registry
+from .inference_backend import build_pipeline
+from .inference_batcher import get_inference_batcher, ModelUnavailableError
+from .spacy_pipeline import get_entity_nlp
+
+# Loaders for every model the processor uses; each runs once, on first use,
+# on the inference backend selected by NLP_INFERENCE_BACKEND
+MODEL_LOADERS = {
+    # Sentiment analysis
+    "sentiment": lambda: build_pipeline(
+        "sentiment-analysis",
+        model="cardiffnlp/twitter-roberta-base-sentiment-latest"
+    ),
+    # Named Entity Recognition
+    "ner": lambda: build_pipeline(
+        "ner",
+        model="dbmdz/bert-large-cased-finetuned-conll03-english",
+        aggregation_strategy="simple"
+    ),
+    # Question Answering
+    "qa": lambda: build_pipeline(
+        "question-answering",
+        model="deepset/roberta-base-squad2"
+    ),
+    # Text Summarization
+    "summarization": lambda: build_pipeline(
+        "summarization",
+        model="facebook/bart-large-cnn"
+    ),
+}
 
 class ProductionNLPProcessor:
     """Advanced NLP processing for strategic analysis with production-grade models"""
     
     def __init__(self):
-        # Initialize models
-        self._initialize_models()
+        # Models are loaded lazily and shared process-wide through the model registry
+        self.models = get_model_registry()
+        for name, loader in MODEL_LOADERS.items():
+            self.models.register(name, loader)
         
         # OpenAI client
         self.openai_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
@@ -31,52 +63,26 @@ class ProductionNLPProcessor:
             'opportunity': ['opportunity', 'potential', 'untapped', 'emerging', 'new market']
         }
 
-    def _initialize_models(self):
-        """Initialize all NLP models with error handling"""
-        try:
-            # Sentiment analysis
-            self.sentiment_pipeline = pipeline(
-                "sentiment-analysis",
-                model="cardiffnlp/twitter-roberta-base-sentiment-latest",
-                device=0 if torch.cuda.is_available() else -1
-            )
-            
-            # Named Entity Recognition
-            self.ner_pipeline = pipeline(
-                "ner",
-                model="dbmdz/bert-large-cased-finetuned-conll03-english",
-                aggregation_strategy="simple",
-                device=0 if torch.cuda.is_available() else -1
-            )
-            
-            # Question Answering
-            self.qa_pipeline = pipeline(
-                "question-answering",
-                model="deepset/roberta-base-squad2",
-                device=0 if torch.cuda.is_available() else -1
-            )
-            
-            # Text Summarization
-            self.summarization_pipeline = pipeline(
-                "summarization",
-                model="facebook/bart-large-cnn",
-                device=0 if torch.cuda.is_available() else -1
-            )
-            
-            # SpaCy for linguistic analysis
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except OSError:
-                self.nlp = None
-                
-        except Exception as e:
-            # Fallback initialization
-            self.sentiment_pipeline = None
-            self.ner_pipeline = None
-            self.qa_pipeline = None
-            self.summarization_pipeline = None
-            self.nlp = None
-            print(f"Warning: NLP models initialization failed: {e}")
+    @property
+    def sentiment_pipeline(self):
+        return self.models.get("sentiment")
+
+    @property
+    def ner_pipeline(self):
+        return self.models.get("ner")
+
+    @property
+    def qa_pipeline(self):
+        return self.models.get("qa")
+
+    @property
+    def summarization_pipeline(self):
+        return self.models.get("summarization")
+
+    @property
+    def nlp(self):
+        # SpaCy for linguistic analysis: the shared NER-only pipeline
+        return get_entity_nlp()
 
     async def advanced_query_parsing(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Advanced query parsing with intent recognition and entity extraction"""
@@ -106,11 +112,11 @@ class ProductionNLPProcessor:
     async def _extract_entities(self, text: str) -> Dict[str, List[str]]:
         """Extract named entities using BERT-based NER"""
         try:
-            if not self.ner_pipeline:
+            if self.models.is_unavailable("ner"):
                 return self._fallback_entity_extraction(text)
             
-            # Use transformer model for NER
-            entities = self.ner_pipeline(text)
+            # Use transformer model for NER, batched with concurrent requests
+            entities = (await get_inference_batcher("ner").submit([text]))[0]
             
             # Organize entities by type
             entity_dict = {}
@@ -446,15 +452,15 @@ class ProductionNLPProcessor:
                 combined_text = combined_text[:8000] + "..."
             
             # Generate summary
-            if self.summarization_pipeline:
-                summary_result = self.summarization_pipeline(
-                    combined_text,
+            try:
+                summary_result = await get_inference_batcher("summarization").submit(
+                    [combined_text],
                     max_length=max_length,
                     min_length=30,
                     do_sample=False
                 )
                 summary = summary_result[0]['summary_text']
-            else:
+            except ModelUnavailableError:
                 # Fallback summarization
                 summary = await self._llm_summarization(combined_text, max_length)
             
@@ -600,18 +606,12 @@ class ProductionNLPProcessor:
             if not texts:
                 return {'sentiment': 'neutral', 'confidence': 0.0, 'scores': []}
             
-            if not self.sentiment_pipeline:
+            # Texts are micro-batched with concurrent requests from other analyses
+            try:
+                all_scores = await get_inference_batcher("sentiment").submit(texts)
+            except ModelUnavailableError:
                 return await self._llm_sentiment_analysis(texts)
             
-            # Process texts in batches
-            batch_size = 10
-            all_scores = []
-            
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i + batch_size]
-                batch_results = self.sentiment_pipeline(batch)
-                all_scores.extend(batch_results)
-            
             # Aggregate results
             sentiment_counts = {'positive': 0, 'negative': 0, 'neutral': 0}
             confidence_scores = []
@@ -701,7 +701,7 @@ class QueryParser:
     """Simple query parser for backward compatibility with existing code"""
     
     def __init__(self):
-        self.nlp_processor = ProductionNLPProcessor()
+        self.nlp_processor = get_nlp_processor()
     
     async def extract_keywords(self, query: str) -> List[str]:
         """Extract keywords from a query"""
@@ -737,3 +737,15 @@ class QueryParser:
                 'search_variations': [query],
                 'parsed_timestamp': datetime.utcnow().isoformat()
             }
+
+_nlp_processor: Optional[ProductionNLPProcessor] = None
+_nlp_processor_lock = threading.Lock()
+
+def get_nlp_processor() -> ProductionNLPProcessor:
+    """Get the NLP processor shared by every QueryParser"""
+    global _nlp_processor
+    if _nlp_processor is None:
+        with _nlp_processor_lock:
+            if _nlp_processor is None:
+                _nlp_processor = ProductionNLPProcessor()
+    return _nlp_processor
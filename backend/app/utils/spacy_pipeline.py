@@ -0,0 +1,103 @@
+"""
+Shared spaCy entity pipeline.
+Loads en_core_web_sm once with only the components entity recognition needs,
+parses texts in batches through nlp.pipe and caches the entities by text hash so
+the same snippet is never re-parsed across quality dimensions and layers.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import spacy
+
+from config import settings
+from .model_registry import get_model_registry
+
+logger = logging.getLogger("nlp.spacy_pipeline")
+
+# Components not needed for entities; ner has its own internal tok2vec in en_core_web_sm,
+# so the shared tok2vec (only listened to by tagger/parser) is disabled too
+DISABLED_COMPONENTS = ["tok2vec", "parser", "lemmatizer", "tagger", "attribute_ruler", "senter"]
+
+Entity = Tuple[str, str]  # (text, label)
+
+def load_entity_pipeline():
+    return spacy.load("en_core_web_sm", disable=DISABLED_COMPONENTS)
+
+get_model_registry().register("spacy_ner", load_entity_pipeline)
+
+def get_entity_nlp():
+    """Get the shared NER-only spaCy pipeline, or None if the model is not installed"""
+    return get_model_registry().get("spacy_ner")
+
+class EntityDocCache:
+    """LRU cache of spaCy entities keyed by text hash, filled in nlp.pipe batches"""
+
+    def __init__(self, max_entries: int = 4096, batch_size: int = 64, n_process: int = 1):
+        self.max_entries = max(1, max_entries)
+        self.batch_size = max(1, batch_size)
+        self.n_process = max(1, n_process)
+        self._entries: "OrderedDict[str, List[Entity]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "parsed": 0, "batches": 0}
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=16).hexdigest()
+
+    def entities(self, texts: List[str]) -> Optional[List[List[Entity]]]:
+        """Entities for each text, parsing only uncached texts in one batch; None without spaCy"""
+        keys = [self._key(text) for text in texts]
+        results: Dict[str, List[Entity]] = {}
+        missing: Dict[str, str] = {}
+
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    results[key] = self._entries[key]
+                    self.stats["hits"] += 1
+                else:
+                    missing[key] = text
+
+        if missing:
+            nlp = get_entity_nlp()
+            if nlp is None:
+                return None
+
+            docs = nlp.pipe(list(missing.values()), batch_size=self.batch_size, n_process=self.n_process)
+            parsed = {key: [(ent.text, ent.label_) for ent in doc.ents] for key, doc in zip(missing, docs)}
+            results.update(parsed)
+
+            with self._lock:
+                self.stats["parsed"] += len(parsed)
+                self.stats["batches"] += 1
+                for key, entities in parsed.items():
+                    self._entries[key] = entities
+                    self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return [results[key] for key in keys]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self._entries)}
+
+_entity_cache: Optional[EntityDocCache] = None
+_entity_cache_lock = threading.Lock()
+
+def get_entity_cache() -> EntityDocCache:
+    """Get the process-wide entity cache"""
+    global _entity_cache
+    if _entity_cache is None:
+        with _entity_cache_lock:
+            if _entity_cache is None:
+                _entity_cache = EntityDocCache(
+                    max_entries=settings.SPACY_DOC_CACHE_SIZE,
+                    batch_size=settings.SPACY_BATCH_SIZE,
+                    n_process=settings.SPACY_N_PROCESS
+                )
+    return _entity_cache
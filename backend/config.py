@@ -22,6 +22,100 @@ class Settings(BaseSettings):
     NEO4J_USER: str = os.environ.get('NEO4J_USER', 'neo4j')
     NEO4J_PASSWORD: str = os.environ.get('NEO4J_PASSWORD', 'password')
 
+    # Workflow Execution Configuration
+    LAYER_ANALYSIS_CONCURRENCY: int = int(os.environ.get("LAYER_ANALYSIS_CONCURRENCY", "16"))
+
+    # LLM Provider Rate Limits (requests/min, tokens/min, max in-flight; 0 disables a bucket)
+    OPENAI_RPM: int = int(os.environ.get("OPENAI_RPM", "500"))
+    OPENAI_TPM: int = int(os.environ.get("OPENAI_TPM", "200000"))
+    OPENAI_MAX_IN_FLIGHT: int = int(os.environ.get("OPENAI_MAX_IN_FLIGHT", "8"))
+    ANTHROPIC_RPM: int = int(os.environ.get("ANTHROPIC_RPM", "50"))
+    ANTHROPIC_TPM: int = int(os.environ.get("ANTHROPIC_TPM", "40000"))
+    ANTHROPIC_MAX_IN_FLIGHT: int = int(os.environ.get("ANTHROPIC_MAX_IN_FLIGHT", "4"))
+    PERPLEXITY_RPM: int = int(os.environ.get("PERPLEXITY_RPM", "50"))
+    PERPLEXITY_TPM: int = int(os.environ.get("PERPLEXITY_TPM", "0"))
+    PERPLEXITY_MAX_IN_FLIGHT: int = int(os.environ.get("PERPLEXITY_MAX_IN_FLIGHT", "4"))
+    GOOGLE_GEMINI_RPM: int = int(os.environ.get("GOOGLE_GEMINI_RPM", "60"))
+    GOOGLE_GEMINI_TPM: int = int(os.environ.get("GOOGLE_GEMINI_TPM", "1000000"))
+    GOOGLE_GEMINI_MAX_IN_FLIGHT: int = int(os.environ.get("GOOGLE_GEMINI_MAX_IN_FLIGHT", "8"))
+
+    # LLM Provider Routing ("adaptive" ranks providers by observed latency, "static" uses the fixed chain)
+    LLM_ROUTING_MODE: str = os.environ.get("LLM_ROUTING_MODE", "adaptive")
+    LLM_ROUTING_COST_CEILING: float = float(os.environ.get("LLM_ROUTING_COST_CEILING", "0"))
+    LLM_ROUTING_WINDOW: int = int(os.environ.get("LLM_ROUTING_WINDOW", "50"))
+    LLM_ROUTING_DEFAULT_LATENCY: float = float(os.environ.get("LLM_ROUTING_DEFAULT_LATENCY", "10"))
+    LLM_ROUTING_TYPICAL_CALL_SIZE: int = int(os.environ.get("LLM_ROUTING_TYPICAL_CALL_SIZE", "2000"))
+
+    # Hedged LLM Requests (fire the next provider once the current one exceeds its p95)
+    LLM_HEDGING_ENABLED: bool = os.environ.get("LLM_HEDGING_ENABLED", "false").lower() == "true"
+    LLM_HEDGE_DEFAULT_DELAY: float = float(os.environ.get("LLM_HEDGE_DEFAULT_DELAY", "30"))
+    LLM_HEDGE_MIN_DELAY: float = float(os.environ.get("LLM_HEDGE_MIN_DELAY", "2"))
+    LLM_HEDGE_MAX_PARALLEL: int = int(os.environ.get("LLM_HEDGE_MAX_PARALLEL", "2"))
+
+    # LLM Provider Circuit Breakers
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = int(os.environ.get("LLM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    LLM_CIRCUIT_RESET_TIMEOUT: float = float(os.environ.get("LLM_CIRCUIT_RESET_TIMEOUT", "60"))
+
+    # Layer Batch Prompting Configuration
+    LAYER_BATCH_MODE: bool = os.environ.get("LAYER_BATCH_MODE", "false").lower() == "true"
+    LAYER_BATCH_MAX_SIZE: int = int(os.environ.get("LAYER_BATCH_MAX_SIZE", "10"))
+    
+    # Shared HTTP Client Pool Configuration
+    HTTP_HTTP2_ENABLED: bool = os.environ.get("HTTP_HTTP2_ENABLED", "true").lower() == "true"
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = int(os.environ.get("HTTP_MAX_CONNECTIONS_PER_HOST", "20"))
+    HTTP_MAX_KEEPALIVE_PER_HOST: int = int(os.environ.get("HTTP_MAX_KEEPALIVE_PER_HOST", "10"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.environ.get("HTTP_KEEPALIVE_EXPIRY", "60"))
+    HTTP_DEFAULT_TIMEOUT: float = float(os.environ.get("HTTP_DEFAULT_TIMEOUT", "30"))
+    
+    # Search Result Cache Configuration (freshness windows in seconds)
+    SEARCH_CACHE_ENABLED: bool = os.environ.get("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_PATH: str = os.environ.get("SEARCH_CACHE_PATH", ".cache/search_results.sqlite3")
+    SEARCH_CACHE_TAVILY_FRESHNESS: float = float(os.environ.get("SEARCH_CACHE_TAVILY_FRESHNESS", "86400"))
+    SEARCH_CACHE_PERPLEXITY_FRESHNESS: float = float(os.environ.get("SEARCH_CACHE_PERPLEXITY_FRESHNESS", "259200"))
+    SEARCH_CACHE_NEWSAPI_FRESHNESS: float = float(os.environ.get("SEARCH_CACHE_NEWSAPI_FRESHNESS", "21600"))
+    SEARCH_CACHE_STALE_WINDOW: float = float(os.environ.get("SEARCH_CACHE_STALE_WINDOW", "604800"))
+    
+    # Blocking I/O Executor Configuration (pytrends, NewsAPI; timeouts in seconds)
+    BLOCKING_IO_MAX_WORKERS: int = int(os.environ.get("BLOCKING_IO_MAX_WORKERS", "8"))
+    BLOCKING_IO_DEFAULT_TIMEOUT: float = float(os.environ.get("BLOCKING_IO_DEFAULT_TIMEOUT", "30"))
+    PYTRENDS_TIMEOUT: float = float(os.environ.get("PYTRENDS_TIMEOUT", "45"))
+    NEWSAPI_TIMEOUT: float = float(os.environ.get("NEWSAPI_TIMEOUT", "20"))
+    
+    # NLP Model Registry Configuration (0 disables idle/memory-pressure unloading)
+    NLP_MODEL_IDLE_TIMEOUT: float = float(os.environ.get("NLP_MODEL_IDLE_TIMEOUT", "1800"))
+    NLP_MODEL_MEMORY_LIMIT_MB: float = float(os.environ.get("NLP_MODEL_MEMORY_LIMIT_MB", "0"))
+    
+    # NLP Inference Backend Configuration (torch | torch_dynamic_int8 | onnx_int8)
+    NLP_INFERENCE_BACKEND: str = os.environ.get("NLP_INFERENCE_BACKEND", "torch")
+    NLP_ONNX_CACHE_DIR: str = os.environ.get("NLP_ONNX_CACHE_DIR", ".cache/onnx_models")
+    # ONNX int8 kernel target (auto | avx512_vnni | avx512 | avx2 | arm64)
+    NLP_ONNX_QUANTIZATION_TARGET: str = os.environ.get("NLP_ONNX_QUANTIZATION_TARGET", "auto")
+    
+    # NLP Micro-Batching Configuration
+    NLP_BATCH_MAX_SIZE: int = int(os.environ.get("NLP_BATCH_MAX_SIZE", "32"))
+    NLP_BATCH_MAX_WAIT_MS: float = float(os.environ.get("NLP_BATCH_MAX_WAIT_MS", "5"))
+    NLP_BATCH_BUCKET_SIZE: int = int(os.environ.get("NLP_BATCH_BUCKET_SIZE", "8"))
+    
+    # Data Quality Assessment Configuration (inline | process; 0 workers = one per CPU)
+    DATA_QUALITY_EXECUTION_MODE: str = os.environ.get("DATA_QUALITY_EXECUTION_MODE", "inline")
+    DATA_QUALITY_PROCESS_WORKERS: int = int(os.environ.get("DATA_QUALITY_PROCESS_WORKERS", "0"))
+    
+    # spaCy Entity Pipeline Configuration
+    SPACY_BATCH_SIZE: int = int(os.environ.get("SPACY_BATCH_SIZE", "64"))
+    SPACY_N_PROCESS: int = int(os.environ.get("SPACY_N_PROCESS", "1"))
+    SPACY_DOC_CACHE_SIZE: int = int(os.environ.get("SPACY_DOC_CACHE_SIZE", "4096"))
+    
+    # Workflow Checkpoint Configuration
+    WORKFLOW_CHECKPOINT_ENABLED: bool = os.environ.get("WORKFLOW_CHECKPOINT_ENABLED", "true").lower() == "true"
+    WORKFLOW_CHECKPOINT_PATH: str = os.environ.get("WORKFLOW_CHECKPOINT_PATH", ".cache/workflow_checkpoints.sqlite3")
+    WORKFLOW_CHECKPOINT_MAX_AGE: float = float(os.environ.get("WORKFLOW_CHECKPOINT_MAX_AGE", "604800"))
+    
+    # LLM Response Cache Configuration
+    LLM_CACHE_ENABLED: bool = os.environ.get("LLM_CACHE_ENABLED", "false").lower() == "true"
+    LLM_CACHE_PATH: str = os.environ.get("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3")
+    LLM_CACHE_MAX_ENTRIES: int = int(os.environ.get("LLM_CACHE_MAX_ENTRIES", "1024"))
+    LLM_CACHE_TTL_SECONDS: float = float(os.environ.get("LLM_CACHE_TTL_SECONDS", "86400"))
+
     class Config:
         env_file = ".env"
 
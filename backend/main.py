@@ -1,13 +1,22 @@
 import uvicorn
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+import sys
 import uuid
+import asyncio
 from datetime import datetime
 from typing import Dict
 
 from app.core.comprehensive_langgraph_workflow_fixed import ContextAwareLangGraphWorkflow
 from app.core.simple_state import State as ValidatusState
 from app.core.models import AnalysisRequest, AnalysisResponse
+from app.core.layer_index import get_layer_index
+from app.core.http_client import get_http_client_pool, close_http_client_pool
+from app.core.search_coalescer import get_search_coalescer
+from app.core.search_cache import get_search_cache
+from app.core.blocking_executor import get_blocking_executor_stats, shutdown_blocking_executor
+from app.core.workflow_checkpoint import get_checkpoint_store
+from config import settings
 
 app = FastAPI(title="Validatus Platform API", version="1.0.0")
 
@@ -19,6 +28,49 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Hosts whose pooled HTTP clients are opened at startup
+POOLED_HTTP_HOSTS = ["https://api.tavily.com", "https://api.perplexity.ai"]
+
+# Background sweep that unloads NLP models idle for longer than NLP_MODEL_IDLE_TIMEOUT
+model_sweep_task = None
+
+@app.on_event("startup")
+async def open_http_client_pool():
+    """Open the shared keep-alive HTTP clients used by every research agent."""
+    pool = get_http_client_pool()
+    for host in POOLED_HTTP_HOSTS:
+        pool.client(host)
+
+@app.on_event("startup")
+async def start_model_sweep():
+    """Periodically release idle NLP models, even when no further NLP calls arrive."""
+    global model_sweep_task
+    if settings.NLP_MODEL_IDLE_TIMEOUT > 0:
+        model_sweep_task = asyncio.create_task(sweep_idle_models(max(30.0, settings.NLP_MODEL_IDLE_TIMEOUT / 4)))
+
+async def sweep_idle_models(interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        # Nothing is loaded until the NLP stack has been imported (importing it pulls in torch)
+        if "app.utils.model_registry" not in sys.modules:
+            continue
+        from app.utils.model_registry import get_model_registry
+        try:
+            await asyncio.to_thread(get_model_registry().unload_idle)
+        except Exception as e:
+            print(f"Idle model sweep failed: {str(e)}")
+
+@app.on_event("shutdown")
+async def shutdown_http_client_pool():
+    """Close the shared HTTP clients and worker pools."""
+    if model_sweep_task is not None:
+        model_sweep_task.cancel()
+    await close_http_client_pool()
+    shutdown_blocking_executor()
+    if "app.utils.data_quality" in sys.modules:
+        from app.utils.data_quality import shutdown_quality_process_pool
+        shutdown_quality_process_pool()
+
 # API endpoints are defined directly in this file
 
 # In a production environment, this would be a persistent store like Redis or a database.
@@ -106,11 +158,40 @@ async def get_analysis_results(analysis_id: str):
     
     return state.get("dashboard_data", {})
 
+@app.get("/api/v1/framework/layers")
+async def get_framework_layers():
+    """Get the segment → factor → layer hierarchy with per-layer routing information."""
+    return get_layer_index().to_dict()
+
 @app.get("/health")
 @app.get("/api/v1/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    return {
+        "status": "healthy",
+        "timestamp": datetime.utcnow().isoformat(),
+        "http_pool": get_http_client_pool().get_stats(),
+        "search_coalescing": get_search_coalescer().get_stats(),
+        "search_cache": get_search_cache().get_stats() if get_search_cache() else {"enabled": False},
+        "blocking_io": get_blocking_executor_stats(),
+        "workflow_checkpoints": get_checkpoint_store().get_stats() if get_checkpoint_store() else {"enabled": False},
+        **_nlp_stats()
+    }
+
+def _nlp_stats() -> Dict:
+    """NLP model and batching stats, only if the NLP stack has been imported (importing it pulls in torch)."""
+    if "app.utils.inference_batcher" not in sys.modules:
+        return {}
+    from app.utils.model_registry import get_model_registry
+    from app.utils.inference_batcher import get_inference_batcher_stats
+    stats = {
+        "nlp_models": get_model_registry().get_stats(),
+        "nlp_batching": get_inference_batcher_stats()
+    }
+    if "app.utils.spacy_pipeline" in sys.modules:
+        from app.utils.spacy_pipeline import get_entity_cache
+        stats["spacy_entities"] = get_entity_cache().get_stats()
+    return stats
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
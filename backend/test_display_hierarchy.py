@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test Script: Display Hierarchy Restructuring
+Pins the layer → display-factor assignment and the segment/factor scores built from
+the committed pergola analysis report, so the grouping stays deterministic
+"""
+
+import json
+import os
+
+from app.core.display_hierarchy import DISPLAY_SEGMENTS, layer_display_factors, build_hierarchical_analysis
+
+PERGOLA_REPORT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "full_pergola_analysis_report_20250829_124837.json")
+
+EXPECTED_PLACEMENTS = {
+    "need_perception": (("consumer", "consumer_demand_need"), ("consumer", "consumer_perception_sentiment")),
+    "repeat_purchase": (("consumer", "consumer_demand_need"), ("consumer", "consumer_loyalty_retention"),
+                        ("experience", "post_purchase_loyalty")),
+    "switching_cost": (("consumer", "consumer_loyalty_retention"), ("market", "market_competition_barriers")),
+    "ad_reach": (("product", "product_brand_perception"),),
+    "esg_alignment": (("brand", "brand_longevity_outlook"),),
+    "unknown_metric": (),
+}
+
+# factor_key: (layer count, overall score) for the pergola report
+EXPECTED_FACTORS = {
+    "consumer_demand_need": (42, 8.49), "consumer_behavior_habits": (36, 8.74),
+    "consumer_loyalty_retention": (15, 8.69), "consumer_perception_sentiment": (24, 8.39),
+    "consumer_adoption_engagement": (23, 8.53),
+    "market_trends": (12, 8.26), "market_competition_barriers": (7, 8.21), "market_demand_adoption": (20, 8.67),
+    "market_growth_expansion": (7, 8.43), "market_stability_risk": (7, 8.5),
+    "product_market_readiness": (8, 8.68), "product_competitive_disruption": (4, 9.0),
+    "product_dynamic_disruption": (27, 8.91), "product_business_resilience": (3, 8.73),
+    "product_hype_cycle": (5, 8.88), "product_quality_assurance": (13, 8.99), "product_differentiation": (4, 9.0),
+    "product_brand_perception": (19, 8.83), "product_experience_design": (5, 8.4),
+    "product_innovation_lifecycle": (7, 8.93),
+    "brand_positioning_strategy": (6, 9.03), "brand_equity_profile": (16, 8.55), "brand_virality_impact": (6, 8.4),
+    "brand_monetization_model": (4, 8.75), "brand_longevity_outlook": (8, 8.93),
+    "user_engagement_metrics": (3, 9.0), "satisfaction_feedback": (10, 7.74),
+    "interaction_design_elements": (3, 9.0), "post_purchase_loyalty": (12, 8.7), "experience_evolution": (12, 8.37),
+}
+
+EXPECTED_SEGMENTS = {"consumer": 8.57, "market": 8.41, "product": 8.84, "brand": 8.73, "experience": 8.56}
+
+def test_layer_display_factors():
+    """Layers resolve to every matching display factor, in display order"""
+    for layer_name, expected in EXPECTED_PLACEMENTS.items():
+        assert layer_display_factors(layer_name) == expected, layer_name
+
+def test_build_hierarchical_analysis():
+    """The pergola report groups into the pinned factor and segment scores"""
+    with open(PERGOLA_REPORT, "r", encoding="utf-8") as f:
+        layer_scores = json.load(f)["analysis_results"]["detailed_analysis"]["layer_scores"]
+
+    hierarchical = build_hierarchical_analysis(layer_scores)
+    assert hierarchical["layer_scores"] is layer_scores
+    assert list(hierarchical["segments"]) == list(DISPLAY_SEGMENTS)
+
+    factors = {
+        factor_key: (len(factor_data["layers"]), factor_data["overall_score"])
+        for segment_data in hierarchical["segments"].values()
+        for factor_key, factor_data in segment_data["factors"].items()
+    }
+    assert factors == EXPECTED_FACTORS
+    assert {key: segment["overall_score"] for key, segment in hierarchical["segments"].items()} == EXPECTED_SEGMENTS
+
+    for segment_data in hierarchical["segments"].values():
+        for factor_data in segment_data["factors"].values():
+            for layer_name, layer_data in factor_data["layers"].items():
+                assert layer_data is layer_scores[layer_name]
+
+if __name__ == "__main__":
+    test_layer_display_factors()
+    test_build_hierarchical_analysis()
+    print("✅ Display hierarchy matches the pinned assignment")
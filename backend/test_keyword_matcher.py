@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test Script: Single-Pass Keyword Matching
+Checks that KeywordMatcher counts every keyword exactly as the per-keyword
+re.findall it replaced, on the PESTLE and sentiment keyword sets
+"""
+
+import re
+
+from app.scoring.frameworks.keyword_matcher import KeywordMatcher
+from app.scoring.frameworks.pestle import PESTLEAnalysisFramework
+from app.scoring.frameworks.sentiment import SentimentAnalysisFramework
+
+SAMPLE_TEXTS = [
+    "Government policy and new regulation on AI automation will reshape the economy; tax subsidy programs help.",
+    "The high-quality, best-in-class software is user-friendly and intuitive, but expensive and overpriced for some.",
+    "Interest rate changes, inflation and unemployment affect the market. Trade and currency risks remain high.",
+    "Climate, carbon and renewable energy: sustainability is the green agenda. Pollution law and compliance follow.",
+    "Not bad, but slow and buggy: a frustrating problem. I regret it, yet I still recommend the seamless, smooth UI.",
+    "Social media trends, lifestyle values and education shape demographics, culture and health research.",
+    "The new market entrants target the new segment; a new market-leading brand appears in every new market.",
+]
+
+def _findall_counts(keywords, text):
+    """Per-keyword counts with the pattern the scoring frameworks used before the single-pass matcher"""
+    counts = {}
+    for keyword in keywords:
+        count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE))
+        if count:
+            counts[keyword.lower()] = count
+    return counts
+
+def _assert_matches_findall(keywords):
+    matcher = KeywordMatcher(keywords)
+    for text in SAMPLE_TEXTS:
+        assert matcher.count(text) == _findall_counts(keywords, text), text
+
+def test_pestle_keywords_match_findall():
+    """Every PESTLE keyword is counted as re.findall counts it"""
+    framework = PESTLEAnalysisFramework()
+    _assert_matches_findall(list(framework.keyword_categories))
+
+def test_sentiment_keywords_match_findall():
+    """Every weighted sentiment keyword is counted as re.findall counts it"""
+    framework = SentimentAnalysisFramework()
+    _assert_matches_findall([*framework.positive_keywords, *framework.negative_keywords])
+
+def test_prefix_keywords_match_findall():
+    """A keyword that is a prefix of another ("new" / "new market") is still counted"""
+    keywords = ["new", "new market", "market", "new market-leading", "segment"]
+    _assert_matches_findall(keywords)
+    counts = KeywordMatcher(keywords).count(SAMPLE_TEXTS[-1])
+    assert counts["new"] == 4
+    assert counts["new market"] == 3
+    assert counts["market"] == 3
+
+if __name__ == "__main__":
+    test_pestle_keywords_match_findall()
+    test_sentiment_keywords_match_findall()
+    test_prefix_keywords_match_findall()
+    print("✅ KeywordMatcher counts match per-keyword re.findall")
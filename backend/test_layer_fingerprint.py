@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test Script: Layer Input Fingerprints
+Checks that a layer whose inputs changed is re-analyzed together with its
+provides_context_for / dependency closure and every layer reading its context summary,
+and that any additional_context edit re-analyzes every layer
+"""
+
+from types import SimpleNamespace
+
+from app.core.layer_fingerprint import LayerFingerprinter
+
+def _context(segment, factor, dependencies=(), provides_context_for=()):
+    return SimpleNamespace(segment=segment, factor=factor, dependencies=list(dependencies),
+                           provides_context_for=list(provides_context_for), persona=f"{segment} analyst")
+
+LAYER_CONTEXTS = {
+    "pricing_power": _context("MARKET", "market_demand", provides_context_for=["purchase_intent"]),
+    "purchase_intent": _context("CONSUMER", "consumer_demand"),
+    "repeat_purchase": _context("CONSUMER", "consumer_loyalty", dependencies=["purchase_intent"]),
+    "usage_frequency": _context("CONSUMER", "consumer_behavior"),
+    "engagement_depth": _context("EXPERIENCE", "user_engagement"),
+    "brand_heritage": _context("BRAND", "brand_positioning"),
+}
+
+# Layers whose context summaries each prompt reads (same-segment "Segment Context")
+CONTEXT_SOURCES = {
+    layer: {other for other, other_ctx in LAYER_CONTEXTS.items() if other_ctx.segment == ctx.segment}
+    for layer, ctx in LAYER_CONTEXTS.items()
+}
+
+ADDITIONAL_CONTEXT = {"pricing_model": "subscription", "age_group": "25-40", "region": "EU"}
+
+IDEA = "Smart pergola with app-controlled louvres"
+AUDIENCE = "Homeowners"
+
+def test_rerun_layer_invalidates_summary_readers():
+    """Re-running one layer also re-analyzes same-segment layers that do not depend on it"""
+    fingerprinter = LayerFingerprinter(LAYER_CONTEXTS, CONTEXT_SOURCES)
+    current = fingerprinter.fingerprints(IDEA, AUDIENCE, ADDITIONAL_CONTEXT)
+    previous = {**current, "purchase_intent": None}
+
+    assert fingerprinter.stale_layers(current, current) == set()
+    # usage_frequency has no dependency on purchase_intent but reads its summary as segment context
+    assert fingerprinter.stale_layers(previous, current) == {"purchase_intent", "repeat_purchase", "usage_frequency"}
+
+def test_with_dependents():
+    """Downstream closure follows provides_context_for, reversed dependencies and summary readers"""
+    fingerprinter = LayerFingerprinter(LAYER_CONTEXTS)
+    assert fingerprinter.with_dependents(["purchase_intent"]) == {"purchase_intent", "repeat_purchase"}
+    assert fingerprinter.with_dependents(["usage_frequency", "unknown_layer"]) == {"usage_frequency"}
+
+    fingerprinter = LayerFingerprinter(LAYER_CONTEXTS, CONTEXT_SOURCES)
+    assert fingerprinter.with_dependents(["pricing_power"]) == {
+        "pricing_power", "purchase_intent", "repeat_purchase", "usage_frequency"
+    }
+    assert fingerprinter.with_dependents(["brand_heritage"]) == {"brand_heritage"}
+
+def test_context_edit_invalidates_every_layer():
+    """No prompt reads a particular additional_context key, so any edit re-analyzes everything"""
+    fingerprinter = LayerFingerprinter(LAYER_CONTEXTS, CONTEXT_SOURCES)
+    previous = fingerprinter.fingerprints(IDEA, AUDIENCE, ADDITIONAL_CONTEXT)
+
+    assert fingerprinter.fingerprints(IDEA, AUDIENCE, ADDITIONAL_CONTEXT) == previous
+    for key, value in (("pricing_model", "one-off"), ("age_group", "40-60")):
+        current = fingerprinter.fingerprints(IDEA, AUDIENCE, {**ADDITIONAL_CONTEXT, key: value})
+        assert fingerprinter.stale_layers(previous, current) == set(LAYER_CONTEXTS)
+
+if __name__ == "__main__":
+    test_rerun_layer_invalidates_summary_readers()
+    test_with_dependents()
+    test_context_edit_invalidates_every_layer()
+    print("✅ Layer fingerprints invalidate changed layers, their dependents and summary readers")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test Script: Quantized NLP Backend Parity
+Compares the quantized inference backends against full-precision PyTorch on the
+sentiment, NER and summarization pipelines, and reports the CPU speedup
+Usage: python test_nlp_backend_parity.py [torch_dynamic_int8|onnx_int8]
+Under pytest it is marked slow and skipped unless NLP_PARITY_TESTS=1 (it downloads
+and runs the full models)
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+SAMPLE_TEXTS = [
+    "The new subscription tier has been a huge hit with our enterprise customers.",
+    "Shipping delays and poor support made this the worst purchase I have made this year.",
+    "The product works as described. Delivery took about a week.",
+    "Apple and Samsung continue to dominate the premium smartphone market in Europe.",
+    "Customers love the design, but many complain that the price is too high for what you get.",
+    "Tesla opened a new factory in Berlin, hiring thousands of workers from Germany and Poland.",
+    "Revenue grew 40% year over year, driven by strong demand in North America.",
+    "I would not recommend this service to anyone; cancellations are nearly impossible.",
+]
+
+SUMMARY_TEXT = " ".join(SAMPLE_TEXTS * 3)
+
+# Minimum agreement with the full-precision outputs
+MIN_SENTIMENT_AGREEMENT = 0.85
+MAX_SENTIMENT_SCORE_DELTA = 0.15
+MIN_ENTITY_OVERLAP = 0.8
+MIN_SUMMARY_TOKEN_OVERLAP = 0.5
+
+def _timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+def _overlap(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a | b else 1.0
+
+@pytest.mark.slow
+@pytest.mark.skipif(os.environ.get("NLP_PARITY_TESTS") != "1",
+                    reason="downloads and runs the full NLP models; set NLP_PARITY_TESTS=1")
+def test_nlp_backend_parity(backend: str = "torch_dynamic_int8"):
+    """Test that a quantized backend matches full-precision outputs"""
+    from app.utils.inference_backend import build_pipeline, resolve_backend
+
+    backend = resolve_backend(backend)
+    print(f"🔍 TESTING NLP BACKEND PARITY: torch vs {backend}")
+    print("=" * 60)
+
+    results = {}
+
+    # Sentiment
+    reference = build_pipeline("sentiment-analysis", "cardiffnlp/twitter-roberta-base-sentiment-latest", backend="torch")
+    candidate = build_pipeline("sentiment-analysis", "cardiffnlp/twitter-roberta-base-sentiment-latest", backend=backend)
+    expected, reference_time = _timed(reference, SAMPLE_TEXTS)
+    actual, candidate_time = _timed(candidate, SAMPLE_TEXTS)
+
+    agreement = sum(e["label"] == a["label"] for e, a in zip(expected, actual)) / len(SAMPLE_TEXTS)
+    score_delta = max(abs(e["score"] - a["score"]) for e, a in zip(expected, actual))
+    results["sentiment"] = {
+        "label_agreement": agreement,
+        "max_score_delta": round(score_delta, 4),
+        "speedup": round(reference_time / candidate_time, 2) if candidate_time else None
+    }
+    print(f"📊 Sentiment: agreement {agreement:.0%}, max score delta {score_delta:.3f}, speedup {results['sentiment']['speedup']}x")
+
+    # Named entities
+    reference = build_pipeline("ner", "dbmdz/bert-large-cased-finetuned-conll03-english", backend="torch", aggregation_strategy="simple")
+    candidate = build_pipeline("ner", "dbmdz/bert-large-cased-finetuned-conll03-english", backend=backend, aggregation_strategy="simple")
+    expected, reference_time = _timed(reference, SAMPLE_TEXTS)
+    actual, candidate_time = _timed(candidate, SAMPLE_TEXTS)
+
+    to_set = lambda batch: {(i, e["entity_group"], e["word"]) for i, entities in enumerate(batch) for e in entities}
+    entity_overlap = _overlap(to_set(expected), to_set(actual))
+    results["ner"] = {
+        "entity_overlap": round(entity_overlap, 4),
+        "speedup": round(reference_time / candidate_time, 2) if candidate_time else None
+    }
+    print(f"📊 NER: entity overlap {entity_overlap:.0%}, speedup {results['ner']['speedup']}x")
+
+    # Summarization
+    reference = build_pipeline("summarization", "facebook/bart-large-cnn", backend="torch")
+    candidate = build_pipeline("summarization", "facebook/bart-large-cnn", backend=backend)
+    expected, reference_time = _timed(reference, SUMMARY_TEXT, max_length=80, min_length=30, do_sample=False)
+    actual, candidate_time = _timed(candidate, SUMMARY_TEXT, max_length=80, min_length=30, do_sample=False)
+
+    summary_overlap = _overlap(set(expected[0]["summary_text"].lower().split()),
+                               set(actual[0]["summary_text"].lower().split()))
+    results["summarization"] = {
+        "token_overlap": round(summary_overlap, 4),
+        "speedup": round(reference_time / candidate_time, 2) if candidate_time else None
+    }
+    print(f"📊 Summarization: token overlap {summary_overlap:.0%}, speedup {results['summarization']['speedup']}x")
+
+    assert agreement >= MIN_SENTIMENT_AGREEMENT, f"Sentiment label agreement {agreement:.0%} too low"
+    assert score_delta <= MAX_SENTIMENT_SCORE_DELTA, f"Sentiment score delta {score_delta:.3f} too high"
+    assert entity_overlap >= MIN_ENTITY_OVERLAP, f"NER entity overlap {entity_overlap:.0%} too low"
+    assert summary_overlap >= MIN_SUMMARY_TOKEN_OVERLAP, f"Summary token overlap {summary_overlap:.0%} too low"
+
+    print(f"✅ SUCCESS: {backend} matches full-precision outputs")
+    return results
+
+if __name__ == "__main__":
+    print("🚀 Starting NLP Backend Parity Test...")
+    backend = sys.argv[1] if len(sys.argv) > 1 else "torch_dynamic_int8"
+    results = test_nlp_backend_parity(backend)
+    print(f"\n🏁 Test completed!")
+    print(f"📊 Results: {results}")
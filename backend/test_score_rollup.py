@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test Script: Vectorized Score Rollup
+Pins factor and segment scores of ScoreRollupEngine for a fixed layer-score set
+against the per-factor / per-segment formulas of calculate_factor_score and
+calculate_segment_score, plus one what_if weighting override
+"""
+
+import math
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.core.layer_index import LayerHierarchyIndex
+from app.core.score_rollup import ScoreRollupEngine
+
+# A layer placed under two factors, a factor without scored layers and a zero-confidence factor
+STRUCTURE = {
+    "SEG_A": {"factors": {
+        "F1": ["l1", "l2", "l3"],
+        "F2": ["l3", "l4"],
+        "F3": ["l9"]
+    }},
+    "SEG_B": {"factors": {
+        "F4": ["l5", "l6"]
+    }}
+}
+
+LAYER_SCORES = {
+    "l1": SimpleNamespace(score=8.0, confidence=0.9),
+    "l2": SimpleNamespace(score=6.0, confidence=0.5),
+    "l3": SimpleNamespace(score=7.0, confidence=0.8),
+    "l4": SimpleNamespace(score=4.0, confidence=0.6),
+    "l5": SimpleNamespace(score=9.0, confidence=0.0),
+    "l6": SimpleNamespace(score=5.0, confidence=0.0),
+}
+
+def _baseline(items, method):
+    """(score, confidence) as calculate_factor_score / calculate_segment_score compute them"""
+    confidence = sum(item.confidence for item in items) / len(items)
+    if method == "weighted_average":
+        total_weight = sum(item.confidence for item in items)
+        if total_weight > 0:
+            return sum(item.score * item.confidence for item in items) / total_weight, confidence
+        return sum(item.score for item in items) / len(items), confidence
+    if method == "geometric_mean":
+        return math.prod(item.score for item in items) ** (1.0 / len(items)), confidence
+    return sum(item.score for item in items) / len(items), confidence
+
+def _engine():
+    return ScoreRollupEngine(LayerHierarchyIndex(STRUCTURE))
+
+def test_rollup_matches_baseline_formulas():
+    """Every factor and segment matches the sequential formulas for each rollup method"""
+    engine = _engine()
+    for method in ("weighted_average", "geometric_mean", "simple_average"):
+        rollup = engine.rollup(LAYER_SCORES, method=method)
+        factor_results = {}
+        for i, (segment, factor) in enumerate(engine.factor_keys):
+            layers = [LAYER_SCORES[layer] for layer in STRUCTURE[segment]["factors"][factor] if layer in LAYER_SCORES]
+            assert rollup.factors.counts[i] == len(layers)
+            if not layers:
+                continue
+            score, confidence = _baseline(layers, method)
+            assert rollup.factors.scores[i] == score, (method, factor)
+            assert rollup.factors.confidences[i] == confidence, (method, factor)
+            factor_results.setdefault(segment, []).append(
+                SimpleNamespace(score=round(score, 1), confidence=round(confidence, 2))
+            )
+
+        for i, segment in enumerate(engine.segment_names):
+            score, confidence = _baseline(factor_results[segment], "weighted_average")
+            assert math.isclose(rollup.segments.scores[i], score, rel_tol=0, abs_tol=1e-12), (method, segment)
+            assert math.isclose(rollup.segments.confidences[i], confidence, rel_tol=0, abs_tol=1e-12)
+
+def test_rollup_pinned_scores():
+    """Weighted-average factor and segment scores for the fixed layer set"""
+    rollup = _engine().rollup(LAYER_SCORES)
+    np.testing.assert_allclose(rollup.factors.scores, [15.8 / 2.2, 8.0 / 1.4, 0.0, 7.0])
+    np.testing.assert_allclose(rollup.factors.confidences, [2.2 / 3, 0.7, 0.0, 0.0])
+    assert rollup.factors.counts.tolist() == [3, 2, 0, 2]
+    np.testing.assert_allclose(rollup.segments.scores, [(7.2 * 0.73 + 5.7 * 0.7) / 1.43, 7.0])
+    np.testing.assert_allclose(rollup.segments.confidences, [0.715, 0.0])
+
+def test_what_if_weight_override():
+    """what_if replaces layer confidences with scenario weights"""
+    engine = _engine()
+    weights = np.ones(len(engine.layer_names))
+    weights[engine.layer_names.index("l2")] = 0.0
+
+    scenario = engine.what_if(LAYER_SCORES, weights)
+    np.testing.assert_allclose(scenario["factor_scores"][0, [0, 1, 3]], [7.5, 5.5, 7.0])
+    assert np.isnan(scenario["factor_scores"][0, 2])
+    # F1 weighs 2/3 (mean weight of its layers) against F2's 1
+    np.testing.assert_allclose(scenario["segment_scores"][0], [(2 / 3 * 7.5 + 5.5) / (5 / 3), 7.0])
+    np.testing.assert_allclose(scenario["overall_scores"], [6.65])
+
+    # Weights equal to the confidences reproduce the unrounded weighted-average factor scores
+    confidences = engine.layer_arrays(LAYER_SCORES)[1]
+    baseline = engine.what_if(LAYER_SCORES, confidences)
+    rollup = engine.rollup(LAYER_SCORES)
+    np.testing.assert_allclose(baseline["factor_scores"][0, [0, 1, 3]], rollup.factors.scores[[0, 1, 3]])
+
+if __name__ == "__main__":
+    test_rollup_matches_baseline_formulas()
+    test_rollup_pinned_scores()
+    test_what_if_weight_override()
+    print("✅ Score rollup matches the baseline factor and segment formulas")